@@ -1,31 +1,33 @@
 import streamlit as st
 import requests
 from bs4 import BeautifulSoup
-from keybert import KeyBERT
 import pandas as pd
 import time
 import re
-import matplotlib.pyplot as plt
-from wordcloud import WordCloud
 import numpy as np
-from collections import Counter
-import networkx as nx
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import schedule
-import threading
-from datetime import datetime, timedelta
-import plotly.express as px
-import plotly.graph_objects as go
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
-import io
+from datetime import datetime
 import os
+import sqlite3
+import threading
 import platform
-import glob
+from importlib import metadata
+import news_store
+import dataset_writer
+import body_store
+from retention import apply_retention
+from korean_font import resolve_font_path
+from filter_engine import ArticleFilter
+from keyword_table import KeywordTable
+import startup_profile
+from collection_worker import CollectionWorker
+
+# keybert(sentence-transformers), sklearn, networkx, plotly, smtplib 등 무거운 모듈과
+# scipy(keyword_graph, keyword_trends), pyarrow(data_loader), summarizer_bench, wordcloud_cache는
+# 실제로 쓰는 함수·탭 안에서 import (시작 시간 예산은 startup_profile.py로 측정)
+
+# 기사 프레임은 세션 간에 공유되므로 읽기 전용으로 다룸 (pandas 3부터는 기본 동작)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
 
 st.set_page_config(page_title="디지털 헬스케어 뉴스 요약", layout="wide")
 
@@ -39,24 +41,26 @@ try:
         st.write(f"운영체제: {platform.system()} {platform.release()}")
         st.write(f"Streamlit 버전: {st.__version__}")
         
-        # 주요 라이브러리 버전 체크
-        try:
-            import pandas as pd
-            st.write(f"Pandas 버전: {pd.__version__}")
-        except:
-            st.error("Pandas 라이브러리 오류")
-            
-        try:
-            import matplotlib
-            st.write(f"Matplotlib 버전: {matplotlib.__version__}")
-        except:
-            st.error("Matplotlib 라이브러리 오류")
-            
-        try:
-            from wordcloud import WordCloud
-            st.write("WordCloud: ✅ 정상")
-        except:
-            st.error("WordCloud 라이브러리 오류")
+        # 주요 라이브러리 버전 체크 (설치 메타데이터만 읽고 import하지 않음)
+        st.write(f"Pandas 버전: {pd.__version__}")
+        for package in ["matplotlib", "wordcloud", "keybert", "plotly"]:
+            try:
+                st.write(f"{package} 버전: {metadata.version(package)}")
+            except metadata.PackageNotFoundError:
+                st.error(f"{package} 라이브러리가 설치되어 있지 않습니다")
+        
+        # 시작 시간 측정 (새 인터프리터에서 최상위 import만 -X importtime으로 실행)
+        if st.button("⏱️ 시작 시간 측정"):
+            with st.spinner("import 시간 측정 중..."):
+                report = startup_profile.profile_startup()
+            if report['error']:
+                st.error(f"import 실패: {report['error']}")
+            message = f"최상위 import {report['total_ms']:.0f}ms (예산 {report['budget_ms']:.0f}ms)"
+            if startup_profile.over_budget(report):
+                st.error(f"❌ {message} - 예산 초과")
+            else:
+                st.success(f"✅ {message}")
+            st.dataframe(report['top_level'].head(15)[['module', 'self_ms', 'cumulative_ms']], hide_index=True)
 
 except Exception as e:
     st.error(f"앱 초기화 오류: {e}")
@@ -65,42 +69,120 @@ except Exception as e:
 # 캐시 클리어 버튼 (사이드바에 추가)
 with st.sidebar:
     st.subheader("🔧 시스템 관리")
-    if st.button("🔄 데이터 새로고침", help="캐시된 데이터를 새로고침합니다"):
-        st.cache_data.clear()
+    if st.button("🔄 데이터 새로고침", help="저장소에서 기사 데이터를 전부 다시 읽습니다"):
+        # 기사 데이터만 다시 읽음 (워드클라우드·모델 캐시는 유지)
+        st.session_state.force_reload = True
         st.success("✅ 데이터가 새로고침되었습니다!")
         st.rerun()
 
-# 한글 폰트 초기 설정
+# 한글 폰트 초기 설정 (프로세스당 한 번만 탐색, 네트워크 사용 안 함)
 try:
-    font_path = setup_korean_font()
+    font_path = resolve_font_path()
     if font_path:
         st.success(f"✅ 한글 폰트 설정 완료: {os.path.basename(font_path)}")
     else:
-        st.warning("⚠️ 한글 폰트 설정 실패 - 기본 폰트 사용")
+        st.warning("⚠️ 한글 폰트를 찾지 못해 기본 폰트 사용 (`python korean_font.py download`로 fonts/에 준비)")
 except Exception as e:
     st.error(f"❌ 폰트 설정 오류: {e}")
 
-# KeyBERT 모델 초기화 (안전한 방식)
-try:
-    kw_model = KeyBERT()
-    st.success("✅ KeyBERT 모델 로드 완료")
-except Exception as e:
-    st.error(f"❌ KeyBERT 모델 로드 실패: {e}")
-    kw_model = None
+# KeyBERT 모델 (처음 키워드를 추출할 때 한 번만 로드, 프로세스 내 공유)
+@st.cache_resource(show_spinner="KeyBERT 모델 로드 중...")
+def get_keyword_model():
+    try:
+        from keybert import KeyBERT
+        return KeyBERT()
+    except Exception as e:
+        print(f"KeyBERT 모델 로드 실패: {e}")
+        return None
+
+# KeyBERT 호출 잠금 (벤치마크 스레드와 자동 수집 스레드가 같은 모델을 공유하므로 한 번에 하나씩 호출)
+@st.cache_resource
+def get_keyword_model_lock():
+    return threading.Lock()
+
+# 기사 저장소 로더 (세션 간 공유, 파일이 바뀌었을 때만 새 행을 읽어 합침)
+@st.cache_resource
+def get_article_loader():
+    from data_loader import ArticleLoader
+    
+    return ArticleLoader()
 
-# 기존 CSV 파일 로드
-@st.cache_data
 def load_existing_data():
+    """(데이터 버전, 기사 프레임) - 버전은 이 프레임에 맞는 캐시 키로 함께 넘김"""
     try:
-        df = pd.read_csv('digital_healthcare_news.csv')
-        # 날짜 컬럼이 없거나 NaN인 경우 현재 날짜로 채우기
-        if 'date' not in df.columns:
-            df['date'] = datetime.now().strftime('%Y-%m-%d')
-        else:
-            df['date'] = df['date'].fillna(datetime.now().strftime('%Y-%m-%d'))
-        return df
-    except (FileNotFoundError, pd.errors.EmptyDataError):
-        return pd.DataFrame(columns=['title', 'link', 'summary', 'keywords', 'date'])
+        loader = get_article_loader()
+        if st.session_state.pop('force_reload', False):
+            loader.invalidate()
+        return loader.load_versioned()
+    except (FileNotFoundError, pd.errors.EmptyDataError, sqlite3.Error):
+        from data_loader import LOAD_COLUMNS, compact_frame
+        
+        return -1, compact_frame(pd.DataFrame(columns=LOAD_COLUMNS))
+
+# 정규화된 키워드 테이블 (수집 시 한 번 계산된 키워드 ID/한글 여부/길이, 세션 간 공유 - 읽기 전용)
+@st.cache_resource(max_entries=2)
+def load_keyword_table(data_version):
+    try:
+        return KeywordTable.from_store()
+    except sqlite3.Error:
+        return KeywordTable(
+            pd.DataFrame(columns=['id', 'term', 'is_hangul', 'length']),
+            pd.DataFrame(columns=['article_id', 'keyword_id'])
+        )
+
+# 현재 저장소 집계 (저장 시 증분 유지되는 테이블만 읽음 - 기사 수와 무관, 세션 간 공유 - 읽기 전용)
+@st.cache_resource(max_entries=2)
+def load_aggregates(data_version):
+    try:
+        return news_store.load_aggregates()
+    except sqlite3.Error:
+        return None
+
+def summary_statistics(df, keyword_table, data_version, full_df):
+    """평균 요약 길이와 총 키워드 수 - 전체 기사면 집계 테이블, 필터된 기사면 그 자리에서 계산
+
+    full_df는 data_version에 해당하는 전체 프레임 (집계 테이블과 같은 데이터인지 판단용)
+    """
+    aggregates = load_aggregates(data_version)
+    if aggregates is not None and df is full_df and len(df) == aggregates['articles']:
+        return aggregates['avg_summary_length'], aggregates['keyword_total']
+    return (df['summary_len'].mean() if len(df) else 0.0), keyword_table.total_count(df.index)
+
+# 필터 색인 (데이터 버전마다 한 번 생성: 요약 길이·날짜 정렬 순서 미리 계산)
+@st.cache_resource(max_entries=2)
+def get_article_filter(data_version, _df):
+    return ArticleFilter(_df)
+
+# 전체 기간 일별 롤업 (보관소로 옮겨진 기사 포함)
+@st.cache_data(max_entries=2)
+def load_rollups(data_version):
+    try:
+        return news_store.load_daily_rollups()
+    except sqlite3.Error:
+        return pd.DataFrame(columns=['date', 'article_count', 'avg_summary_length'])
+
+# 키워드 추세 행렬 (데이터 버전마다 한 번 생성: 전체 빈도 상위 후보 키워드 × 연속 일별 축)
+@st.cache_resource(max_entries=2)
+def load_keyword_trends(data_version):
+    from keyword_trends import KeywordTrends
+    
+    try:
+        return KeywordTrends.from_store()
+    except sqlite3.Error:
+        return KeywordTrends(pd.DataFrame(columns=['date', 'keyword', 'count']))
+
+# 키워드 동시출현 그래프 (세션 간 공유, 새 행만 증분 반영)
+@st.cache_resource
+def get_keyword_graph():
+    from keyword_graph import KeywordCooccurrence
+    
+    return KeywordCooccurrence()
+
+def sync_keyword_graph(df):
+    graph = get_keyword_graph()
+    if 'keywords' in df.columns:
+        graph.sync(df['keywords'])
+    return graph
 
 # 기사 검색
 def get_yna_article_links(keyword, pages=1):
@@ -121,13 +203,15 @@ def get_yna_article_links(keyword, pages=1):
         time.sleep(1)
     return articles
 
-# 기사 본문 추출
-def extract_yna_article_text(url):
+# 기사 본문 추출 (bodies 리스트를 주면 원문 HTML과 본문을 담아 둠 - 나중에 한 번에 저장)
+def extract_yna_article_text(url, bodies=None):
     try:
         res = requests.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=5)
         soup = BeautifulSoup(res.text, "html.parser")
         body_div = soup.find("div", class_="story-news article")
         text = body_div.get_text(separator=" ", strip=True) if body_div else ''
+        if bodies is not None:
+            bodies.append((url, res.text, text))
         return text
     except:
         return ''
@@ -157,6 +241,7 @@ def summarize_text(text, ratio=0.3):
 # 키워드 추출 (안전한 방식)
 def extract_keywords(text, top_n=5):
     try:
+        kw_model = get_keyword_model()
         if kw_model is None:
             # KeyBERT가 없을 경우 간단한 키워드 추출
             words = re.findall(r'\b[가-힣]{2,}\b', text)  # 한글 단어만 추출
@@ -164,7 +249,8 @@ def extract_keywords(text, top_n=5):
             word_freq = Counter(words)
             return [word for word, _ in word_freq.most_common(top_n)]
         
-        keywords = kw_model.extract_keywords(text, top_n=top_n, stop_words="english")
+        with get_keyword_model_lock():
+            keywords = kw_model.extract_keywords(text, top_n=top_n, stop_words="english")
         return [kw[0] for kw in keywords]
     except Exception as e:
         # 오류 발생 시 간단한 키워드 추출
@@ -176,6 +262,27 @@ def extract_keywords(text, top_n=5):
         except:
             return []
 
+# 기사 분석 스트림 (본문은 동시에 가져오고, 도착하는 순서대로 한 건씩 반환)
+def stream_article_analysis(articles, bodies=None, max_workers=4):
+    """기사마다 {'title', 'link', 'text_length', 'summary', 'keywords', 'error'} dict를 완료 순서대로 생성"""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(extract_yna_article_text, article["link"], bodies): article for article in articles}
+        for future in as_completed(futures):
+            article = futures[future]
+            result = {"title": article["title"], "link": article["link"], "text_length": 0,
+                      "summary": "", "keywords": [], "error": None}
+            try:
+                text = future.result()
+                # 요약·키워드 추출은 모델을 공유하므로 호출한 스레드에서 순서대로 실행
+                result["text_length"] = len(text)
+                result["summary"] = summarize_text(text) if text else ""
+                result["keywords"] = extract_keywords(text) if text else []
+            except Exception as e:
+                result["error"] = str(e)
+            yield result
+
 # TextRank 요약 (그래프 기반)
 def textrank_summarize(text, ratio=0.4):
     try:
@@ -188,6 +295,10 @@ def textrank_summarize(text, ratio=0.4):
         if len(sentences) < 2:
             return sentences[0] if sentences else text
         
+        import networkx as nx
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.metrics.pairwise import cosine_similarity
+        
         # TF-IDF 벡터화 (한글 처리 개선)
         vectorizer = TfidfVectorizer(
             stop_words=None,
@@ -291,135 +402,57 @@ def kobart_style_summarize(text, ratio=0.2):
     except:
         return text[:100] + '...' if len(text) > 100 else text
 
-# Windows 한글 폰트 강제 다운로드 및 설정
-def setup_korean_font():
-    """한글 폰트를 확실하게 설정하는 함수"""
-    try:
-        import matplotlib.font_manager as fm
-        
-        # Windows 시스템 폰트 경로들
-        windows_fonts = [
-            r"C:\Windows\Fonts\malgun.ttf",
-            r"C:\Windows\Fonts\gulim.ttc", 
-            r"C:\Windows\Fonts\batang.ttc",
-            r"C:\Windows\Fonts\dotum.ttc"
-        ]
-        
-        # 존재하는 폰트 찾기
-        korean_font = None
-        for font_path in windows_fonts:
-            if os.path.exists(font_path):
-                korean_font = font_path
-                break
-        
-        if korean_font:
-            # matplotlib에 폰트 등록
-            font_prop = fm.FontProperties(fname=korean_font)
-            plt.rcParams['font.family'] = font_prop.get_name()
-            plt.rcParams['axes.unicode_minus'] = False
-            return korean_font
-        else:
-            # 폰트가 없으면 나눔고딕 다운로드 시도
-            return download_nanum_font()
-            
-    except Exception as e:
-        st.error(f"폰트 설정 오류: {e}")
-        return None
+# 벤치마크 대상 요약기 (이름 → 함수)
+SUMMARIZERS = {
+    '기본 요약': summarize_text,
+    'TextRank': textrank_summarize,
+    'KoBART 스타일': kobart_style_summarize,
+}
 
-def download_nanum_font():
-    """나눔고딕 폰트 다운로드"""
-    try:
-        import urllib.request
-        
-        # 나눔고딕 다운로드 URL
-        font_url = "https://github.com/naver/nanumfont/raw/master/fonts/NanumGothic.ttf"
-        font_path = "NanumGothic.ttf"
-        
-        if not os.path.exists(font_path):
-            st.info("한글 폰트를 다운로드하는 중...")
-            urllib.request.urlretrieve(font_url, font_path)
-            st.success("나눔고딕 폰트 다운로드 완료!")
-        
-        return font_path
-        
-    except Exception as e:
-        st.error(f"폰트 다운로드 실패: {e}")
-        return None
+# 요약 벤치마크 작업 (프로세스 내 공유, 같은 요약기·문서 조합은 결과 재사용)
+@st.cache_resource
+def get_benchmark_runner():
+    from summarizer_bench import BenchmarkRunner
+    
+    return BenchmarkRunner()
 
-def get_korean_font_path():
-    """한글 폰트 경로 반환"""
-    return setup_korean_font()
+# 워드클라우드용 한글 키워드 빈도표 (데이터 버전마다 한 번, 실제로 그려지는 max_words개만)
+@st.cache_data(max_entries=2)
+def wordcloud_frequencies(data_version, _keyword_table):
+    """한글 키워드 빈도 (2글자 이상, 키워드 테이블에서 bincount로 계산)"""
+    from wordcloud_cache import WORDCLOUD_PARAMS
+    
+    max_words = WORDCLOUD_PARAMS['max_words']
+    # 최소 2번 이상 나타나는 키워드만 사용 (없으면 모든 키워드 사용)
+    keyword_freq = _keyword_table.top_n(max_words, hangul_only=True, min_length=2, min_count=2)
+    return dict(keyword_freq or _keyword_table.top_n(max_words, hangul_only=True, min_length=2))
 
-# 한글 워드클라우드 생성 (완전 개선 버전)
-def create_wordcloud(text_data):
-    """한글을 완벽하게 지원하는 워드클라우드 생성"""
+# 한글 워드클라우드 생성 (빈도표 지문으로 캐시된 PNG 반환)
+def create_wordcloud(data_version, keyword_table, scale=1):
+    """한글을 완벽하게 지원하는 워드클라우드 PNG 바이트 생성"""
     try:
-        # 1. 키워드 데이터 전처리
-        all_keywords = []
-        for keywords_str in text_data:
-            if pd.notna(keywords_str) and str(keywords_str).strip():
-                keywords = [k.strip() for k in str(keywords_str).split(',')]
-                # 한글 키워드만 필터링 (2글자 이상)
-                korean_keywords = []
-                for k in keywords:
-                    if k and len(k) >= 2 and any('\uac00' <= char <= '\ud7a3' for char in k):
-                        korean_keywords.append(k)
-                all_keywords.extend(korean_keywords)
+        keyword_freq = wordcloud_frequencies(data_version, keyword_table)
         
-        if not all_keywords:
+        if not keyword_freq:
             st.warning("한글 키워드가 없습니다.")
             return None
         
-        # 2. 키워드 빈도 계산 및 필터링
-        keyword_freq = Counter(all_keywords)
-        # 최소 2번 이상 나타나는 키워드만 사용
-        keyword_freq = {k: v for k, v in keyword_freq.items() if v >= 2}
-        
-        if not keyword_freq:
-            # 빈도가 낮아도 모든 키워드 사용
-            keyword_freq = Counter(all_keywords)
-        
-        # 3. 한글 폰트 설정
-        font_path = get_korean_font_path()
-        
-        # 4. 워드클라우드 파라미터 (한글 최적화)
-        wordcloud_params = {
-            'width': 1200,
-            'height': 600,
-            'background_color': 'white',
-            'max_words': 50,  # 키워드 수 줄여서 가독성 향상
-            'colormap': 'tab10',
-            'relative_scaling': 0.5,
-            'min_font_size': 15,  # 최소 폰트 크기 증가
-            'max_font_size': 100,
-            'prefer_horizontal': 0.8,  # 가로 텍스트 더 선호
-            'collocations': False,
-            'random_state': 42,  # 일관된 결과
-        }
-        
-        # 5. 폰트 적용
-        if font_path and os.path.exists(font_path):
-            wordcloud_params['font_path'] = font_path
-            st.success(f"✅ 한글 폰트 적용: {os.path.basename(font_path)}")
-        else:
+        # 한글 폰트 설정
+        font_path = resolve_font_path()
+        if not (font_path and os.path.exists(font_path)):
             st.error("❌ 한글 폰트를 찾을 수 없습니다.")
-            # 기본 폰트로도 시도
-            pass
         
-        # 6. 워드클라우드 생성
-        wordcloud = WordCloud(**wordcloud_params)
-        wordcloud.generate_from_frequencies(keyword_freq)
+        # 같은 빈도표·폰트면 캐시된 이미지를 그대로 사용
+        from wordcloud_cache import get_wordcloud_png
         
-        st.info(f"📊 워드클라우드 생성 완료: {len(keyword_freq)}개 키워드")
-        
-        return wordcloud
+        return get_wordcloud_png(keyword_freq, font_path, scale)
         
     except Exception as e:
         st.error(f"❌ 워드클라우드 생성 실패: {str(e)}")
         
         # 디버깅 정보
         with st.expander("🔧 디버깅 정보"):
-            st.write("키워드 샘플:", all_keywords[:10] if 'all_keywords' in locals() else "없음")
+            st.write("키워드 샘플:", list(keyword_freq.items())[:10] if 'keyword_freq' in locals() else "없음")
             st.write("폰트 경로:", font_path if 'font_path' in locals() else "없음")
             import traceback
             st.code(traceback.format_exc())
@@ -429,8 +462,7 @@ def create_wordcloud(text_data):
 # 링크를 하이퍼링크로 변환하는 함수
 def make_clickable_links(df):
     """데이터프레임의 link 컬럼을 클릭 가능한 하이퍼링크로 변환"""
-    df_copy = df.copy()
-    if 'link' in df_copy.columns:
+    if 'link' in df.columns:
         def create_link(url):
             if pd.notna(url) and str(url).strip():
                 # URL이 http로 시작하지 않으면 https 추가
@@ -439,679 +471,1049 @@ def make_clickable_links(df):
                 return f'<a href="{url}" target="_blank" rel="noopener noreferrer">🔗 링크</a>'
             return '링크 없음'
         
-        df_copy['link'] = df_copy['link'].apply(create_link)
-    return df_copy
+        # link 컬럼만 새로 만들고 나머지 컬럼은 공유 (Copy-on-Write)
+        return df.assign(link=df['link'].map(create_link))
+    return df
 
-# 검색 필터 함수
-def filter_data(df, keyword_filter="", date_filter=None, summary_length_filter=None):
-    """데이터프레임을 필터링하는 함수"""
-    filtered_df = df.copy()
-    
-    # 키워드 필터
-    if keyword_filter:
-        mask = (
-            filtered_df['title'].str.contains(keyword_filter, case=False, na=False) |
-            filtered_df['summary'].str.contains(keyword_filter, case=False, na=False) |
-            filtered_df['keywords'].str.contains(keyword_filter, case=False, na=False)
-        )
-        filtered_df = filtered_df[mask]
-    
-    # 요약 길이 필터
-    if summary_length_filter:
-        min_length, max_length = summary_length_filter
-        filtered_df = filtered_df[
-            (filtered_df['summary'].str.len() >= min_length) & 
-            (filtered_df['summary'].str.len() <= max_length)
-        ]
-    
-    return filtered_df
+# 표 정렬 기준 (화면 이름 → 컬럼, 날짜는 파싱된 published로 정렬)
+TABLE_SORT_COLUMNS = {'날짜': 'published', '제목': 'title', '요약 길이': 'summary_len'}
+# 검색어가 있을 때만 보이는 정렬 (필터 결과의 검색 순위 그대로)
+RELEVANCE_SORT = '관련도'
+TABLE_PAGE_SIZES = [25, 50, 100, 200]
 
-# 이메일 전송 함수
-def send_email_report(recipient_email, subject, df, sender_email="your_email@gmail.com", sender_password="your_app_password"):
-    """뉴스 분석 결과를 이메일로 전송하는 함수"""
-    try:
-        # 이메일 메시지 생성
-        msg = MIMEMultipart()
-        msg['From'] = sender_email
-        msg['To'] = recipient_email
-        msg['Subject'] = subject
-        
-        # HTML 형태의 이메일 본문 생성
-        html_body = f"""
-        <html>
-        <head>
-            <style>
-                table {{ border-collapse: collapse; width: 100%; }}
-                th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-                th {{ background-color: #f2f2f2; }}
-                .header {{ color: #2E86AB; font-size: 24px; margin-bottom: 20px; }}
-                .summary {{ background-color: #f9f9f9; padding: 10px; margin: 10px 0; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">📰 디지털 헬스케어 뉴스 분석 보고서</div>
-            <p><strong>생성 일시:</strong> {datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}</p>
-            <p><strong>총 기사 수:</strong> {len(df)}개</p>
-            
-            <h3>📊 분석 결과</h3>
-            {df.to_html(escape=False, index=False)}
-            
-            <div class="summary">
-                <h3>📈 요약 통계</h3>
-                <ul>
-                    <li>평균 요약 길이: {df['summary'].str.len().mean():.0f}자</li>
-                    <li>총 키워드 수: {sum(len(str(keywords).split(', ')) for keywords in df['keywords'] if pd.notna(keywords))}개</li>
-                </ul>
-            </div>
-            
-            <p><em>이 보고서는 자동으로 생성되었습니다.</em></p>
-        </body>
-        </html>
-        """
-        
-        # HTML 본문 첨부
-        msg.attach(MIMEText(html_body, 'html', 'utf-8'))
-        
-        # CSV 파일 첨부
-        csv_data = df.to_csv(index=False, encoding='utf-8-sig')
-        csv_attachment = MIMEBase('application', 'octet-stream')
-        csv_attachment.set_payload(csv_data.encode('utf-8-sig'))
-        encoders.encode_base64(csv_attachment)
-        csv_attachment.add_header(
-            'Content-Disposition',
-            f'attachment; filename="news_report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv"'
-        )
-        msg.attach(csv_attachment)
-        
-        # Gmail SMTP 서버를 통해 이메일 전송
-        server = smtplib.SMTP('smtp.gmail.com', 587)
-        server.starttls()
-        server.login(sender_email, sender_password)
-        text = msg.as_string()
-        server.sendmail(sender_email, recipient_email, text)
-        server.quit()
-        
-        return True, "이메일이 성공적으로 전송되었습니다!"
-        
-    except Exception as e:
-        return False, f"이메일 전송 실패: {str(e)}"
+# 표 정렬 순서 (데이터 버전·필터·정렬 기준마다 한 번 계산, 세션 간 공유 - 읽기 전용)
+@st.cache_resource(max_entries=8)
+def table_sort_order(data_version, filter_key, sort_by, ascending, _df):
+    """정렬된 행 위치 배열 (_df는 data_version과 filter_key로 정해지는 표시 프레임)"""
+    column = _df[sort_by].reset_index(drop=True)
+    order = column.sort_values(ascending=ascending, kind='stable', na_position='last').index.to_numpy()
+    order.flags.writeable = False
+    return order
 
-# 스케줄러 상태 관리
-if 'scheduler_running' not in st.session_state:
-    st.session_state.scheduler_running = False
-if 'scheduler_thread' not in st.session_state:
-    st.session_state.scheduler_thread = None
+def page_slice(df, page, page_size, order=None):
+    """정렬된 행 위치(order)에 따라 한 페이지 분량의 행만 잘라 반환 (없으면 현재 순서)"""
+    start = (page - 1) * page_size
+    if order is not None:
+        return df.iloc[order[start:start + page_size]]
+    return df.iloc[start:start + page_size]
 
-# 자동 스케줄링 함수
-def schedule_daily_news_collection():
-    def collect_daily_news():
-        try:
-            # 매일 새로운 뉴스 수집
-            articles = get_yna_article_links("디지털 헬스케어", pages=1)[:5]
-            
-            results = []
-            for article in articles:
-                text = extract_yna_article_text(article["link"])
-                summary = summarize_text(text)
-                keywords = extract_keywords(text)
-                results.append({
-                    "title": article["title"],
-                    "link": article["link"],
-                    "summary": summary,
-                    "keywords": ", ".join(keywords),
-                    "collected_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                })
-            
-            # 기존 데이터에 추가
-            if results:
-                new_df = pd.DataFrame(results)
-                try:
-                    existing_df = pd.read_csv('yna_digital_healthcare_news.csv')
-                    combined_df = pd.concat([existing_df, new_df], ignore_index=True)
-                except FileNotFoundError:
-                    combined_df = new_df
-                
-                combined_df.to_csv('yna_digital_healthcare_news.csv', index=False, encoding='utf-8-sig')
-                
-        except Exception as e:
-            print(f"자동 수집 오류: {e}")
+# 예약 전송 주기 (화면 표시 이름 → 저장 값)
+EMAIL_FREQUENCIES = {"매일": 'daily', "매주": 'weekly', "매월": 'monthly'}
+EMAIL_REPORT_KINDS = {"새 기사 다이제스트": 'digest', "전체 보고서": 'full'}
+WEEKDAY_LABELS = ["월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일"]
+
+# 예약 이메일 전송 워커 (프로세스당 하나, 세션과 무관하게 저장소의 작업 큐를 처리)
+@st.cache_resource
+def get_email_dispatcher():
+    import email_scheduler
     
-    # 기존 스케줄 모두 삭제
-    schedule.clear()
+    dispatcher = email_scheduler.EmailDispatcher()
+    dispatcher.start()
+    return dispatcher
+
+# 이메일 보고서 메시지 (수신자 수와 무관하게 한 번만 만들어 모든 수신자에게 재사용)
+def build_report_payload(subject, df, sender_email, recipients, data_version, full_df):
+    """상위 기사 HTML 표와 전체 데이터 zip(CSV) 첨부가 들어간 보고서 메시지 바이트"""
+    import email_report
+    
+    # 요약 통계 (전체 기사면 집계 테이블 사용)
+    avg_summary_length, total_keywords = summary_statistics(
+        df, load_keyword_table(data_version), data_version, full_df
+    )
+    return email_report.build_report_payload(
+        subject, df, sender_email, recipients, avg_summary_length, total_keywords
+    )
+
+# 전송 작업 결과 요약 (전송 상태 화면에서 사용)
+def delivery_result(job):
+    """전송 작업 상태를 (성공 여부, 메시지)로 요약"""
+    if job['error'] is not None:
+        return False, f"이메일 전송 실패: {job['error']}"
+    if job['failed']:
+        return False, f"{job['sent']}명 전송, {len(job['failed'])}명 실패"
+    return True, f"이메일이 {job['sent']}명에게 성공적으로 전송되었습니다!"
+
+# 매일 뉴스 수집 작업 (자동 수집 워커가 실행 시각마다 한 번 호출)
+def collect_daily_news():
+    """새 뉴스를 수집·분석해 저장하고 {저장한 기사 수, 본문 저장 오류} 반환 (실패는 워커가 상태에 기록)"""
+    articles = get_yna_article_links("디지털 헬스케어", pages=1)[:5]
     
-    # 매일 오전 9시에 실행
-    schedule.every().day.at("09:00").do(collect_daily_news)
+    results = []
+    bodies = []
+    for analysis in stream_article_analysis(articles, bodies):
+        results.append({
+            "title": analysis["title"],
+            "link": analysis["link"],
+            "summary": analysis["summary"],
+            "keywords": ", ".join(analysis["keywords"]),
+            "text_length": analysis["text_length"],
+            "collected_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        })
     
-    def run_scheduler():
-        while st.session_state.scheduler_running:
-            schedule.run_pending()
-            time.sleep(60)
+    # 단일 writer 큐를 통해 저장소에 먼저 추가 (같은 URL은 갱신)
+    if results:
+        dataset_writer.append_articles(results)
+        # 오래된 기사는 보관소로 옮기고 대시보드용 스냅샷 발행
+        from data_loader import publish_snapshot
+        
+        apply_retention()
+        publish_snapshot()
     
-    # 이미 실행 중이 아닐 때만 새 스레드 시작
-    if not st.session_state.scheduler_running:
-        st.session_state.scheduler_running = True
-        scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
-        scheduler_thread.start()
-        st.session_state.scheduler_thread = scheduler_thread
-        return "자동 스케줄링이 시작되었습니다. (매일 오전 9시)"
-    else:
-        return "자동 스케줄링이 이미 실행 중입니다."
+    # 원문은 본문 저장소에 한 번에 저장 (실패해도 기사는 이미 저장됐으므로 오류만 기록)
+    body_error = None
+    try:
+        body_store.save_bodies(bodies)
+    except Exception as e:
+        body_error = str(e)
+        print(f"본문 저장 실패: {e}")
+    return {'articles': len(results), 'body_error': body_error}
 
-# 스케줄링 중지 함수
-def stop_scheduler():
-    st.session_state.scheduler_running = False
-    schedule.clear()
-    return "자동 스케줄링이 중지되었습니다."
+# 자동 수집 워커 (프로세스당 하나, 모든 세션이 같은 워커의 상태를 봄)
+@st.cache_resource
+def get_collection_worker():
+    return CollectionWorker(collect_daily_news)
 
-# 기존 데이터 표시
-st.subheader("📊 기존 디지털 헬스케어 뉴스 데이터")
-existing_df = load_existing_data()
+# 세션에 저장된 필터 조건 (필터 결과·정렬 순서 캐시 키로도 사용)
+def filter_conditions():
+    """세션에 저장된 필터 조건 (keyword, date_range, summary_length) - 필터가 꺼져 있으면 None"""
+    if not st.session_state.get('apply_filter'):
+        return None
+    summary_length_range = st.session_state.get('filter_summary_length', (0, 500))
+    date_range = st.session_state.get('filter_date_range')
+    return (
+        st.session_state.get('filter_keyword', ''),
+        # 시작·끝을 모두 고른 경우에만 기간 조건 적용
+        tuple(date_range) if date_range and len(date_range) == 2 else None,
+        tuple(summary_length_range) if tuple(summary_length_range) != (0, 500) else None,
+    )
 
-if not existing_df.empty:
-    # 검색 필터 사이드바
-    with st.sidebar:
-        st.subheader("🔍 검색 필터")
-        
+# 세션에 저장된 필터 조건 적용 (표와 이메일 조각이 함께 사용)
+def filtered_articles(data_version, existing_df, conditions=None):
+    """필터가 켜져 있으면 조건에 맞는 기사, 아니면 전체 기사"""
+    conditions = conditions or filter_conditions()
+    if conditions is None:
+        return existing_df
+    keyword, date_range, summary_length = conditions
+    return get_article_filter(data_version, existing_df).apply(
+        keyword=keyword, date_range=date_range, summary_length=summary_length
+    )
+
+# 화면 구성 조각 (st.fragment) - 조각 안의 위젯을 조작하면 해당 조각만 다시 실행됨
+@st.fragment
+def render_table_tab(data_version, existing_df):
+    # 검색 필터 (이 조각 안에 있으므로 입력해도 표만 다시 계산)
+    with st.expander("🔍 검색 필터", expanded=st.session_state.get('apply_filter', False)):
         # 키워드 필터
-        keyword_filter = st.text_input("키워드 검색", placeholder="제목, 요약, 키워드에서 검색...")
-        
-        # 요약 길이 필터
-        st.write("요약 길이 범위")
-        summary_length_range = st.slider(
-            "문자 수",
-            min_value=0,
-            max_value=500,
-            value=(0, 500),
-            step=10
+        st.text_input(
+            "키워드 검색",
+            placeholder="제목, 요약, 키워드에서 검색...",
+            help='공백은 AND, OR로 합집합, "따옴표"는 구문 검색, 제목:/요약:/키워드:로 필드 지정',
+            key="filter_keyword"
         )
         
-        # 필터 적용 버튼
-        if st.button("🔍 필터 적용"):
-            st.session_state.apply_filter = True
-        
-        # 필터 초기화 버튼
-        if st.button("🔄 필터 초기화"):
-            st.session_state.apply_filter = False
-            st.rerun()
+        # 요약 길이 필터
+        st.slider("요약 길이 범위 (문자 수)", min_value=0, max_value=500, value=(0, 500), step=10,
+                  key="filter_summary_length")
+        
+        # 기간 필터 (기본값은 전체 기간)
+        date_bounds = get_article_filter(data_version, existing_df).date_bounds()
+        if date_bounds:
+            # 새 데이터로 범위가 바뀌어 저장된 기간이 벗어나면 전체 기간으로 되돌림
+            stored_range = st.session_state.get('filter_date_range') or ()
+            if any(d < date_bounds[0] or d > date_bounds[1] for d in stored_range):
+                del st.session_state['filter_date_range']
+            st.date_input("기간", value=date_bounds, min_value=date_bounds[0], max_value=date_bounds[1],
+                          key="filter_date_range")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            # 필터 적용 버튼
+            if st.button("🔍 필터 적용"):
+                st.session_state.apply_filter = True
+        with col2:
+            # 필터 초기화 버튼
+            if st.button("🔄 필터 초기화"):
+                st.session_state.apply_filter = False
+                st.rerun(scope="fragment")
+    
+    conditions = filter_conditions()
+    display_df = filtered_articles(data_version, existing_df, conditions)
+    if conditions is not None:
+        st.info(f"필터 적용 결과: {len(display_df)}개 기사 (전체 {len(existing_df)}개 중)")
     
-    # 필터 적용
-    if hasattr(st.session_state, 'apply_filter') and st.session_state.apply_filter:
-        filtered_df = filter_data(
-            existing_df, 
-            keyword_filter=keyword_filter,
-            summary_length_filter=summary_length_range if summary_length_range != (0, 500) else None
+    # 페이지 단위 표시 (보이는 행만 HTML로 만들어 데이터 규모와 무관하게 가볍게 유지)
+    total_rows = len(display_df.index)
+    col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
+    with col2:
+        # 검색어가 있으면 전문 검색 관련도 순서를 기본으로 제공
+        searching = conditions is not None and bool(conditions[0])
+        sort_labels = ([RELEVANCE_SORT] if searching else []) + list(TABLE_SORT_COLUMNS)
+        if st.session_state.get('table_sort') not in sort_labels:
+            st.session_state.pop('table_sort', None)
+        sort_label = st.selectbox("정렬", sort_labels, key="table_sort")
+    with col3:
+        ascending = st.selectbox("순서", ["내림차순", "오름차순"], key="table_order") == "오름차순"
+    with col4:
+        page_size = st.selectbox("페이지 크기", TABLE_PAGE_SIZES, index=1, key="table_page_size")
+    total_pages = max(1, -(-total_rows // page_size))
+    # 필터로 행 수가 줄어 현재 페이지가 범위를 벗어나면 마지막 페이지로 이동
+    if st.session_state.get('table_page', 1) > total_pages:
+        st.session_state.table_page = total_pages
+    with col1:
+        page = st.number_input(
+            f"페이지 (총 {total_pages}쪽, {total_rows}개 기사)",
+            min_value=1, max_value=total_pages, value=1, step=1, key="table_page"
         )
-        st.info(f"필터 적용 결과: {len(filtered_df)}개 기사 (전체 {len(existing_df)}개 중)")
-        display_df = filtered_df
-    else:
-        display_df = existing_df
+    order = None
+    if sort_label != RELEVANCE_SORT:
+        order = table_sort_order(data_version, conditions, TABLE_SORT_COLUMNS[sort_label], ascending, display_df)
+    page_df = page_slice(display_df, int(page), page_size, order)
     
-    # 탭으로 구성
-    tab1, tab2, tab3, tab4 = st.tabs(["📋 데이터 테이블", "☁️ 워드클라우드", "📈 요약 비교", "📧 이메일 전송"])
+    # 클릭 가능한 링크로 데이터프레임 표시
+    try:
+        df_with_links = make_clickable_links(page_df)
+        st.markdown(
+            df_with_links.to_html(columns=news_store.DISPLAY_COLUMNS, escape=False, index=False),
+            unsafe_allow_html=True
+        )
+    except Exception as e:
+        st.error(f"링크 표시 중 오류 발생: {e}")
+        st.dataframe(
+            page_df, column_order=news_store.DISPLAY_COLUMNS, hide_index=True,
+            column_config={'link': st.column_config.LinkColumn('link')}
+        )
     
-    with tab1:
-        # 클릭 가능한 링크로 데이터프레임 표시
-        try:
-            df_with_links = make_clickable_links(display_df)
-            st.markdown(df_with_links.to_html(escape=False, index=False), unsafe_allow_html=True)
-        except Exception as e:
-            st.error(f"링크 표시 중 오류 발생: {e}")
-            st.dataframe(display_df)
+    # 전체 기간 추이 (롤업 테이블에서 읽으므로 보관된 기사도 포함)
+    with st.expander("📅 전체 기간 일별 추이", expanded=False):
+        rollups = load_rollups(data_version)
+        if not rollups.empty:
+            import plotly.express as px
+            
+            fig_daily = px.bar(rollups, x='date', y='article_count', title="일별 기사 수",
+                               labels={'date': '날짜', 'article_count': '기사 수'})
+            fig_daily.update_layout(height=300)
+            st.plotly_chart(fig_daily, use_container_width=True)
+            fig_length = px.line(rollups, x='date', y='avg_summary_length', title="일별 평균 요약 길이",
+                                 labels={'date': '날짜', 'avg_summary_length': '평균 요약 길이'})
+            fig_length.update_layout(height=300)
+            st.plotly_chart(fig_length, use_container_width=True)
+        else:
+            st.info("집계된 데이터가 없습니다.")
         
-        # 기존 데이터 CSV 다운로드
-        csv_existing = existing_df.to_csv(index=False, encoding='utf-8-sig')
+        # 현재 저장소 집계 (출처별 기사 수, 요약 길이 분포)
+        aggregates = load_aggregates(data_version)
+        if aggregates is not None and aggregates['articles']:
+            import plotly.express as px
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                by_source = aggregates['by_source'].head(15)
+                fig_source = px.bar(x=by_source.index, y=by_source.values, title="출처별 기사 수 (현재 저장소)",
+                                    labels={'x': '출처', 'y': '기사 수'})
+                fig_source.update_layout(height=300)
+                st.plotly_chart(fig_source, use_container_width=True)
+            with col2:
+                histogram = aggregates['summary_length_histogram']
+                fig_hist = px.bar(
+                    x=[f"{start}~{start + news_store.SUMMARY_LENGTH_BIN - 1}" for start in histogram.index],
+                    y=histogram.values, title="요약 길이 분포 (현재 저장소)",
+                    labels={'x': '요약 길이', 'y': '기사 수'}
+                )
+                fig_hist.update_layout(height=300)
+                st.plotly_chart(fig_hist, use_container_width=True)
+    
+    # 기존 데이터 CSV 다운로드 (요청할 때만 생성)
+    if st.button("📄 기존 데이터 CSV 준비"):
+        csv_existing = existing_df.to_csv(columns=news_store.DISPLAY_COLUMNS, index=False, encoding='utf-8-sig')
         st.download_button(
             label="📥 기존 데이터 CSV 다운로드",
             data=csv_existing,
             file_name=f"디지털헬스케어_뉴스데이터_{time.strftime('%Y%m%d_%H%M%S')}.csv",
-            mime="text/csv"
+            mime="text/csv",
+            on_click="ignore"
         )
+
+@st.fragment
+def render_wordcloud_tab(data_version, existing_df, keyword_table):
+    st.subheader("☁️ 키워드 워드클라우드")
     
-    with tab2:
-        st.subheader("☁️ 키워드 워드클라우드")
-        
-        # 폰트 상태 확인 버튼
-        col1, col2 = st.columns([3, 1])
-        with col2:
-            if st.button("🔍 폰트 상태 확인"):
-                font_path = get_korean_font_path()
-                if font_path:
-                    st.success(f"✅ 한글 폰트 발견: {os.path.basename(font_path)}")
-                else:
-                    st.error("❌ 한글 폰트를 찾을 수 없습니다")
-        
-        if 'keywords' in existing_df.columns:
-            # 워드클라우드 생성 진행 상황 표시
-            with st.spinner("워드클라우드 생성 중..."):
-                wordcloud = create_wordcloud(existing_df['keywords'])
+    # 폰트 상태 확인 버튼
+    col1, col2 = st.columns([3, 1])
+    with col2:
+        if st.button("🔍 폰트 상태 확인"):
+            font_path = resolve_font_path()
+            if font_path:
+                st.success(f"✅ 한글 폰트 발견: {os.path.basename(font_path)}")
+            else:
+                st.error("❌ 한글 폰트를 찾을 수 없습니다")
+    
+    if 'keywords' in existing_df.columns:
+        # 워드클라우드 생성 진행 상황 표시 (캐시에 있으면 바로 반환)
+        with st.spinner("워드클라우드 생성 중..."):
+            wordcloud_png = create_wordcloud(data_version, keyword_table)
+        
+        if wordcloud_png:
+            st.markdown("#### 🌟 키워드 워드클라우드 🌟")
+            st.image(wordcloud_png)
             
-            if wordcloud:
-                # matplotlib 한글 폰트 강제 설정
-                try:
-                    # 한글 폰트 재설정
-                    font_path = get_korean_font_path()
-                    if font_path:
-                        import matplotlib.font_manager as fm
-                        font_prop = fm.FontProperties(fname=font_path)
-                        plt.rcParams['font.family'] = [font_prop.get_name()]
-                    else:
-                        # Windows 기본 한글 폰트들 시도
-                        plt.rcParams['font.family'] = ['Malgun Gothic', 'Gulim', 'Batang', 'Dotum']
-                    
-                    plt.rcParams['axes.unicode_minus'] = False
-                    
-                except Exception as e:
-                    st.warning(f"matplotlib 폰트 설정 실패: {e}")
-                
-                # 워드클라우드 표시 (개선된 버전)
-                fig, ax = plt.subplots(figsize=(15, 8))
-                ax.imshow(wordcloud, interpolation='bilinear')
-                ax.axis('off')
-                
-                # 제목을 한글로 표시 (폰트 테스트)
-                try:
-                    ax.set_title('🌟 키워드 워드클라우드 🌟', fontsize=20, pad=30, weight='bold')
-                except:
-                    ax.set_title('Keyword WordCloud', fontsize=20, pad=30, weight='bold')
-                
-                # 최고 해상도로 표시
-                st.pyplot(fig, dpi=200, use_container_width=True)
-                plt.close(fig)  # 메모리 정리
+            # 고해상도 이미지는 요청할 때만 생성 (결과도 캐시됨)
+            try:
+                if st.button("🖼️ 고해상도 이미지 준비"):
+                    with st.spinner("고해상도 이미지 생성 중..."):
+                        hires_png = create_wordcloud(data_version, keyword_table, scale=2)
+                    if hires_png:
+                        st.download_button(
+                            label="📥 워드클라우드 이미지 다운로드",
+                            data=hires_png,
+                            file_name=f"wordcloud_{time.strftime('%Y%m%d_%H%M%S')}.png",
+                            mime="image/png",
+                            on_click="ignore"
+                        )
+            except Exception as e:
+                st.warning(f"다운로드 기능 오류: {e}")
+            
+            # 키워드 빈도 차트
+            st.subheader("📊 키워드 빈도 분석")
+            aggregates = load_aggregates(data_version)
+            if aggregates is not None:
+                # 저장 시 유지된 키워드 빈도 집계 사용
+                total_keywords = aggregates['keyword_total']
+                unique_keywords = aggregates['keyword_unique']
+                keyword_counts = aggregates['keyword_counts']
+                korean = keyword_counts[(keyword_counts['is_hangul'] == 1) & (keyword_counts['length'] >= 2)]
+                korean_keywords = dict(zip(korean['term'].head(15), korean['count'].head(15)))
+            else:
+                total_keywords = keyword_table.total_count()
+                unique_keywords = keyword_table.unique_count()
+                # 한글 키워드 상위 15개 (한글 여부는 수집 시 계산됨)
+                korean_keywords = dict(keyword_table.top_n(15, hangul_only=True, min_length=2))
+            
+            if total_keywords:
                 
-                # 워드클라우드 이미지 다운로드 옵션
-                try:
-                    import io
-                    img_buffer = io.BytesIO()
-                    fig, ax = plt.subplots(figsize=(15, 8))
-                    ax.imshow(wordcloud, interpolation='bilinear')
-                    ax.axis('off')
-                    plt.savefig(img_buffer, format='png', dpi=300, bbox_inches='tight')
-                    plt.close(fig)
+                if korean_keywords:
+                    import plotly.express as px
                     
-                    st.download_button(
-                        label="📥 워드클라우드 이미지 다운로드",
-                        data=img_buffer.getvalue(),
-                        file_name=f"wordcloud_{time.strftime('%Y%m%d_%H%M%S')}.png",
-                        mime="image/png"
+                    fig_bar = px.bar(
+                        x=list(korean_keywords.values()),
+                        y=list(korean_keywords.keys()),
+                        orientation='h',
+                        title="상위 키워드 빈도 (한글)",
+                        labels={'x': '빈도', 'y': '키워드'},
+                        color=list(korean_keywords.values()),
+                        color_continuous_scale='viridis'
                     )
-                except Exception as e:
-                    st.warning(f"다운로드 기능 오류: {e}")
-                
-                # 키워드 빈도 차트
-                st.subheader("📊 키워드 빈도 분석")
-                all_keywords = []
-                for keywords_str in existing_df['keywords']:
-                    if pd.notna(keywords_str):
-                        keywords = [k.strip() for k in str(keywords_str).split(',')]
-                        keywords = [k for k in keywords if k and len(k) > 1]  # 빈 키워드 제거
-                        all_keywords.extend(keywords)
-                
-                if all_keywords:
-                    keyword_freq = Counter(all_keywords)
-                    top_keywords = dict(keyword_freq.most_common(15))  # 상위 15개로 증가
-                    
-                    # 한글 키워드만 필터링
-                    korean_keywords = {}
-                    for k, v in top_keywords.items():
-                        if any('\uac00' <= char <= '\ud7a3' for char in k):  # 한글 포함 확인
-                            korean_keywords[k] = v
+                    fig_bar.update_layout(
+                        height=500,
+                        font=dict(size=12),
+                        title_font_size=16
+                    )
+                    st.plotly_chart(fig_bar, use_container_width=True)
                     
-                    if korean_keywords:
-                        fig_bar = px.bar(
-                            x=list(korean_keywords.values()),
-                            y=list(korean_keywords.keys()),
-                            orientation='h',
-                            title="상위 키워드 빈도 (한글)",
-                            labels={'x': '빈도', 'y': '키워드'},
-                            color=list(korean_keywords.values()),
-                            color_continuous_scale='viridis'
-                        )
-                        fig_bar.update_layout(
-                            height=500,
-                            font=dict(size=12),
-                            title_font_size=16
-                        )
-                        st.plotly_chart(fig_bar, use_container_width=True)
-                        
-                        # 키워드 통계 정보
-                        col1, col2, col3 = st.columns(3)
-                        with col1:
-                            st.metric("총 키워드 수", len(all_keywords))
-                        with col2:
-                            st.metric("고유 키워드 수", len(keyword_freq))
-                        with col3:
-                            st.metric("평균 빈도", f"{sum(keyword_freq.values()) / len(keyword_freq):.1f}")
-                    else:
-                        st.warning("한글 키워드가 없습니다.")
+                    # 키워드 통계 정보
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("총 키워드 수", total_keywords)
+                    with col2:
+                        st.metric("고유 키워드 수", unique_keywords)
+                    with col3:
+                        st.metric("평균 빈도", f"{total_keywords / unique_keywords:.1f}")
                 else:
-                    st.warning("키워드 데이터가 없습니다.")
+                    st.warning("한글 키워드가 없습니다.")
             else:
-                st.error("워드클라우드 생성에 실패했습니다.")
-                
-                # 대안 제시
-                st.info("💡 해결 방법:")
-                st.markdown("""
-                1. **한글 폰트 설치 확인**: Windows 설정 > 시간 및 언어 > 언어에서 한국어 언어팩 설치
-                2. **폰트 파일 확인**: C:/Windows/Fonts/ 폴더에 malgun.ttf 파일 존재 여부 확인
-                3. **권한 문제**: 관리자 권한으로 실행 시도
-                """)
+                st.warning("키워드 데이터가 없습니다.")
         else:
-            st.warning("키워드 데이터가 없습니다.")
-    
-    with tab3:
-        st.subheader("📈 요약 방법 비교")
-        if 'summary' in existing_df.columns and len(existing_df) > 0:
-            # 첫 번째 기사로 요약 비교 데모
-            selected_idx = st.selectbox("비교할 기사 선택", range(len(existing_df)), 
-                                      format_func=lambda x: existing_df.iloc[x]['title'][:50] + "...")
+            st.error("워드클라우드 생성에 실패했습니다.")
             
-            if st.button("요약 비교 실행"):
-                selected_article = existing_df.iloc[selected_idx]
-                
-                # 더 긴 샘플 텍스트 생성 (실제 뉴스 기사처럼)
-                extended_text = f"""
-                {selected_article['title']}
-                
-                {selected_article.get('summary', '')}
-                
-                디지털 헬스케어 분야는 최근 몇 년간 급속한 발전을 보이고 있다. 
-                인공지능, 빅데이터, IoT 등의 기술이 의료 서비스와 결합되면서 새로운 패러다임을 만들어가고 있다.
-                
-                전문가들은 이러한 변화가 의료 접근성을 크게 향상시킬 것으로 전망한다고 밝혔다.
-                특히 원격 진료 서비스의 확산으로 지역 간 의료 격차 해소에도 기여할 것으로 기대된다.
-                
-                그러나 개인정보 보호와 의료 데이터 보안에 대한 우려도 함께 제기되고 있어, 
-                관련 법규 정비와 기술적 보완이 필요한 상황이다.
-                
-                업계 관계자는 "디지털 헬스케어 기술의 발전과 함께 환자 중심의 의료 서비스가 
-                더욱 발전할 것"이라며 "지속적인 투자와 연구개발이 중요하다"고 강조했다.
-                """.strip()
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.subheader("🔤 TextRank 요약")
-                    textrank_result = textrank_summarize(extended_text)
-                    
-                    # TextRank 결과를 박스 형태로 표시
-                    st.markdown(f"""
-                    <div style="background-color: #f0f2f6; padding: 15px; border-radius: 10px; border-left: 4px solid #1f77b4;">
-                        {textrank_result}
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    st.info(f"길이: {len(textrank_result)} 문자")
-                    
-                    # TextRank 특징 설명
-                    st.caption("📝 TextRank는 문장 간 유사도를 기반으로 중요한 문장을 선택합니다.")
-                
-                with col2:
-                    st.subheader("🤖 KoBART 스타일 요약")
-                    kobart_result = kobart_style_summarize(extended_text)
-                    
-                    # KoBART 결과를 박스 형태로 표시
-                    st.markdown(f"""
-                    <div style="background-color: #fff2e6; padding: 15px; border-radius: 10px; border-left: 4px solid #ff7f0e;">
-                        {kobart_result}
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    st.info(f"길이: {len(kobart_result)} 문자")
-                    
-                    # KoBART 특징 설명
-                    st.caption("📝 KoBART 스타일은 키워드와 위치를 중심으로 핵심 정보를 추출합니다.")
-                
-                # 원본 텍스트 길이
-                original_length = len(extended_text)
+            # 대안 제시
+            st.info("💡 해결 방법:")
+            st.markdown("""
+            1. **한글 폰트 설치 확인**: Windows 설정 > 시간 및 언어 > 언어에서 한국어 언어팩 설치
+            2. **폰트 파일 확인**: C:/Windows/Fonts/ 폴더에 malgun.ttf 파일 존재 여부 확인
+            3. **권한 문제**: 관리자 권한으로 실행 시도
+            """)
+    else:
+        st.warning("키워드 데이터가 없습니다.")
+
+@st.fragment
+def render_comparison_tab(existing_df):
+    st.subheader("📈 요약 방법 비교")
+    if 'summary' in existing_df.columns and len(existing_df) > 0:
+        # 첫 번째 기사로 요약 비교 데모
+        selected_idx = st.selectbox("비교할 기사 선택", range(len(existing_df)), 
+                                  format_func=lambda x: existing_df.iloc[x]['title'][:50] + "...")
+        
+        if st.button("요약 비교 실행"):
+            selected_article = existing_df.iloc[selected_idx]
+            
+            # 본문 저장소에 원문이 있으면 그대로 사용 (다시 수집하지 않음)
+            try:
+                stored_text = body_store.get_text(selected_article['link'])
+            except Exception:
+                stored_text = None
+            
+            # 없으면 더 긴 샘플 텍스트 생성 (실제 뉴스 기사처럼)
+            extended_text = stored_text or f"""
+            {selected_article['title']}
+            
+            {selected_article.get('summary', '')}
+            
+            디지털 헬스케어 분야는 최근 몇 년간 급속한 발전을 보이고 있다. 
+            인공지능, 빅데이터, IoT 등의 기술이 의료 서비스와 결합되면서 새로운 패러다임을 만들어가고 있다.
+            
+            전문가들은 이러한 변화가 의료 접근성을 크게 향상시킬 것으로 전망한다고 밝혔다.
+            특히 원격 진료 서비스의 확산으로 지역 간 의료 격차 해소에도 기여할 것으로 기대된다.
+            
+            그러나 개인정보 보호와 의료 데이터 보안에 대한 우려도 함께 제기되고 있어, 
+            관련 법규 정비와 기술적 보완이 필요한 상황이다.
+            
+            업계 관계자는 "디지털 헬스케어 기술의 발전과 함께 환자 중심의 의료 서비스가 
+            더욱 발전할 것"이라며 "지속적인 투자와 연구개발이 중요하다"고 강조했다.
+            """.strip()
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.subheader("🔤 TextRank 요약")
+                textrank_result = textrank_summarize(extended_text)
                 
-                # 요약 품질 비교 차트
-                comparison_data = {
-                    '요약 방법': ['TextRank', 'KoBART 스타일'],
-                    '문자 수': [len(textrank_result), len(kobart_result)],
-                    '압축률': [len(textrank_result)/original_length*100, len(kobart_result)/original_length*100]
-                }
+                # TextRank 결과를 박스 형태로 표시
+                st.markdown(f"""
+                <div style="background-color: #f0f2f6; padding: 15px; border-radius: 10px; border-left: 4px solid #1f77b4;">
+                    {textrank_result}
+                </div>
+                """, unsafe_allow_html=True)
                 
-                # 상세 비교 정보
-                st.subheader("📊 상세 비교 분석")
+                st.info(f"길이: {len(textrank_result)} 문자")
                 
-                col3, col4, col5 = st.columns(3)
-                with col3:
-                    st.metric("원본 텍스트", f"{original_length} 문자")
-                with col4:
-                    st.metric("TextRank 압축률", f"{comparison_data['압축률'][0]:.1f}%")
-                with col5:
-                    st.metric("KoBART 압축률", f"{comparison_data['압축률'][1]:.1f}%")
+                # TextRank 특징 설명
+                st.caption("📝 TextRank는 문장 간 유사도를 기반으로 중요한 문장을 선택합니다.")
+            
+            with col2:
+                st.subheader("🤖 KoBART 스타일 요약")
+                kobart_result = kobart_style_summarize(extended_text)
                 
-                # 압축률 비교 차트
-                fig_comparison = px.bar(
-                    comparison_data, 
-                    x='요약 방법', 
-                    y='압축률',
-                    title="요약 방법별 압축률 비교 (%)",
-                    color='요약 방법',
-                    color_discrete_map={
-                        'TextRank': '#1f77b4',
-                        'KoBART 스타일': '#ff7f0e'
-                    }
-                )
-                fig_comparison.update_layout(height=400)
-                st.plotly_chart(fig_comparison, use_container_width=True)
+                # KoBART 결과를 박스 형태로 표시
+                st.markdown(f"""
+                <div style="background-color: #fff2e6; padding: 15px; border-radius: 10px; border-left: 4px solid #ff7f0e;">
+                    {kobart_result}
+                </div>
+                """, unsafe_allow_html=True)
                 
-                # 문장 수 비교
-                textrank_sentences = len(re.split(r'[.!?]\s+', textrank_result))
-                kobart_sentences = len(re.split(r'[.!?]\s+', kobart_result))
-                original_sentences = len(re.split(r'[.!?]\s+', extended_text))
+                st.info(f"길이: {len(kobart_result)} 문자")
                 
-                sentence_data = {
-                    '구분': ['원본', 'TextRank', 'KoBART 스타일'],
-                    '문장 수': [original_sentences, textrank_sentences, kobart_sentences]
+                # KoBART 특징 설명
+                st.caption("📝 KoBART 스타일은 키워드와 위치를 중심으로 핵심 정보를 추출합니다.")
+            
+            # 원본 텍스트 길이
+            original_length = len(extended_text)
+            
+            # 요약 품질 비교 차트
+            comparison_data = {
+                '요약 방법': ['TextRank', 'KoBART 스타일'],
+                '문자 수': [len(textrank_result), len(kobart_result)],
+                '압축률': [len(textrank_result)/original_length*100, len(kobart_result)/original_length*100]
+            }
+            
+            # 상세 비교 정보
+            st.subheader("📊 상세 비교 분석")
+            
+            col3, col4, col5 = st.columns(3)
+            with col3:
+                st.metric("원본 텍스트", f"{original_length} 문자")
+            with col4:
+                st.metric("TextRank 압축률", f"{comparison_data['압축률'][0]:.1f}%")
+            with col5:
+                st.metric("KoBART 압축률", f"{comparison_data['압축률'][1]:.1f}%")
+            
+            # 압축률 비교 차트
+            import plotly.express as px
+            
+            fig_comparison = px.bar(
+                comparison_data, 
+                x='요약 방법', 
+                y='압축률',
+                title="요약 방법별 압축률 비교 (%)",
+                color='요약 방법',
+                color_discrete_map={
+                    'TextRank': '#1f77b4',
+                    'KoBART 스타일': '#ff7f0e'
                 }
-                
-                fig_sentences = px.bar(
-                    sentence_data,
-                    x='구분',
-                    y='문장 수',
-                    title="문장 수 비교",
-                    color='구분'
-                )
-                fig_sentences.update_layout(height=300)
-                st.plotly_chart(fig_sentences, use_container_width=True)
+            )
+            fig_comparison.update_layout(height=400)
+            st.plotly_chart(fig_comparison, use_container_width=True)
+            
+            # 문장 수 비교
+            textrank_sentences = len(re.split(r'[.!?]\s+', textrank_result))
+            kobart_sentences = len(re.split(r'[.!?]\s+', kobart_result))
+            original_sentences = len(re.split(r'[.!?]\s+', extended_text))
+            
+            sentence_data = {
+                '구분': ['원본', 'TextRank', 'KoBART 스타일'],
+                '문장 수': [original_sentences, textrank_sentences, kobart_sentences]
+            }
+            
+            fig_sentences = px.bar(
+                sentence_data,
+                x='구분',
+                y='문장 수',
+                title="문장 수 비교",
+                color='구분'
+            )
+            fig_sentences.update_layout(height=300)
+            st.plotly_chart(fig_sentences, use_container_width=True)
+        
+        render_summarizer_benchmark(existing_df)
+    else:
+        st.warning("요약 데이터가 없습니다.")
+
+@st.fragment(run_every=1)
+def render_benchmark_progress(bench_key):
+    """실행 중인 벤치마크 진행률 (끝나면 전체를 다시 실행해 결과 표시)"""
+    job = get_benchmark_runner().status(bench_key)
+    if job is None or job['finished'].is_set():
+        st.rerun()
+    st.progress(job['done'] / max(job['total'], 1), text=f"벤치마크 실행 중... ({job['done']}/{job['total']})")
+
+def render_summarizer_benchmark(existing_df):
+    """저장된 실제 기사 본문으로 모든 요약기의 지연 시간·압축률 분포 측정"""
+    st.divider()
+    st.subheader("⏱️ 요약기 벤치마크 (저장된 기사 본문)")
+    
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        doc_count = st.slider("최근 기사 수", min_value=10, max_value=500, value=50, step=10, key="bench_docs")
+    with col2:
+        names = st.multiselect("요약기", list(SUMMARIZERS), default=list(SUMMARIZERS), key="bench_summarizers")
+    
+    runner = get_benchmark_runner()
+    if st.button("🏁 벤치마크 실행", disabled=not names):
+        # 최근 기사 중 본문 저장소에 원문이 있는 것만 사용
+        recent_links = existing_df.sort_values('published', ascending=False)['link'].head(doc_count).tolist()
+        from summarizer_bench import load_documents
+        
+        documents = load_documents(recent_links)
+        if documents:
+            st.session_state.bench_key = runner.start({name: SUMMARIZERS[name] for name in names}, documents)
         else:
-            st.warning("요약 데이터가 없습니다.")
+            st.warning("본문 저장소에 저장된 기사 본문이 없습니다. 새 뉴스를 수집하면 본문이 저장됩니다.")
     
-    with tab4:
-        st.subheader("📧 이메일 자동 전송")
+    job = runner.status(st.session_state.get('bench_key'))
+    if job is None:
+        return
+    if not job['finished'].is_set():
+        # 백그라운드 실행 중: 진행률 조각만 1초마다 다시 그림
+        render_benchmark_progress(st.session_state.bench_key)
+        return
+    if job['error'] is not None:
+        st.error(f"벤치마크 실패: {job['error']}")
+        return
+    
+    import plotly.express as px
+    
+    results = job['results']
+    st.caption(
+        f"문서 {results['link'].nunique()}개 · 요약기 {results['summarizer'].nunique()}개 · "
+        f"{job['finished_at'] - job['started_at']:.1f}초 소요"
+    )
+    st.dataframe(
+        job['summary'].rename(columns={
+            'summarizer': '요약기', 'docs': '문서 수', 'p50_ms': 'p50 지연(ms)', 'p95_ms': 'p95 지연(ms)',
+            'docs_per_sec': '처리량(문서/초)', 'compression_pct': '평균 압축률(%)',
+            'output_sentences': '평균 문장 수', 'errors': '오류',
+        }).round(2),
+        hide_index=True
+    )
+    col1, col2 = st.columns(2)
+    with col1:
+        fig_latency = px.box(results, x='summarizer', y='latency_ms', color='summarizer', points='outliers',
+                             title="문서별 지연 시간 분포", labels={'summarizer': '요약기', 'latency_ms': '지연(ms)'})
+        fig_latency.update_layout(height=350, showlegend=False)
+        st.plotly_chart(fig_latency, use_container_width=True)
+    with col2:
+        fig_ratio = px.histogram(results, x='compression', color='summarizer', barmode='overlay', nbins=30,
+                                 title="압축률 분포", labels={'compression': '압축률(%)', 'summarizer': '요약기'})
+        fig_ratio.update_layout(height=350)
+        st.plotly_chart(fig_ratio, use_container_width=True)
+
+@st.fragment
+def render_email_tab(data_version, existing_df, keyword_table):
+    st.subheader("📧 이메일 자동 전송")
+    
+    # 이메일 설정 섹션
+    with st.expander("⚙️ 이메일 설정", expanded=True):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            sender_email = st.text_input(
+                "발신자 이메일 (Gmail)", 
+                placeholder="your_email@gmail.com",
+                help="Gmail 계정을 입력하세요"
+            )
+            sender_password = st.text_input(
+                "앱 비밀번호", 
+                type="password",
+                help="Gmail 2단계 인증 후 생성한 앱 비밀번호를 입력하세요"
+            )
         
-        # 이메일 설정 섹션
-        with st.expander("⚙️ 이메일 설정", expanded=True):
-            col1, col2 = st.columns(2)
+        with col2:
+            recipient_email = st.text_area(
+                "수신자 이메일", 
+                placeholder="recipient@example.com",
+                help="여러 명에게 보내려면 쉼표나 줄바꿈으로 구분하세요",
+                height=80
+            )
+            email_subject = st.text_input(
+                "이메일 제목",
+                value=f"디지털 헬스케어 뉴스 분석 보고서 - {datetime.now().strftime('%Y.%m.%d')}"
+            )
+    
+    # 전송할 데이터 선택
+    st.subheader("📋 전송할 데이터 선택")
+    
+    # 현재 표시된 데이터 사용 여부
+    use_filtered_data = st.checkbox(
+        "현재 필터링된 데이터 사용", 
+        value=True,
+        help="체크하면 현재 화면에 표시된 필터링된 데이터를 전송합니다"
+    )
+    
+    if use_filtered_data:
+        email_df = filtered_articles(data_version, existing_df)
+        st.info(f"전송할 데이터: {len(email_df)}개 기사")
+    else:
+        email_df = existing_df
+        st.info(f"전송할 데이터: {len(email_df)}개 기사 (전체 데이터)")
+    
+    # 이메일 미리보기
+    if st.button("📋 이메일 미리보기"):
+        if not email_df.empty:
+            st.subheader("📧 이메일 미리보기")
             
-            with col1:
-                sender_email = st.text_input(
-                    "발신자 이메일 (Gmail)", 
-                    placeholder="your_email@gmail.com",
-                    help="Gmail 계정을 입력하세요"
-                )
-                sender_password = st.text_input(
-                    "앱 비밀번호", 
-                    type="password",
-                    help="Gmail 2단계 인증 후 생성한 앱 비밀번호를 입력하세요"
-                )
+            avg_summary_length, total_keywords = summary_statistics(email_df, keyword_table, data_version, existing_df)
             
-            with col2:
-                recipient_email = st.text_input(
-                    "수신자 이메일", 
-                    placeholder="recipient@example.com"
-                )
-                email_subject = st.text_input(
-                    "이메일 제목",
-                    value=f"디지털 헬스케어 뉴스 분석 보고서 - {datetime.now().strftime('%Y.%m.%d')}"
-                )
-        
-        # 전송할 데이터 선택
-        st.subheader("📋 전송할 데이터 선택")
-        
-        # 현재 표시된 데이터 사용 여부
-        use_filtered_data = st.checkbox(
-            "현재 필터링된 데이터 사용", 
-            value=True,
-            help="체크하면 현재 화면에 표시된 필터링된 데이터를 전송합니다"
-        )
-        
-        if use_filtered_data:
-            email_df = display_df
-            st.info(f"전송할 데이터: {len(email_df)}개 기사")
-        else:
-            email_df = existing_df
-            st.info(f"전송할 데이터: {len(email_df)}개 기사 (전체 데이터)")
-        
-        # 이메일 미리보기
-        if st.button("📋 이메일 미리보기"):
-            if not email_df.empty:
-                st.subheader("📧 이메일 미리보기")
+            # 미리보기 HTML 생성
+            preview_html = f"""
+            <div style="border: 1px solid #ddd; padding: 20px; border-radius: 10px; background-color: #f9f9f9;">
+                <h2 style="color: #2E86AB;">📰 디지털 헬스케어 뉴스 분석 보고서</h2>
+                <p><strong>생성 일시:</strong> {datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}</p>
+                <p><strong>총 기사 수:</strong> {len(email_df)}개</p>
                 
-                # 미리보기 HTML 생성
-                preview_html = f"""
-                <div style="border: 1px solid #ddd; padding: 20px; border-radius: 10px; background-color: #f9f9f9;">
-                    <h2 style="color: #2E86AB;">📰 디지털 헬스케어 뉴스 분석 보고서</h2>
-                    <p><strong>생성 일시:</strong> {datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}</p>
-                    <p><strong>총 기사 수:</strong> {len(email_df)}개</p>
-                    
-                    <h3>📊 분석 결과 (상위 3개 기사)</h3>
-                    {email_df.head(3).to_html(escape=False, index=False)}
-                    
-                    <div style="background-color: #f0f0f0; padding: 10px; margin: 10px 0; border-radius: 5px;">
-                        <h3>📈 요약 통계</h3>
-                        <ul>
-                            <li>평균 요약 길이: {email_df['summary'].str.len().mean():.0f}자</li>
-                            <li>총 키워드 수: {sum(len(str(keywords).split(', ')) for keywords in email_df['keywords'] if pd.notna(keywords))}개</li>
-                        </ul>
-                    </div>
-                </div>
-                """
+                <h3>📊 분석 결과 (상위 3개 기사)</h3>
+                {email_df.head(3).to_html(columns=news_store.DISPLAY_COLUMNS, escape=False, index=False)}
                 
-                st.markdown(preview_html, unsafe_allow_html=True)
+                <div style="background-color: #f0f0f0; padding: 10px; margin: 10px 0; border-radius: 5px;">
+                    <h3>📈 요약 통계</h3>
+                    <ul>
+                        <li>평균 요약 길이: {avg_summary_length:.0f}자</li>
+                        <li>총 키워드 수: {total_keywords}개</li>
+                    </ul>
+                </div>
+            </div>
+            """
+            
+            st.markdown(preview_html, unsafe_allow_html=True)
+        else:
+            st.warning("전송할 데이터가 없습니다.")
+    
+    # 이메일 전송 버튼
+    st.divider()
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        if st.button("📤 이메일 전송", type="primary", use_container_width=True):
+            from mail_delivery import get_mailer, parse_recipients
+            
+            recipients = parse_recipients(recipient_email)
+            # 입력 검증
+            if not sender_email or not sender_password or not recipients:
+                st.error("모든 이메일 정보를 입력해주세요.")
+            elif email_df.empty:
+                st.error("전송할 데이터가 없습니다.")
             else:
-                st.warning("전송할 데이터가 없습니다.")
-        
-        # 이메일 전송 버튼
-        st.divider()
+                # 메시지는 한 번만 만들고 전송은 백그라운드 전송 큐에 맡김
+                try:
+                    payload = build_report_payload(
+                        email_subject, email_df, sender_email, recipients, data_version, existing_df
+                    )
+                except ValueError as e:
+                    st.error(f"보고서가 너무 큽니다: {e}. 필터로 기사 수를 줄여 주세요.")
+                else:
+                    st.info(f"메시지 크기: {len(payload) / 1024:.0f}KB")
+                    st.session_state.email_job = get_mailer().submit(
+                        sender_email, sender_password, recipients, payload
+                    )
+    
+    render_email_delivery_status()
+    
+    # 자동 전송 설정
+    st.divider()
+    st.subheader("⏰ 자동 이메일 전송 설정")
+    
+    import email_scheduler
+    
+    auto_email_enabled = st.checkbox("자동 이메일 전송 활성화")
+    
+    if auto_email_enabled:
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            auto_email_time = st.time_input("전송 시간", value=datetime.now().time())
+            auto_email_frequency = st.selectbox(
+                "전송 주기",
+                list(EMAIL_FREQUENCIES),
+                index=0
+            )
+            auto_weekday = auto_day = None
+            if auto_email_frequency == "매주":
+                auto_weekday = WEEKDAY_LABELS.index(st.selectbox("요일", WEEKDAY_LABELS))
+            elif auto_email_frequency == "매월":
+                auto_day = st.number_input("날짜 (없는 날은 말일)", min_value=1, max_value=31, value=1)
         
-        col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
-            if st.button("📤 이메일 전송", type="primary", use_container_width=True):
-                # 입력 검증
-                if not sender_email or not sender_password or not recipient_email:
-                    st.error("모든 이메일 정보를 입력해주세요.")
-                elif email_df.empty:
-                    st.error("전송할 데이터가 없습니다.")
+            auto_recipient = st.text_area("자동 전송 수신자", value=recipient_email, height=80)
+            auto_subject = st.text_input("자동 전송 제목", value="디지털 헬스케어 뉴스 분석 보고서")
+            auto_report = st.radio(
+                "보고서 종류", list(EMAIL_REPORT_KINDS), horizontal=True,
+                help="다이제스트는 수신자마다 지난번에 받은 이후 새로 수집된 기사만 보냅니다"
+            )
+            
+        if st.button("⚙️ 자동 전송 설정 저장"):
+            if not sender_email:
+                st.error("발신자 이메일을 입력해주세요.")
+            else:
+                try:
+                    schedule_id, first_run = email_scheduler.add_schedule(
+                        sender_email, auto_recipient, auto_subject,
+                        EMAIL_FREQUENCIES[auto_email_frequency], auto_email_time.strftime('%H:%M'),
+                        weekday=auto_weekday, day=auto_day, report=EMAIL_REPORT_KINDS[auto_report]
+                    )
+                except ValueError as e:
+                    st.error(f"설정 저장 실패: {e}")
                 else:
-                    with st.spinner("이메일 전송 중..."):
-                        success, message = send_email_report(
-                            recipient_email=recipient_email,
-                            subject=email_subject,
-                            df=email_df,
-                            sender_email=sender_email,
-                            sender_password=sender_password
-                        )
-                    
-                    if success:
-                        st.success(message)
-                        st.balloons()
-                    else:
-                        st.error(message)
-                        
-                        # 일반적인 오류 해결 방법 안내
-                        with st.expander("❓ 이메일 전송 오류 해결 방법"):
-                            st.markdown("""
-                            **일반적인 오류 해결 방법:**
-                            
-                            1. **Gmail 2단계 인증 설정**
-                               - Gmail 계정에서 2단계 인증을 활성화하세요
-                            
-                            2. **앱 비밀번호 생성**
-                               - Google 계정 설정 → 보안 → 앱 비밀번호에서 생성
-                               - 일반 Gmail 비밀번호가 아닌 앱 비밀번호를 사용하세요
-                            
-                            3. **네트워크 연결 확인**
-                               - 인터넷 연결 상태를 확인하세요
-                            
-                            4. **이메일 주소 확인**
-                               - 발신자와 수신자 이메일 주소가 올바른지 확인하세요
-                            """)
-        
-        # 자동 전송 설정
-        st.divider()
-        st.subheader("⏰ 자동 이메일 전송 설정")
+                    st.success("자동 이메일 전송 설정이 저장되었습니다!")
+                    st.info(f"설정 #{schedule_id}: {auto_email_frequency} {auto_email_time.strftime('%H:%M')} "
+                            f"전송 (첫 전송 {first_run.strftime('%Y-%m-%d %H:%M')})")
+        if not os.environ.get(email_scheduler.PASSWORD_ENV):
+            st.warning(
+                f"예약 전송은 화면 입력과 무관하게 동작하므로 앱 비밀번호를 저장하지 않습니다. "
+                f"서버 환경 변수 {email_scheduler.PASSWORD_ENV}에 앱 비밀번호를 설정해주세요."
+            )
+    
+    render_email_schedules()
+
+def render_email_schedules():
+    """저장된 예약 전송 일정, 최근 전송 작업, 감사 로그"""
+    import email_scheduler
+    
+    dispatcher = get_email_dispatcher()
+    schedules = email_scheduler.load_schedules()
+    if schedules.empty:
+        return
+    
+    heartbeat = dispatcher.heartbeat.strftime('%H:%M:%S') if dispatcher.heartbeat else "-"
+    if dispatcher.running:
+        st.caption(f"🟢 예약 전송 워커 실행 중 (마지막 확인 {heartbeat})")
+    else:
+        st.caption("🔴 예약 전송 워커가 중지되어 있습니다")
+    
+    st.write("**예약 전송 일정**")
+    st.dataframe(
+        schedules[['id', 'frequency', 'send_time', 'report', 'recipients', 'subject', 'enabled', 'next_run']].rename(columns={
+            'id': '번호', 'frequency': '주기', 'send_time': '시간', 'report': '종류', 'recipients': '수신자',
+            'subject': '제목', 'enabled': '사용', 'next_run': '다음 전송'
+        }),
+        hide_index=True
+    )
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        schedule_id = st.selectbox("일정 선택", schedules['id'].tolist(), key="email_schedule_id")
+    enabled = bool(schedules.set_index('id').loc[schedule_id, 'enabled'])
+    with col2:
+        if st.button("⏸️ 중지" if enabled else "▶️ 재개", use_container_width=True):
+            email_scheduler.set_enabled(schedule_id, not enabled)
+            st.rerun(scope="fragment")
+    with col3:
+        if st.button("🗑️ 삭제", use_container_width=True):
+            email_scheduler.delete_schedule(schedule_id)
+            st.rerun(scope="fragment")
+    
+    with st.expander("📜 전송 기록"):
+        st.dataframe(
+            email_scheduler.load_deliveries()[['schedule_id', 'slot', 'status', 'attempts', 'sent', 'failed', 'error']],
+            hide_index=True
+        )
+        st.dataframe(
+            email_scheduler.load_audit()[['at', 'schedule_id', 'delivery_id', 'event', 'detail']],
+            hide_index=True
+        )
+
+@st.fragment(run_every=1)
+def render_email_delivery_progress(job_id):
+    """전송 중인 작업 진행률 (끝나면 전체를 다시 실행해 결과 표시)"""
+    from mail_delivery import get_mailer
+    
+    job = get_mailer().status(job_id)
+    if job is None or job['done'].is_set():
+        st.rerun()
+    processed = job['sent'] + len(job['failed'])
+    st.progress(processed / max(job['total'], 1), text=f"이메일 전송 중... ({processed}/{job['total']})")
+
+def render_email_delivery_status():
+    """백그라운드 전송 작업 진행률과 수신자별 결과"""
+    job_id = st.session_state.get('email_job')
+    if job_id is None:
+        return
+    from mail_delivery import get_mailer
+    
+    job = get_mailer().status(job_id)
+    if job is None:
+        return
+    if not job['done'].is_set():
+        # 전송 중: 진행률 조각만 1초마다 다시 그림
+        render_email_delivery_progress(job_id)
+        return
+    
+    success, message = delivery_result(job)
+    elapsed = job['finished_at'] - (job['started_at'] or job['finished_at'])
+    if success:
+        st.success(f"{message} ({elapsed:.1f}초 소요)")
+    else:
+        st.error(message)
+        if job['failed']:
+            st.dataframe(
+                pd.DataFrame(list(job['failed'].items()), columns=['수신자', '실패 사유']),
+                hide_index=True
+            )
+        
+        # 일반적인 오류 해결 방법 안내
+        with st.expander("❓ 이메일 전송 오류 해결 방법"):
+            st.markdown("""
+            **일반적인 오류 해결 방법:**
+            
+            1. **Gmail 2단계 인증 설정**
+               - Gmail 계정에서 2단계 인증을 활성화하세요
+            
+            2. **앱 비밀번호 생성**
+               - Google 계정 설정 → 보안 → 앱 비밀번호에서 생성
+               - 일반 Gmail 비밀번호가 아닌 앱 비밀번호를 사용하세요
+            
+            3. **네트워크 연결 확인**
+               - 인터넷 연결 상태를 확인하세요
+            
+            4. **이메일 주소 확인**
+               - 발신자와 수신자 이메일 주소가 올바른지 확인하세요
+            """)
+
+@st.fragment
+def render_network_tab(existing_df):
+    st.subheader("🕸️ 키워드 동시출현 네트워크")
+    graph = sync_keyword_graph(existing_df)
+    
+    if graph.terms:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            top_k = st.slider("표시할 키워드 수", min_value=10, max_value=100, value=30, step=5)
+        with col2:
+            min_count = st.slider("최소 동시출현 횟수", min_value=1, max_value=10, value=1)
+        with col3:
+            weight_label = st.radio("간선 가중치", ["빈도", "PMI"], horizontal=True)
+        weight = 'pmi' if weight_label == "PMI" else 'count'
         
-        auto_email_enabled = st.checkbox("자동 이메일 전송 활성화")
+        nodes, edges = graph.pruned_graph(top_k=top_k, min_count=min_count, weight=weight)
         
-        if auto_email_enabled:
-            col1, col2 = st.columns(2)
+        if edges:
+            import networkx as nx
+            import plotly.graph_objects as go
             
-            with col1:
-                auto_email_time = st.time_input("전송 시간", value=datetime.now().time())
-                auto_email_frequency = st.selectbox(
-                    "전송 주기",
-                    ["매일", "매주", "매월"],
-                    index=0
+            # 가지치기된 작은 그래프에만 레이아웃 계산
+            nx_graph = nx.Graph()
+            nx_graph.add_nodes_from(term for term, _ in nodes)
+            nx_graph.add_weighted_edges_from(edges)
+            pos = nx.spring_layout(nx_graph, seed=42, weight='weight')
+            
+            edge_x, edge_y = [], []
+            for a, b, _ in edges:
+                edge_x += [pos[a][0], pos[b][0], None]
+                edge_y += [pos[a][1], pos[b][1], None]
+            
+            doc_freq = dict(nodes)
+            node_terms = list(nx_graph.nodes())
+            fig_net = go.Figure()
+            fig_net.add_trace(go.Scatter(
+                x=edge_x, y=edge_y, mode='lines',
+                line=dict(width=0.7, color='#bbbbbb'), hoverinfo='none'
+            ))
+            fig_net.add_trace(go.Scatter(
+                x=[pos[t][0] for t in node_terms],
+                y=[pos[t][1] for t in node_terms],
+                mode='markers+text',
+                text=node_terms,
+                textposition='top center',
+                hovertext=[f"{t}: {doc_freq[t]}건" for t in node_terms],
+                hoverinfo='text',
+                marker=dict(
+                    size=[10 + 4 * doc_freq[t] ** 0.5 for t in node_terms],
+                    color=[doc_freq[t] for t in node_terms],
+                    colorscale='Viridis'
                 )
+            ))
+            fig_net.update_layout(
+                height=600, showlegend=False,
+                xaxis=dict(visible=False), yaxis=dict(visible=False)
+            )
+            st.plotly_chart(fig_net, use_container_width=True)
+        else:
+            st.info("조건을 만족하는 동시출현 관계가 없습니다.")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.write("**중심성 상위 키워드**")
+            centrality = graph.centrality(kind='eigenvector', weight=weight)
+            top_idx = np.argsort(-centrality)[:15]
+            st.dataframe(pd.DataFrame({
+                '키워드': [graph.terms[i] for i in top_idx],
+                '중심성': np.round(centrality[top_idx], 4)
+            }), hide_index=True)
+        with col2:
+            st.write("**연관 키워드 조회**")
+            target = st.selectbox("기준 키워드", [term for term, _ in nodes])
+            neighbors = graph.top_neighbors(target, n=10, weight=weight)
+            if neighbors:
+                st.dataframe(pd.DataFrame(neighbors, columns=['키워드', '가중치']), hide_index=True)
+            else:
+                st.info("연관 키워드가 없습니다.")
+    else:
+        st.warning("키워드 데이터가 없습니다.")
+
+@st.fragment
+def render_trends_tab(data_version):
+    st.subheader("🔥 키워드 트렌드")
+    trends = load_keyword_trends(data_version)
+    
+    if len(trends.terms) and len(trends.dates):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            window = st.radio("이동 창(일)", [7, 14, 30], horizontal=True, key="trend_window")
+        with col2:
+            by_label = st.radio("순위 기준", ["증가율", "급등 점수"], horizontal=True, key="trend_by")
+        with col3:
+            top_n = st.slider("표시할 키워드 수", min_value=3, max_value=20, value=8, key="trend_top_n")
+        by = 'burst' if by_label == "급등 점수" else 'growth'
+        
+        st.caption(
+            f"기간 {trends.dates[0].date()} ~ {trends.dates[-1].date()} ({len(trends.dates)}일), "
+            f"전체 빈도 상위 {len(trends.terms)}개 키워드 대상"
+        )
+        rising = trends.rising(n=top_n, window=window, by=by)
+        
+        if not rising.empty:
+            st.write(f"**최근 {window}일 상승 키워드** (직전 {window}일 대비)")
+            st.dataframe(
+                rising.rename(columns={
+                    'keyword': '키워드', 'recent': f'최근 {window}일', 'previous': f'직전 {window}일',
+                    'growth': '증가율', 'burst': '급등 점수'
+                }).round({'증가율': 2, '급등 점수': 2}),
+                hide_index=True
+            )
             
-            with col2:
-                auto_recipient = st.text_input("자동 전송 수신자", value=recipient_email)
-                
-            if st.button("⚙️ 자동 전송 설정 저장"):
-                st.success("자동 이메일 전송 설정이 저장되었습니다!")
-                st.info(f"설정: {auto_email_frequency} {auto_email_time.strftime('%H:%M')}에 {auto_recipient}로 전송")
+            import plotly.express as px
             
+            # 이동 창 일평균 빈도 (날짜가 많으면 서버에서 구간 평균으로 줄여 전송)
+            series = trends.series(rising['keyword'].tolist(), window=window, max_points=400)
+            fig_trend = px.line(
+                series, x='date', y='frequency', color='keyword',
+                labels={'date': '날짜', 'frequency': f'{window}일 이동 평균 빈도', 'keyword': '키워드'}
+            )
+            fig_trend.update_layout(height=450)
+            st.plotly_chart(fig_trend, use_container_width=True)
+        else:
+            st.info(f"최근 {window}일 동안 충분히 등장한 키워드가 없습니다.")
+    else:
+        st.warning("키워드 추세 데이터가 없습니다.")
+
+@st.fragment
+def render_scheduler_panel():
+    worker = get_collection_worker()
+    status = worker.status()
+    
+    # 현재 워커 상태 표시 (모든 세션이 같은 상태를 봄)
+    if status['running_slot']:
+        st.warning(f"⏳ {status['running_slot']} 수집이 진행 중입니다")
+    elif status['enabled'] and status['running']:
+        st.success(f"🟢 자동 스케줄링이 실행 중입니다 (매일 오전 9시, 다음 수집 {status['next_slot']:%Y-%m-%d %H:%M})")
+    elif status['enabled']:
+        st.warning("🟡 자동 스케줄링이 켜져 있지만 워커 스레드가 실행 중이 아닙니다")
+    else:
+        st.info("🔴 자동 스케줄링이 중지되어 있습니다")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        if st.button("🚀 스케줄링 시작", disabled=status['enabled'] and status['running']):
+            try:
+                worker.start()
+                st.success("자동 스케줄링이 시작되었습니다. (매일 오전 9시)")
+                st.rerun(scope="fragment")
+            except Exception as e:
+                st.error(f"스케줄링 시작 실패: {e}")
+
+    with col2:
+        if st.button("⏹️ 스케줄링 중지", disabled=not status['enabled']):
+            try:
+                worker.stop()
+                st.success("자동 스케줄링이 중지되었습니다.")
+                st.rerun(scope="fragment")
+            except Exception as e:
+                st.error(f"스케줄링 중지 실패: {e}")
+
+    with col3:
+        if st.button("📅 상태 확인"):
+            heartbeat = status['heartbeat'].strftime('%H:%M:%S') if status['heartbeat'] else "-"
+            st.write(f"**워커 스레드:** {'실행 중' if status['running'] else '중지됨'} (마지막 확인 {heartbeat})")
+            st.write(f"**마지막 수집:** {status['last_slot'] or '-'} (완료 {status['last_finished'] or '-'})")
+            if status['last_error']:
+                st.error(f"마지막 수집 오류: {status['last_error']}")
+            elif status['last_result'] is not None:
+                result = status['last_result']
+                if not isinstance(result, dict):
+                    # 이전 버전 상태 파일은 기사 수만 기록
+                    result = {'articles': result}
+                st.write(f"**저장한 기사:** {result['articles']}개")
+                if result.get('body_error'):
+                    st.warning(f"본문 저장 실패: {result['body_error']}")
+
+# 예약 이메일 전송 워커와 자동 수집 워커 준비 (서버 프로세스에서 처음 한 번만, 켜져 있던 수집은 이어서 실행)
+get_email_dispatcher()
+get_collection_worker()
+
+# 기존 데이터 표시
+st.subheader("📊 기존 디지털 헬스케어 뉴스 데이터")
+data_version, existing_df = load_existing_data()
+keyword_table = load_keyword_table(data_version)
+
+if not existing_df.empty:
+    # 탭으로 구성 (각 탭은 독립적으로 다시 실행되는 조각)
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["📋 데이터 테이블", "☁️ 워드클라우드", "📈 요약 비교", "📧 이메일 전송", "🕸️ 키워드 네트워크", "🔥 키워드 트렌드"])
+    
+    with tab1:
+        render_table_tab(data_version, existing_df)
+    with tab2:
+        render_wordcloud_tab(data_version, existing_df, keyword_table)
+    with tab3:
+        render_comparison_tab(existing_df)
+    with tab4:
+        render_email_tab(data_version, existing_df, keyword_table)
+    with tab5:
+        render_network_tab(existing_df)
+    with tab6:
+        render_trends_tab(data_version)
 else:
     st.info("기존 데이터가 없습니다.")
 
 # 자동 스케줄링 섹션
 st.divider()
 st.subheader("⏰ 자동 스케줄링")
-
-# 현재 스케줄러 상태 표시
-if st.session_state.scheduler_running:
-    st.success("🟢 자동 스케줄링이 실행 중입니다 (매일 오전 9시)")
-else:
-    st.info("🔴 자동 스케줄링이 중지되어 있습니다")
-
-col1, col2, col3 = st.columns(3)
-
-with col1:
-    if st.button("🚀 스케줄링 시작", disabled=st.session_state.scheduler_running):
-        try:
-            message = schedule_daily_news_collection()
-            st.success(message)
-            st.rerun()
-        except Exception as e:
-            st.error(f"스케줄링 시작 실패: {e}")
-
-with col2:
-    if st.button("⏹️ 스케줄링 중지", disabled=not st.session_state.scheduler_running):
-        try:
-            message = stop_scheduler()
-            st.success(message)
-            st.rerun()
-        except Exception as e:
-            st.error(f"스케줄링 중지 실패: {e}")
-
-with col3:
-    if st.button("📅 상태 확인"):
-        jobs = schedule.jobs
-        if jobs:
-            st.write("**활성 스케줄:**")
-            for i, job in enumerate(jobs, 1):
-                st.write(f"{i}. 매일 09:00 - 뉴스 수집")
-        else:
-            st.write("활성화된 스케줄이 없습니다.")
-        
-        # 스레드 상태도 표시
-        if st.session_state.scheduler_running:
-            st.write("**스케줄러 스레드:** 실행 중")
-        else:
-            st.write("**스케줄러 스레드:** 중지됨")
+render_scheduler_panel()
 
 st.divider()
 
@@ -1136,66 +1538,66 @@ if submitted:
             progress_bar = st.progress(0)
             status_text = st.empty()
             
+            # 결과 영역 (기사가 하나 끝날 때마다 표·통계·다운로드를 그 자리에서 갱신)
+            st.subheader("📊 분석 결과")
+            table_slot = st.empty()
+            col1, col2, col3 = st.columns(3)
+            count_slot, length_slot, keyword_slot = col1.empty(), col2.empty(), col3.empty()
+            download_slot = st.empty()
+            
             results = []
-            for i, article in enumerate(articles):
+            bodies = []
+            for analysis in stream_article_analysis(articles, bodies):
+                if analysis["error"]:
+                    st.warning(f"기사 처리 중 오류: {analysis['title'][:30]}... - {analysis['error']}")
+                    summary, keywords = "처리 중 오류 발생", "오류"
+                else:
+                    summary = analysis["summary"] or "본문을 가져올 수 없습니다."
+                    keywords = ", ".join(analysis["keywords"]) if analysis["keywords"] else "키워드 없음"
+                results.append({
+                    "제목": analysis["title"],
+                    "링크": analysis["link"],
+                    "요약": summary,
+                    "키워드": keywords
+                })
+                
                 # 진행 상황 업데이트
-                progress = (i + 1) / len(articles)
-                progress_bar.progress(progress)
-                status_text.text(f"분석 중... ({i + 1}/{len(articles)}) {article['title'][:50]}...")
+                progress_bar.progress(len(results) / len(articles))
+                status_text.text(f"분석 중... ({len(results)}/{len(articles)}) {analysis['title'][:50]}...")
                 
-                try:
-                    text = extract_yna_article_text(article["link"])
-                    summary = summarize_text(text) if text else "본문을 가져올 수 없습니다."
-                    keywords = extract_keywords(text) if text else []
-                    
-                    results.append({
-                        "제목": article["title"],
-                        "링크": article["link"],
-                        "요약": summary,
-                        "키워드": ", ".join(keywords) if keywords else "키워드 없음"
-                    })
-                except Exception as e:
-                    st.warning(f"기사 처리 중 오류: {article['title'][:30]}... - {str(e)}")
-                    results.append({
-                        "제목": article["title"],
-                        "링크": article["link"],
-                        "요약": "처리 중 오류 발생",
-                        "키워드": "오류"
-                    })
-            
-            # 진행 상황 완료
-            progress_bar.progress(1.0)
-            status_text.text("분석 완료!")
-            st.success("✅ 뉴스 분석이 완료되었습니다!")
-            
-            # 결과 표시
-            if results:
-                st.subheader("📊 분석 결과")
+                # 지금까지의 결과 표시 (링크를 하이퍼링크로 변환)
                 df = pd.DataFrame(results)
-                
-                # 링크를 하이퍼링크로 변환한 데이터프레임 표시
-                df_with_links = make_clickable_links(df)
-                st.markdown(df_with_links.to_html(escape=False, index=False), unsafe_allow_html=True)
+                table_slot.markdown(make_clickable_links(df).to_html(escape=False, index=False), unsafe_allow_html=True)
                 
                 # 통계 정보
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("총 기사 수", len(results))
-                with col2:
-                    avg_summary_length = sum(len(r["요약"]) for r in results) / len(results)
-                    st.metric("평균 요약 길이", f"{avg_summary_length:.0f}자")
-                with col3:
-                    total_keywords = sum(len(r["키워드"].split(", ")) for r in results if r["키워드"] != "키워드 없음")
-                    st.metric("총 키워드 수", total_keywords)
+                count_slot.metric("총 기사 수", len(results))
+                avg_summary_length = sum(len(r["요약"]) for r in results) / len(results)
+                length_slot.metric("평균 요약 길이", f"{avg_summary_length:.0f}자")
+                total_keywords = sum(len(r["키워드"].split(", ")) for r in results if r["키워드"] not in ("키워드 없음", "오류"))
+                keyword_slot.metric("총 키워드 수", total_keywords)
                 
-                # CSV 다운로드
-                csv = df.to_csv(index=False, encoding='utf-8-sig')
-                st.download_button(
-                    label="📥 CSV 파일 다운로드",
-                    data=csv,
+                # 부분 결과도 언제든 내려받을 수 있도록 CSV 갱신
+                download_slot.download_button(
+                    label=f"📥 CSV 파일 다운로드 ({len(results)}/{len(articles)})",
+                    data=df.to_csv(index=False, encoding='utf-8-sig'),
                     file_name=f"{keyword}_뉴스분석_{time.strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
+                    mime="text/csv",
+                    key=f"news_csv_{len(results)}",
+                    # 내려받아도 스크립트를 다시 실행하지 않음 (분석 중인 결과 유지)
+                    on_click="ignore"
                 )
+            
+            # 수집한 원문을 본문 저장소에 저장
+            try:
+                body_store.save_bodies(bodies)
+            except Exception as e:
+                st.warning(f"본문 저장 실패: {e}")
+            
+            # 진행 상황 완료
+            progress_bar.progress(1.0)
+            status_text.text("분석 완료!")
+            if results:
+                st.success("✅ 뉴스 분석이 완료되었습니다!")
             else:
                 st.warning("분석할 기사를 찾을 수 없습니다.")
                 
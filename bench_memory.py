@@ -0,0 +1,55 @@
+import time
+import numpy as np
+import pandas as pd
+
+from data_loader import LOAD_COLUMNS, compact_frame
+
+# 메모리 벤치마크: object dtype 프레임과 압축 스키마 프레임 비교
+ROW_COUNTS = [100_000, 1_000_000]
+
+
+def make_synthetic_articles(n_rows, seed=42):
+    """기존 CSV와 비슷한 분포의 합성 기사 데이터 생성"""
+    rng = np.random.default_rng(seed)
+    vocab = np.array([f"키워드{i}" for i in range(2000)], dtype=object)
+    sources = np.array([f"news{i}.co.kr" for i in range(40)], dtype=object)
+    dates = pd.date_range("2020-01-01", periods=365 * 5, freq="D").strftime("%Y-%m-%d").to_numpy(dtype=object)
+    ids = np.arange(n_rows)
+    keyword_idx = rng.integers(0, len(vocab), size=(n_rows, 5))
+    return pd.DataFrame({
+        'title': [f"디지털 헬스케어 기사 제목 {i}" for i in ids],
+        'link': [f"https://www.yna.co.kr/view/AKR{i:012d}" for i in ids],
+        'summary': [f"디지털 헬스케어 관련 요약 문장입니다. 기사 번호 {i}. " * 3 for i in ids],
+        'keywords': [", ".join(row) for row in vocab[keyword_idx]],
+        'date': dates[rng.integers(0, len(dates), size=n_rows)],
+        'source': sources[rng.integers(0, len(sources), size=n_rows)],
+    }, columns=LOAD_COLUMNS).astype(object)
+
+
+def frame_memory_mb(df):
+    """프레임의 실제 메모리 사용량 (MB)"""
+    return df.memory_usage(deep=True).sum() / 1024 ** 2
+
+
+def run_benchmark():
+    print("📏 기사 프레임 메모리 벤치마크")
+    print("=" * 60)
+    for n_rows in ROW_COUNTS:
+        raw = make_synthetic_articles(n_rows)
+        raw_mb = frame_memory_mb(raw)
+        start = time.perf_counter()
+        compact = compact_frame(raw)
+        elapsed = time.perf_counter() - start
+        compact_mb = frame_memory_mb(compact)
+        print(f"\n[{n_rows:,}행]")
+        print(f"   object dtype  : {raw_mb:8.1f} MB")
+        print(f"   압축 스키마   : {compact_mb:8.1f} MB ({compact_mb / raw_mb * 100:.0f}%, 파생 컬럼 포함)")
+        print(f"   변환 시간     : {elapsed:8.2f} 초")
+        # 필터 결과를 복사본 대신 행 위치 배열로 보관할 때의 크기
+        positions = np.flatnonzero(compact['summary_len'].to_numpy() > 50)
+        print(f"   필터 행 배열  : {positions.nbytes / 1024 ** 2:8.1f} MB (복사본 대비 {positions.nbytes / 1024 ** 2 / compact_mb * 100:.1f}%)")
+    print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,210 @@
+import hashlib
+import lzma
+import os
+import sqlite3
+import zlib
+from contextlib import closing
+from datetime import datetime
+
+from dataset_writer import file_lock
+from news_store import url_hash
+
+# 기사 원문(HTML)과 추출 본문을 내용 해시로 저장하는 압축 세그먼트 저장소
+BODY_DIR = "bodies"
+SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+
+CODECS = {
+    'zlib': (lambda data: zlib.compress(data, 6), zlib.decompress),
+    'lzma': (lzma.compress, lzma.decompress),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    content_hash TEXT PRIMARY KEY,
+    segment INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    raw_length INTEGER NOT NULL,
+    codec TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS article_bodies (
+    url_hash TEXT PRIMARY KEY,
+    link TEXT,
+    html_hash TEXT,
+    text_hash TEXT,
+    stored_at TEXT
+);
+"""
+
+
+def content_hash(data):
+    """본문 바이트의 SHA-256 해시 (저장 키)"""
+    return hashlib.sha256(data).hexdigest()
+
+
+class BodyStore:
+    """세그먼트 파일 + 오프셋 색인으로 임의 접근 가능한 본문 저장소"""
+
+    def __init__(self, body_dir=BODY_DIR, codec='zlib'):
+        self.body_dir = body_dir
+        self.codec = codec
+        self.index_path = os.path.join(body_dir, "index.db")
+
+    def _connect(self):
+        os.makedirs(self.body_dir, exist_ok=True)
+        conn = sqlite3.connect(self.index_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def _segment_path(self, segment):
+        return os.path.join(self.body_dir, f"segment-{segment:05d}.bin")
+
+    def put_many(self, bodies):
+        """(URL, HTML, 본문) 목록을 한 번에 저장 - 같은 내용은 한 번만 기록"""
+        bodies = [(url, html or '', text or '') for url, html, text in bodies if url]
+        if not bodies:
+            return 0
+        compress = CODECS[self.codec][0]
+        blobs = {}
+        links = []
+        for url, html, text in bodies:
+            hashes = []
+            for content in (html, text):
+                data = content.encode('utf-8')
+                digest = content_hash(data)
+                blobs.setdefault(digest, data)
+                hashes.append(digest)
+            links.append((url_hash(url), url, hashes[0], hashes[1]))
+        os.makedirs(self.body_dir, exist_ok=True)
+        with file_lock(self.index_path), closing(self._connect()) as conn, conn:
+            existing = set()
+            digests = list(blobs)
+            for start in range(0, len(digests), 500):
+                chunk = digests[start:start + 500]
+                existing.update(row[0] for row in conn.execute(
+                    f"SELECT content_hash FROM blobs WHERE content_hash IN ({', '.join('?' for _ in chunk)})", chunk
+                ))
+            new_blobs = [(digest, data) for digest, data in blobs.items() if digest not in existing]
+            if new_blobs:
+                segment = conn.execute("SELECT COALESCE(MAX(segment), 0) FROM blobs").fetchone()[0] or 1
+                path = self._segment_path(segment)
+                if os.path.exists(path) and os.path.getsize(path) >= SEGMENT_MAX_BYTES:
+                    segment += 1
+                    path = self._segment_path(segment)
+                rows = []
+                # 새 내용만 세그먼트 끝에 이어 쓰고 한 번만 fsync
+                with open(path, 'ab') as f:
+                    for digest, data in new_blobs:
+                        compressed = compress(data)
+                        offset = f.tell()
+                        f.write(compressed)
+                        rows.append((digest, segment, offset, len(compressed), len(data), self.codec))
+                    f.flush()
+                    os.fsync(f.fileno())
+                conn.executemany(
+                    "INSERT OR IGNORE INTO blobs (content_hash, segment, offset, length, raw_length, codec) "
+                    "VALUES (?, ?, ?, ?, ?, ?)", rows
+                )
+            now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            conn.executemany(
+                "INSERT INTO article_bodies (url_hash, link, html_hash, text_hash, stored_at) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT(url_hash) DO UPDATE SET "
+                "html_hash = excluded.html_hash, text_hash = excluded.text_hash, stored_at = excluded.stored_at",
+                [link + (now,) for link in links]
+            )
+        return len(new_blobs)
+
+    def get_blob(self, digest):
+        """내용 해시로 본문 바이트 읽기 (없으면 None)"""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT segment, offset, length, codec FROM blobs WHERE content_hash = ?", (digest,)
+            ).fetchone()
+        if row is None:
+            return None
+        return self._read(*row)
+
+    def _read(self, segment, offset, length, codec):
+        with open(self._segment_path(segment), 'rb') as f:
+            f.seek(offset)
+            return CODECS[codec][1](f.read(length))
+
+    def _get(self, url, column):
+        if not os.path.exists(self.index_path):
+            return None
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                f"SELECT b.segment, b.offset, b.length, b.codec FROM article_bodies a "
+                f"JOIN blobs b ON b.content_hash = a.{column} WHERE a.url_hash = ?", (url_hash(url),)
+            ).fetchone()
+        if row is None:
+            return None
+        return self._read(*row).decode('utf-8')
+
+    def get_text(self, url):
+        """기사 URL의 추출 본문 (없으면 None)"""
+        return self._get(url, 'text_hash')
+
+    def get_html(self, url):
+        """기사 URL의 원문 HTML (없으면 None)"""
+        return self._get(url, 'html_hash')
+
+    def iter_texts(self, urls=None):
+        """(URL, 본문)을 세그먼트·오프셋 순으로 읽기 (재처리 작업용 순차 읽기)"""
+        if not os.path.exists(self.index_path):
+            return
+        sql = (
+            "SELECT a.link, b.segment, b.offset, b.length, b.codec FROM article_bodies a "
+            "JOIN blobs b ON b.content_hash = a.text_hash"
+        )
+        with closing(self._connect()) as conn:
+            if urls is None:
+                rows = conn.execute(sql + " ORDER BY b.segment, b.offset").fetchall()
+            else:
+                # 원하는 URL 해시만 임시 테이블에 넣고 색인(url_hash)으로 조인
+                conn.execute("CREATE TEMP TABLE wanted (url_hash TEXT PRIMARY KEY) WITHOUT ROWID")
+                conn.executemany(
+                    "INSERT OR IGNORE INTO wanted (url_hash) VALUES (?)", ((url_hash(url),) for url in urls)
+                )
+                rows = conn.execute(
+                    sql + " JOIN wanted w ON w.url_hash = a.url_hash ORDER BY b.segment, b.offset"
+                ).fetchall()
+        for link, segment, offset, length, codec in rows:
+            text = self._read(segment, offset, length, codec).decode('utf-8')
+            if text:
+                yield link, text
+
+    def stats(self):
+        """저장된 기사 수, 고유 본문 수, 원본/압축 바이트"""
+        if not os.path.exists(self.index_path):
+            return {'articles': 0, 'blobs': 0, 'raw_bytes': 0, 'stored_bytes': 0}
+        with closing(self._connect()) as conn:
+            articles = conn.execute("SELECT COUNT(*) FROM article_bodies").fetchone()[0]
+            blobs, raw_bytes, stored_bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(raw_length), 0), COALESCE(SUM(length), 0) FROM blobs"
+            ).fetchone()
+        return {'articles': articles, 'blobs': blobs, 'raw_bytes': raw_bytes, 'stored_bytes': stored_bytes}
+
+
+_default_store = BodyStore()
+
+
+def save_bodies(bodies):
+    """기본 본문 저장소에 (URL, HTML, 본문) 목록 저장"""
+    return _default_store.put_many(bodies)
+
+
+def get_text(url):
+    """기본 본문 저장소에서 추출 본문 읽기"""
+    return _default_store.get_text(url)
+
+
+def get_html(url):
+    """기본 본문 저장소에서 원문 HTML 읽기"""
+    return _default_store.get_html(url)
+
+
+def iter_texts(urls=None):
+    """기본 본문 저장소에서 (URL, 본문)을 순차 읽기"""
+    return _default_store.iter_texts(urls)
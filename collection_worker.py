@@ -0,0 +1,152 @@
+import json
+import threading
+from datetime import datetime, timedelta
+
+from dataset_writer import atomic_write_bytes, file_lock
+
+# 매일 뉴스 수집 시각
+COLLECTION_TIME = "09:00"
+# 켜짐 여부·마지막 실행 slot 등 세션·프로세스가 함께 보는 작업 상태
+STATE_PATH = "collection_state.json"
+# 실행할 slot이 왔는지 확인하는 주기
+POLL_SECONDS = 30
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def current_slot(now, at=COLLECTION_TIME):
+    """now 기준 가장 최근에 지난 실행 시각"""
+    hour, minute = (int(part) for part in at.split(':')[:2])
+    slot = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if slot > now:
+        slot -= timedelta(days=1)
+    return slot
+
+
+class CollectionWorker:
+    """프로세스당 하나만 두는 일일 수집 워커
+
+    켜짐 여부와 마지막 실행 slot은 상태 파일에 기록하고, slot 선점은 파일 잠금 안에서
+    확인과 기록을 함께 하므로 세션이나 워커 프로세스가 여럿이어도 slot마다 최대 한 번만 실행된다.
+    """
+
+    def __init__(self, job, state_path=STATE_PATH, at=COLLECTION_TIME, poll_seconds=POLL_SECONDS):
+        self.job = job
+        self.state_path = state_path
+        self.at = at
+        self.poll_seconds = poll_seconds
+        # 마지막으로 slot을 확인한 시각 (워커 스레드가 살아 있는지 확인용)
+        self.heartbeat = None
+        # 지금 실행 중인 slot (없으면 None)
+        self.running_slot = None
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+        # 이전 프로세스에서 켜 둔 상태면 이어서 실행
+        if self.read_state().get('enabled'):
+            self._start_thread()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def read_state(self):
+        """상태 파일 내용 (없거나 깨졌으면 빈 dict)"""
+        try:
+            with open(self.state_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_state(self, state):
+        atomic_write_bytes(self.state_path, json.dumps(state, ensure_ascii=False, indent=2).encode('utf-8'))
+
+    def _update_state(self, **changes):
+        """상태 파일 읽기-수정-쓰기 (선점 잠금 안에서)"""
+        with file_lock(f"{self.state_path}.claim"):
+            state = self.read_state()
+            state.update(changes)
+            self._write_state(state)
+            return state
+
+    def _start_thread(self):
+        with self._lock:
+            if self.running and not self._stop.is_set():
+                return
+            # 중지 중인 이전 스레드는 자기 이벤트를 보고 끝나도록 두고 새 이벤트로 시작
+            self._stop = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run, args=(self._stop,), name="collection-worker", daemon=True
+            )
+            self._thread.start()
+
+    def start(self, now=None):
+        """수집 켜기 (켠 시각 이전 slot은 실행하지 않음)"""
+        now = now or datetime.now()
+        with file_lock(f"{self.state_path}.claim"):
+            state = self.read_state()
+            if not state.get('enabled'):
+                state.update(enabled=True, enabled_at=now.strftime(TIME_FORMAT))
+                self._write_state(state)
+        self._start_thread()
+
+    def stop(self):
+        """수집 끄기 (실행 중인 수집은 끝까지 진행)"""
+        self._update_state(enabled=False)
+        self._stop.set()
+
+    def _claim(self, now):
+        """실행할 slot이 있으면 마지막 실행 slot으로 기록하고 반환"""
+        slot = current_slot(now, self.at).strftime(TIME_FORMAT)
+        with file_lock(f"{self.state_path}.claim"):
+            state = self.read_state()
+            if not state.get('enabled') or slot < state.get('enabled_at', '') or slot <= state.get('last_slot', ''):
+                return None
+            state.update(last_slot=slot, last_started=now.strftime(TIME_FORMAT))
+            self._write_state(state)
+        return slot
+
+    def run_once(self, now=None):
+        """지금 실행할 slot이 있으면 수집을 실행하고 실행 여부 반환"""
+        slot = self._claim(now or datetime.now())
+        if slot is None:
+            return False
+        self.running_slot = slot
+        try:
+            result = self.job()
+        except Exception as e:
+            self._update_state(
+                last_finished=datetime.now().strftime(TIME_FORMAT), last_result=None, last_error=str(e)
+            )
+        else:
+            self._update_state(
+                last_finished=datetime.now().strftime(TIME_FORMAT), last_result=result, last_error=None
+            )
+        finally:
+            self.running_slot = None
+        return True
+
+    def _run(self, stop):
+        while not stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"자동 수집 워커 오류: {e}")
+            self.heartbeat = datetime.now()
+            stop.wait(self.poll_seconds)
+
+    def status(self, now=None):
+        """모든 세션이 함께 보는 워커 상태"""
+        now = now or datetime.now()
+        state = self.read_state()
+        return {
+            'enabled': bool(state.get('enabled')),
+            'running': self.running,
+            'heartbeat': self.heartbeat,
+            'running_slot': self.running_slot,
+            'next_slot': current_slot(now, self.at) + timedelta(days=1),
+            'last_slot': state.get('last_slot'),
+            'last_finished': state.get('last_finished'),
+            'last_result': state.get('last_result'),
+            'last_error': state.get('last_error'),
+        }
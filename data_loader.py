@@ -0,0 +1,220 @@
+import os
+import re
+import threading
+from datetime import datetime
+
+import pandas as pd
+from pandas.api.types import CategoricalDtype
+
+import news_store
+from dataset_writer import atomic_writer
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    pa = None
+    STRING_DTYPE = object
+
+# 수집 쪽에서 발행하는 불변 Arrow IPC(Feather v2) 스냅샷 위치
+SNAPSHOT_DIR = "snapshots"
+SNAPSHOTS_TO_KEEP = 3
+_SNAPSHOT_RE = re.compile(r'^articles-(\d+)-(\d+)\.arrow$')
+
+# 화면·이메일에 표시하지 않는 파생/보조 컬럼을 포함한 로드 컬럼
+LOAD_COLUMNS = news_store.DISPLAY_COLUMNS + ['source']
+TEXT_COLUMNS = ['title', 'link', 'summary', 'keywords']
+CATEGORY_COLUMNS = ['date', 'source']
+
+
+def _file_signature(path):
+    """파일 식별자(inode)와 수정 시각, 크기 - 파일이 없으면 None"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+class ArticleLoader:
+    """저장소 파일 변경을 감지해 새로 추가된 기사만 읽어 합치는 로더"""
+
+    def __init__(self, db_path=news_store.DB_PATH, columns=None, snapshot_dir=SNAPSHOT_DIR):
+        self.db_path = db_path
+        self.snapshot_dir = snapshot_dir
+        self.columns = columns or LOAD_COLUMNS
+        self.frame = compact_frame(pd.DataFrame(columns=self.columns))
+        # 데이터가 바뀔 때마다 증가 (다른 캐시의 키로 사용)
+        self.version = 0
+        self._signature = None
+        self._count = 0
+        self._rev = 0
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def signature(self):
+        """WAL 모드에서는 -wal 파일에 먼저 기록되므로 두 파일을 함께 확인"""
+        return (_file_signature(self.db_path), _file_signature(f"{self.db_path}-wal"))
+
+    def invalidate(self):
+        """다음 load()에서 전체를 다시 읽도록 표시"""
+        with self._lock:
+            self._signature = None
+            self._loaded = False
+            self._rev = 0
+
+    def load(self):
+        """최신 기사 DataFrame 반환 (파일이 그대로면 캐시 사용)"""
+        return self.load_versioned()[1]
+
+    def load_versioned(self):
+        """(데이터 버전, 기사 DataFrame)을 같은 잠금 안에서 함께 반환
+
+        프레임과 함께 쓰는 캐시는 이 버전을 키로 써야 다른 세션이 더 새 버전을 읽은 뒤에도
+        자기 프레임과 맞는 색인을 얻는다.
+        """
+        with self._lock:
+            frame = self._load()
+            return self.version, frame
+
+    def _load(self):
+        """잠금을 잡은 상태에서 호출 - 바뀐 부분만 읽어 프레임 갱신"""
+        signature = self.signature()
+        if self._loaded and signature == self._signature:
+            return self.frame
+        previous = self.frame
+        if not self._loaded:
+            news_store.ensure_seeded(db_path=self.db_path)
+            self._load_snapshot()
+        changed, count, max_rev = news_store.load_changes(
+            self._rev, columns=self.columns, db_path=self.db_path
+        )
+        appended = not changed.index.isin(self.frame.index).any()
+        if self._rev and appended and count == self._count + len(changed):
+            # 추가만 된 경우: 새 행만 합치기
+            if len(changed):
+                self.frame = append_compact(self.frame, self._prepare(changed))
+        else:
+            # 갱신·삭제가 있거나 처음 로드하는 경우: 전체 다시 읽기
+            if self._rev:
+                changed, count, max_rev = news_store.load_changes(
+                    0, columns=self.columns, db_path=self.db_path
+                )
+            self.frame = self._prepare(changed)
+        # 스냅샷으로 바뀐 경우를 포함해 프레임이 바뀌면 항상 버전을 올림 (버전을 키로 쓰는 캐시 무효화)
+        if self.frame is not previous:
+            self.version += 1
+        self._count, self._rev = count, max_rev
+        # 읽기 전에 잡은 시그니처를 저장해 읽는 도중의 변경도 다음 번에 감지
+        self._signature = signature
+        self._loaded = True
+        return self.frame
+
+    def _load_snapshot(self):
+        """최신 스냅샷을 메모리 매핑해 기준 프레임으로 사용 (이후 변경분만 저장소에서 읽음)"""
+        self.frame = compact_frame(pd.DataFrame(columns=self.columns))
+        self._count = self._rev = 0
+        snapshot = latest_snapshot(self.snapshot_dir)
+        if snapshot is None:
+            return
+        path, rev, count = snapshot
+        try:
+            frame = read_snapshot(path)
+        except Exception:
+            return
+        if list(frame.columns[:len(self.columns)]) == list(self.columns):
+            self.frame, self._rev, self._count = frame, rev, count
+
+    def _prepare(self, df):
+        """날짜가 없는 행은 오늘 날짜로 채우고 압축 스키마로 변환"""
+        if 'date' in df.columns:
+            df['date'] = df['date'].fillna(datetime.now().strftime('%Y-%m-%d'))
+        return compact_frame(df)
+
+
+def compact_frame(df):
+    """메모리 절약형 스키마로 변환한 새 프레임 (넘겨받은 프레임은 바꾸지 않음)
+
+    반복 문자열은 Arrow 문자열/범주형으로, 날짜는 datetime64로 파싱하고
+    요약 길이(summary_len)는 미리 계산해 둔다.
+    """
+    # 얕은 복사본에 컬럼을 통째로 바꿔 넣으므로 원본 데이터는 복사하지 않음
+    df = df.copy(deep=False)
+    for col in TEXT_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype(STRING_DTYPE)
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    if 'date' in df.columns:
+        df['published'] = pd.to_datetime(df['date'].astype(object), errors='coerce')
+    if 'summary' in df.columns:
+        df['summary_len'] = df['summary'].str.len().fillna(0).astype('int32')
+    return df
+
+
+def append_compact(frame, tail):
+    """범주형 컬럼의 범주를 맞춘 뒤 이어 붙이기 (object로 되돌아가지 않도록)"""
+    for col in CATEGORY_COLUMNS:
+        if col in frame.columns and col in tail.columns:
+            missing = tail[col].cat.categories.difference(frame[col].cat.categories)
+            if len(missing):
+                # 공유 중인 프레임을 수정하지 않도록 새 프레임으로 교체
+                frame = frame.assign(**{col: frame[col].cat.add_categories(missing)})
+            tail[col] = tail[col].astype(CategoricalDtype(frame[col].cat.categories))
+    return pd.concat([frame, tail])
+
+
+def _arrow_types_mapper(arrow_type):
+    """Arrow 문자열을 복사 없이 pandas Arrow 문자열 컬럼으로 매핑"""
+    if arrow_type in (pa.string(), pa.large_string()):
+        return pd.StringDtype('pyarrow')
+    return None
+
+
+def latest_snapshot(snapshot_dir=SNAPSHOT_DIR):
+    """가장 최신 스냅샷 (경로, rev, 기사 수) - 없으면 None"""
+    try:
+        names = os.listdir(snapshot_dir)
+    except FileNotFoundError:
+        return None
+    found = [(int(m.group(1)), int(m.group(2)), name)
+             for name in names if (m := _SNAPSHOT_RE.match(name))]
+    if not found or pa is None:
+        return None
+    rev, count, name = max(found)
+    return os.path.join(snapshot_dir, name), rev, count
+
+
+def read_snapshot(path):
+    """스냅샷 파일을 메모리 매핑으로 읽기 (OS 페이지 캐시를 프로세스 간 공유)"""
+    table = feather.read_table(path, memory_map=True)
+    return table.to_pandas(types_mapper=_arrow_types_mapper, split_blocks=True)
+
+
+def publish_snapshot(db_path=news_store.DB_PATH, snapshot_dir=SNAPSHOT_DIR):
+    """저장소 전체를 새 버전의 불변 스냅샷으로 발행하고 오래된 스냅샷 정리"""
+    if pa is None:
+        return None
+    frame, count, rev = news_store.load_changes(0, columns=LOAD_COLUMNS, db_path=db_path)
+    frame['date'] = frame['date'].fillna(datetime.now().strftime('%Y-%m-%d'))
+    frame = compact_frame(frame)
+    os.makedirs(snapshot_dir, exist_ok=True)
+    path = os.path.join(snapshot_dir, f"articles-{rev:012d}-{count:012d}.arrow")
+    if not os.path.exists(path):
+        # 메모리 매핑이 가능하도록 압축 없이 고유한 임시 파일에 기록하고 fsync 후 원자적으로 이름 변경
+        with atomic_writer(path, lock=False) as f:
+            feather.write_feather(
+                pa.Table.from_pandas(frame, preserve_index=True), f, compression='uncompressed'
+            )
+    snapshots = sorted(
+        (name for name in os.listdir(snapshot_dir) if _SNAPSHOT_RE.match(name)), reverse=True
+    )
+    for name in snapshots[SNAPSHOTS_TO_KEEP:]:
+        try:
+            os.remove(os.path.join(snapshot_dir, name))
+        except OSError:
+            # 다른 프로세스가 아직 매핑 중이면 다음 발행 때 정리
+            pass
+    return path
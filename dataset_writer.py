@@ -0,0 +1,163 @@
+import os
+import queue
+import stat
+import tempfile
+import threading
+from contextlib import contextmanager, nullcontext
+
+import news_store
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# 새 파일 기본 권한 계산용 umask (읽으려면 바꿔야 하므로 import 시 한 번만)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@contextmanager
+def file_lock(path):
+    """경로 옆의 .lock 파일에 거는 프로세스 간 배타적 권고 잠금"""
+    lock_path = f"{path}.lock"
+    with open(lock_path, 'a+b') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _fsync_dir(directory):
+    """이름 변경이 디스크에 반영되도록 디렉터리 fsync (POSIX만)"""
+    if fcntl is None:
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _file_mode(path):
+    """기존 파일의 권한 (없으면 umask를 적용한 새 파일 기본 권한)"""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+@contextmanager
+def atomic_writer(path, lock=True):
+    """임시 파일을 열어 주고 블록이 끝나면 fsync 후 원자적으로 이름 변경
+
+    mkstemp는 0600으로 만들므로 이름을 바꾸기 전에 기존 파일(없으면 기본) 권한으로 맞춘다.
+    한 번만 쓰는 불변 파일처럼 쓰는 쪽이 겹치지 않으면 lock=False로 잠금 파일을 만들지 않는다.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    with (file_lock(path) if lock else nullcontext()):
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                yield f
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_path, _file_mode(path))
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        _fsync_dir(directory)
+
+
+def atomic_write_bytes(path, data):
+    """임시 파일에 쓰고 fsync 후 원자적으로 이름 변경"""
+    with atomic_writer(path) as f:
+        f.write(data)
+
+
+def atomic_write_csv(df, path):
+    """DataFrame을 CSV로 원자적 저장 (읽는 쪽은 항상 완전한 파일만 봄)"""
+    atomic_write_bytes(path, df.to_csv(index=False).encode('utf-8-sig'))
+
+
+class ArticleWriter:
+    """기사 추가 요청을 한 스레드에서 모아 한 트랜잭션으로 저장하는 단일 writer 큐"""
+
+    def __init__(self, db_path=news_store.DB_PATH):
+        self.db_path = db_path
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="article-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, articles):
+        """기사 목록을 큐에 넣고 완료 대기용 요청 객체 반환"""
+        request = {'articles': list(articles), 'done': threading.Event(), 'error': None}
+        self._queue.put(request)
+        return request
+
+    def append(self, articles, timeout=None):
+        """기사 목록을 저장하고 완료될 때까지 대기"""
+        request = self.submit(articles)
+        if not request['done'].wait(timeout):
+            raise TimeoutError("기사 저장 대기 시간 초과")
+        if request['error'] is not None:
+            raise request['error']
+        return len(request['articles'])
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            # 대기 중인 요청을 모두 모아 한 번에 저장
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            error = None
+            try:
+                with file_lock(self.db_path):
+                    news_store.upsert_articles(
+                        [article for request in batch for article in request['articles']],
+                        db_path=self.db_path
+                    )
+            except Exception as e:
+                error = e
+            for request in batch:
+                request['error'] = error
+                request['done'].set()
+
+
+_writers = {}
+_writers_lock = threading.Lock()
+
+
+def get_writer(db_path=news_store.DB_PATH):
+    """프로세스당 저장소별 단일 writer 반환"""
+    with _writers_lock:
+        writer = _writers.get(db_path)
+        if writer is None:
+            writer = _writers[db_path] = ArticleWriter(db_path)
+        return writer
+
+
+def append_articles(articles, db_path=news_store.DB_PATH):
+    """단일 writer 큐를 통해 기사 추가"""
+    return get_writer(db_path).append(articles)
+
+
+def replace_articles(articles, db_path=news_store.DB_PATH):
+    """잠금을 잡고 저장소 전체 교체"""
+    with file_lock(db_path):
+        return news_store.replace_articles(articles, db_path=db_path)
@@ -0,0 +1,129 @@
+import html
+from datetime import datetime
+from string import Template
+
+import pandas as pd
+
+import news_store
+from mail_delivery import build_message, zip_csv
+
+# 이메일 본문 표에 넣는 최대 기사 수 (전체 데이터는 압축 CSV 첨부로 전달)
+EMAIL_TABLE_ROWS = 50
+# 다이제스트를 처음 받는 수신자에게 보내는 최근 기사 수
+DIGEST_FIRST_LIMIT = 50
+
+# 모듈 로드 시 한 번 만들어 모든 보고서·수신자에 재사용하는 템플릿
+REPORT_TEMPLATE = Template("""
+<html>
+<head>
+    <style>
+        table { border-collapse: collapse; width: 100%; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f2f2f2; }
+        .header { color: #2E86AB; font-size: 24px; margin-bottom: 20px; }
+        .summary { background-color: #f9f9f9; padding: 10px; margin: 10px 0; }
+    </style>
+</head>
+<body>
+    <div class="header">📰 $heading</div>
+    <p><strong>생성 일시:</strong> $generated_at</p>
+    <p><strong>총 기사 수:</strong> ${article_count}개</p>
+
+    <h3>📊 분석 결과$table_note</h3>
+    <table>
+        <thead><tr><th>제목</th><th>요약</th><th>키워드</th><th>날짜</th></tr></thead>
+        <tbody>
+$rows
+        </tbody>
+    </table>
+
+    <div class="summary">
+        <h3>📈 요약 통계</h3>
+        <ul>
+            <li>평균 요약 길이: ${avg_summary_length}자</li>
+            <li>총 키워드 수: ${total_keywords}개</li>
+        </ul>
+    </div>
+
+    <p><em>이 보고서는 자동으로 생성되었습니다.</em></p>
+</body>
+</html>
+""")
+ROW_TEMPLATE = Template(
+    '            <tr><td><a href="$link">$title</a></td><td>$summary</td><td>$keywords</td><td>$date</td></tr>'
+)
+
+
+def _cell(value):
+    return '' if pd.isna(value) else html.escape(str(value))
+
+
+def render_rows(df):
+    """상위 EMAIL_TABLE_ROWS개 기사의 표 행 HTML"""
+    return '\n'.join(
+        ROW_TEMPLATE.substitute(
+            link=_cell(row.link), title=_cell(row.title), summary=_cell(row.summary),
+            keywords=_cell(row.keywords), date=_cell(row.date)
+        )
+        for row in df.head(EMAIL_TABLE_ROWS).itertuples(index=False)
+    )
+
+
+def render_report_html(df, avg_summary_length, total_keywords, generated_at=None,
+                       heading="디지털 헬스케어 뉴스 분석 보고서"):
+    """상위 기사 표와 요약 통계가 들어간 보고서 HTML 본문"""
+    generated_at = generated_at or datetime.now()
+    return REPORT_TEMPLATE.substitute(
+        heading=heading,
+        generated_at=generated_at.strftime('%Y년 %m월 %d일 %H시 %M분'),
+        article_count=len(df),
+        table_note=f" (상위 {EMAIL_TABLE_ROWS}개 기사, 전체는 첨부 파일 참고)" if len(df) > EMAIL_TABLE_ROWS else "",
+        rows=render_rows(df),
+        avg_summary_length=f"{avg_summary_length:.0f}",
+        total_keywords=total_keywords,
+    )
+
+
+def build_report_payload(subject, df, sender_email, recipients, avg_summary_length, total_keywords,
+                         heading="디지털 헬스케어 뉴스 분석 보고서"):
+    """상위 기사 HTML 표와 전체 데이터 zip(CSV) 첨부가 들어간 보고서 메시지 바이트"""
+    html_body = render_report_html(df, avg_summary_length, total_keywords, heading=heading)
+    # 전체 데이터는 CSV를 조각별로 압축한 zip으로 첨부
+    filename = f"news_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    archive = zip_csv(df, f"{filename}.csv", columns=news_store.DISPLAY_COLUMNS)
+    return build_message(
+        sender_email, subject, html_body,
+        attachments=[(f"{filename}.zip", archive)], recipients=recipients
+    )
+
+
+def build_store_report(subject, sender_email, recipients, db_path=news_store.DB_PATH):
+    """저장소 전체 기사로 보고서 메시지 생성 (화면 없이 예약 전송 작업에서 사용)"""
+    df = news_store.load_articles(db_path=db_path)
+    aggregates = news_store.load_aggregates(db_path=db_path)
+    return build_report_payload(
+        subject, df, sender_email, recipients,
+        aggregates['avg_summary_length'], aggregates['keyword_total']
+    )
+
+
+def build_digest(subject, sender_email, recipients, since_rev=None, db_path=news_store.DB_PATH):
+    """since_rev 이후 새로 들어온 기사만 담은 다이제스트 (메시지 바이트, 포함한 최대 rev)
+
+    rev 색인으로 새 행만 읽으므로 보관된 기사 수와 무관하게 새 기사 수에만 비례한다.
+    since_rev가 None(처음 받는 수신자)이면 최근 DIGEST_FIRST_LIMIT개, 새 기사가 없으면 None.
+    """
+    df = news_store.load_articles_since(
+        since_rev, limit=DIGEST_FIRST_LIMIT if since_rev is None else None, db_path=db_path
+    )
+    if df.empty:
+        return None
+    first_rev, last_rev = int(df['rev'].min()), int(df['rev'].max())
+    avg_summary_length = df['summary'].fillna('').str.len().mean()
+    # 키워드 수는 저장할 때 정규화해 둔 기사→키워드 테이블에서 같은 rev 범위로 셈
+    total_keywords = news_store.count_keywords_in_revs(first_rev, last_rev, db_path=db_path)
+    payload = build_report_payload(
+        subject, df, sender_email, recipients, avg_summary_length, total_keywords,
+        heading="디지털 헬스케어 새 기사 다이제스트"
+    )
+    return payload, last_rev
@@ -0,0 +1,513 @@
+import calendar
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+import email_report
+from mail_delivery import get_mailer, parse_recipients
+
+# 예약 전송 일정·작업 큐·감사 로그 저장소 (기사 저장소와 분리된 SQLite)
+SCHEDULE_DB_PATH = "email_schedule.db"
+# 예약 전송에 쓰는 발신 계정 앱 비밀번호 (저장소에는 비밀번호를 기록하지 않음)
+PASSWORD_ENV = "NEWS_SMTP_PASSWORD"
+
+FREQUENCIES = ('daily', 'weekly', 'monthly')
+# 전체 보고서 또는 수신자별로 지난 다이제스트 이후 새 기사만 담은 다이제스트
+REPORT_KINDS = ('full', 'digest')
+# 실패한 전송의 최대 시도 횟수와 재시도 대기 시간 (시도마다 두 배)
+MAX_ATTEMPTS = 5
+RETRY_BASE_SECONDS = 60
+# 작업 큐 확인 주기
+POLL_SECONDS = 30
+# 전송 한 건의 최대 대기 시간 (이보다 오래 running인 작업은 중단된 것으로 보고 다시 시도)
+SEND_TIMEOUT = 600
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS email_schedules (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sender TEXT NOT NULL,
+    recipients TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    frequency TEXT NOT NULL,
+    send_time TEXT NOT NULL,
+    weekday INTEGER,
+    day INTEGER,
+    enabled INTEGER NOT NULL DEFAULT 1,
+    next_run TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+
+-- 일정의 실행 시각(slot)마다 한 건 (같은 slot은 여러 워커가 있어도 한 번만 생성)
+CREATE TABLE IF NOT EXISTS email_deliveries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    schedule_id INTEGER NOT NULL,
+    slot TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt TEXT NOT NULL,
+    sent INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    updated_at TEXT NOT NULL,
+    UNIQUE (schedule_id, slot)
+);
+CREATE INDEX IF NOT EXISTS idx_email_deliveries_due ON email_deliveries(status, next_attempt);
+
+-- 전송 작업별로 결과가 확정된 수신자 (재시도 때는 여기 없는 수신자에게만 보냄)
+CREATE TABLE IF NOT EXISTS email_delivery_recipients (
+    delivery_id INTEGER NOT NULL,
+    recipient TEXT NOT NULL,
+    status TEXT NOT NULL,
+    detail TEXT,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (delivery_id, recipient)
+);
+
+CREATE TABLE IF NOT EXISTS email_audit (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    at TEXT NOT NULL,
+    schedule_id INTEGER,
+    delivery_id INTEGER,
+    event TEXT NOT NULL,
+    detail TEXT
+);
+
+-- 수신자별 다이제스트 기준점 (마지막으로 받은 기사 rev)
+CREATE TABLE IF NOT EXISTS digest_marks (
+    recipient TEXT PRIMARY KEY,
+    rev INTEGER NOT NULL,
+    updated_at TEXT NOT NULL
+);
+"""
+
+# 스키마 버전별 마이그레이션 (PRAGMA user_version)
+SCHEMA_VERSION = 1
+
+
+def _format(moment):
+    return moment.strftime(TIME_FORMAT)
+
+
+def _migrate(conn):
+    """이전 버전 일정 저장소를 현재 스키마로 갱신"""
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version < 1:
+        # 보고서 종류 도입 이전 일정은 전체 보고서
+        conn.execute("ALTER TABLE email_schedules ADD COLUMN report TEXT NOT NULL DEFAULT 'full'")
+    if version < SCHEMA_VERSION:
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+def connect(db_path=SCHEDULE_DB_PATH):
+    """WAL 모드로 연결하고 스키마 생성 (트랜잭션은 호출하는 쪽에서 명시적으로 시작)"""
+    conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    _migrate(conn)
+    return conn
+
+
+def _audit(conn, event, schedule_id=None, delivery_id=None, detail=None, now=None):
+    conn.execute(
+        "INSERT INTO email_audit (at, schedule_id, delivery_id, event, detail) VALUES (?, ?, ?, ?, ?)",
+        (_format(now or datetime.now()), schedule_id, delivery_id, event, detail)
+    )
+
+
+def next_run(frequency, send_time, after, weekday=None, day=None):
+    """after 이후 처음 오는 실행 시각 (매주는 weekday 0=월요일, 매월은 day일 - 없는 날은 말일)"""
+    hour, minute = (int(part) for part in send_time.split(':')[:2])
+    candidate = after.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if frequency == 'daily':
+        if candidate <= after:
+            candidate += timedelta(days=1)
+    elif frequency == 'weekly':
+        candidate += timedelta(days=(weekday - candidate.weekday()) % 7)
+        if candidate <= after:
+            candidate += timedelta(days=7)
+    elif frequency == 'monthly':
+        def on_day(year, month):
+            return candidate.replace(year=year, month=month, day=min(day, calendar.monthrange(year, month)[1]))
+        candidate = on_day(after.year, after.month)
+        if candidate <= after:
+            candidate = on_day(after.year + after.month // 12, after.month % 12 + 1)
+    else:
+        raise ValueError(f"알 수 없는 전송 주기: {frequency}")
+    return candidate
+
+
+def add_schedule(sender, recipients, subject, frequency, send_time, weekday=None, day=None, report='full',
+                 db_path=SCHEDULE_DB_PATH, now=None):
+    """예약 전송 일정 추가 후 (일정 ID, 첫 실행 시각) 반환"""
+    now = now or datetime.now()
+    if frequency not in FREQUENCIES:
+        raise ValueError(f"알 수 없는 전송 주기: {frequency}")
+    if report not in REPORT_KINDS:
+        raise ValueError(f"알 수 없는 보고서 종류: {report}")
+    if not parse_recipients(recipients):
+        raise ValueError("수신자가 없습니다")
+    first = next_run(frequency, send_time, now, weekday, day)
+    with closing(connect(db_path)) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        schedule_id = conn.execute(
+            "INSERT INTO email_schedules (sender, recipients, subject, frequency, send_time, weekday, day, "
+            "report, next_run, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (sender, recipients, subject, frequency, send_time, weekday, day, report, _format(first), _format(now))
+        ).lastrowid
+        _audit(conn, 'schedule_added', schedule_id,
+               detail=f"{frequency} {send_time} {report} → {recipients}", now=now)
+        conn.execute("COMMIT")
+    return schedule_id, first
+
+
+def set_enabled(schedule_id, enabled, db_path=SCHEDULE_DB_PATH, now=None):
+    """일정 켜기/끄기 (다시 켜면 지금 이후 첫 실행 시각부터)"""
+    now = now or datetime.now()
+    with closing(connect(db_path)) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        row = conn.execute("SELECT * FROM email_schedules WHERE id = ?", (schedule_id,)).fetchone()
+        if row is not None:
+            upcoming = next_run(row['frequency'], row['send_time'], now, row['weekday'], row['day'])
+            conn.execute(
+                "UPDATE email_schedules SET enabled = ?, next_run = ? WHERE id = ?",
+                (int(enabled), _format(upcoming), schedule_id)
+            )
+            _audit(conn, 'schedule_enabled' if enabled else 'schedule_disabled', schedule_id, now=now)
+        conn.execute("COMMIT")
+
+
+def delete_schedule(schedule_id, db_path=SCHEDULE_DB_PATH, now=None):
+    """일정 삭제 (아직 보내지 않은 전송 작업도 함께 취소, 감사 로그는 유지)"""
+    with closing(connect(db_path)) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("DELETE FROM email_schedules WHERE id = ?", (schedule_id,))
+        conn.execute(
+            "DELETE FROM email_deliveries WHERE schedule_id = ? AND status IN ('pending', 'retry')",
+            (schedule_id,)
+        )
+        _audit(conn, 'schedule_deleted', schedule_id, now=now)
+        conn.execute("COMMIT")
+
+
+def load_schedules(db_path=SCHEDULE_DB_PATH):
+    with closing(connect(db_path)) as conn:
+        return pd.read_sql_query("SELECT * FROM email_schedules ORDER BY id", conn)
+
+
+def load_deliveries(limit=50, db_path=SCHEDULE_DB_PATH):
+    """최근 전송 작업 (최근 slot 순)"""
+    with closing(connect(db_path)) as conn:
+        return pd.read_sql_query(
+            "SELECT * FROM email_deliveries ORDER BY slot DESC, id DESC LIMIT ?", conn, params=(limit,)
+        )
+
+
+def load_audit(limit=100, db_path=SCHEDULE_DB_PATH):
+    """최근 감사 로그"""
+    with closing(connect(db_path)) as conn:
+        return pd.read_sql_query("SELECT * FROM email_audit ORDER BY id DESC LIMIT ?", conn, params=(limit,))
+
+
+def enqueue_due(db_path=SCHEDULE_DB_PATH, now=None):
+    """실행 시각이 지난 일정마다 전송 작업을 한 건 넣고 다음 실행 시각으로 이동
+
+    워커가 멈춰 있던 동안 여러 slot이 지나갔어도 몰아서 보내지 않고 한 번만 보낸다.
+    """
+    now = now or datetime.now()
+    created = 0
+    with closing(connect(db_path)) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        due = conn.execute(
+            "SELECT * FROM email_schedules WHERE enabled = 1 AND next_run <= ?", (_format(now),)
+        ).fetchall()
+        for row in due:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO email_deliveries (schedule_id, slot, status, next_attempt, updated_at) "
+                "VALUES (?, ?, 'pending', ?, ?)",
+                (row['id'], row['next_run'], _format(now), _format(now))
+            )
+            if cursor.rowcount:
+                created += 1
+                _audit(conn, 'enqueued', row['id'], cursor.lastrowid, detail=row['next_run'], now=now)
+            upcoming = next_run(row['frequency'], row['send_time'], now, row['weekday'], row['day'])
+            conn.execute("UPDATE email_schedules SET next_run = ? WHERE id = ?", (_format(upcoming), row['id']))
+        conn.execute("COMMIT")
+    return created
+
+
+def recover_stale(db_path=SCHEDULE_DB_PATH, now=None):
+    """워커가 전송 중에 종료되어 running으로 남은 작업을 재시도 대상으로 되돌림"""
+    now = now or datetime.now()
+    cutoff = _format(now - timedelta(seconds=SEND_TIMEOUT * 2))
+    with closing(connect(db_path)) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        stale = conn.execute(
+            "SELECT id, schedule_id FROM email_deliveries WHERE status = 'running' AND updated_at < ?", (cutoff,)
+        ).fetchall()
+        for row in stale:
+            conn.execute(
+                "UPDATE email_deliveries SET status = 'retry', next_attempt = ?, updated_at = ? WHERE id = ?",
+                (_format(now), _format(now), row['id'])
+            )
+            _audit(conn, 'recovered', row['schedule_id'], row['id'], now=now)
+        conn.execute("COMMIT")
+    return len(stale)
+
+
+def claim_next(db_path=SCHEDULE_DB_PATH, now=None):
+    """보낼 차례인 작업 하나를 running으로 바꿔 가져옴 (여러 워커가 같은 작업을 잡지 않음)"""
+    now = now or datetime.now()
+    with closing(connect(db_path)) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        row = conn.execute(
+            "SELECT d.id, d.schedule_id, d.slot, d.attempts, s.sender, s.recipients, s.subject, s.report "
+            "FROM email_deliveries d JOIN email_schedules s ON s.id = d.schedule_id "
+            "WHERE d.status IN ('pending', 'retry') AND d.next_attempt <= ? "
+            "ORDER BY d.next_attempt, d.id LIMIT 1",
+            (_format(now),)
+        ).fetchone()
+        if row is not None:
+            conn.execute(
+                "UPDATE email_deliveries SET status = 'running', attempts = attempts + 1, updated_at = ? "
+                "WHERE id = ?",
+                (_format(now), row['id'])
+            )
+            _audit(conn, 'started', row['schedule_id'], row['id'], detail=f"시도 {row['attempts'] + 1}", now=now)
+        conn.execute("COMMIT")
+    if row is None:
+        return None
+    delivery = dict(row)
+    delivery['attempts'] += 1
+    return delivery
+
+
+def load_finished_recipients(delivery_id, db_path=SCHEDULE_DB_PATH):
+    """이 전송 작업에서 이미 보냈거나 거부된 수신자"""
+    with closing(connect(db_path)) as conn:
+        rows = conn.execute(
+            "SELECT recipient FROM email_delivery_recipients WHERE delivery_id = ?", (delivery_id,)
+        ).fetchall()
+    return {row['recipient'] for row in rows}
+
+
+def record_recipients(delivery, job, db_path=SCHEDULE_DB_PATH, now=None):
+    """메일 서버가 받은 수신자와 거부한 수신자를 기록하고 작업의 누적 전송·실패 수 갱신
+
+    전송이 중간에 실패해도 호출하므로, 재시도는 여기 기록되지 않은 수신자에게만 보낸다.
+    거부된 수신자는 감사 로그에 사유와 함께 남긴다.
+    """
+    now = now or datetime.now()
+    with closing(connect(db_path)) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(
+            "INSERT OR REPLACE INTO email_delivery_recipients (delivery_id, recipient, status, detail, updated_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(delivery['id'], recipient, 'sent', None, _format(now)) for recipient in job['delivered']]
+            + [(delivery['id'], recipient, 'refused', reason, _format(now))
+               for recipient, reason in job['failed'].items()]
+        )
+        for recipient, reason in job['failed'].items():
+            _audit(conn, 'recipient_refused', delivery['schedule_id'], delivery['id'],
+                   detail=f"{recipient}: {reason}", now=now)
+        conn.execute(
+            "UPDATE email_deliveries SET "
+            "sent = (SELECT COUNT(*) FROM email_delivery_recipients WHERE delivery_id = :id AND status = 'sent'), "
+            "failed = (SELECT COUNT(*) FROM email_delivery_recipients WHERE delivery_id = :id AND status = 'refused'), "
+            "updated_at = :now WHERE id = :id",
+            {'id': delivery['id'], 'now': _format(now)}
+        )
+        conn.execute("COMMIT")
+
+
+def record_result(delivery, job, db_path=SCHEDULE_DB_PATH, now=None):
+    """전송 완료 기록 (수신자별 결과는 record_recipients로 이미 기록됨)"""
+    now = now or datetime.now()
+    with closing(connect(db_path)) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute(
+            "UPDATE email_deliveries SET status = 'sent', error = NULL, updated_at = ? WHERE id = ?",
+            (_format(now), delivery['id'])
+        )
+        counts = conn.execute(
+            "SELECT sent, failed FROM email_deliveries WHERE id = ?", (delivery['id'],)
+        ).fetchone()
+        detail = f"{counts['sent']}명 전송, {counts['failed']}명 실패"
+        if job.get('skipped'):
+            detail += f", 새 기사가 없어 {job['skipped']}명 건너뜀"
+        _audit(conn, 'sent', delivery['schedule_id'], delivery['id'], detail=detail, now=now)
+        conn.execute("COMMIT")
+
+
+def record_failure(delivery, error, db_path=SCHEDULE_DB_PATH, now=None):
+    """실패 기록 - 시도 횟수가 남았으면 지수 백오프 뒤 재시도, 아니면 failed"""
+    now = now or datetime.now()
+    retry = delivery['attempts'] < MAX_ATTEMPTS
+    next_attempt = now + timedelta(seconds=RETRY_BASE_SECONDS * 2 ** (delivery['attempts'] - 1))
+    with closing(connect(db_path)) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute(
+            "UPDATE email_deliveries SET status = ?, next_attempt = ?, error = ?, updated_at = ? WHERE id = ?",
+            ('retry' if retry else 'failed', _format(next_attempt), str(error), _format(now), delivery['id'])
+        )
+        _audit(conn, 'retry' if retry else 'failed', delivery['schedule_id'], delivery['id'],
+               detail=f"{error}" + (f" (다음 시도 {_format(next_attempt)})" if retry else ""), now=now)
+        conn.execute("COMMIT")
+
+
+def load_marks(recipients, db_path=SCHEDULE_DB_PATH):
+    """수신자별 마지막 다이제스트 rev (받은 적 없는 수신자는 빠짐)"""
+    recipients = list(recipients)
+    if not recipients:
+        return {}
+    with closing(connect(db_path)) as conn:
+        rows = conn.execute(
+            f"SELECT recipient, rev FROM digest_marks WHERE recipient IN ({', '.join('?' for _ in recipients)})",
+            recipients
+        ).fetchall()
+    return {row['recipient']: row['rev'] for row in rows}
+
+
+def advance_marks(recipients, rev, db_path=SCHEDULE_DB_PATH, now=None):
+    """다이제스트를 받은 수신자의 기준점을 rev로 올림 (뒤로 가지는 않음)"""
+    now = now or datetime.now()
+    with closing(connect(db_path)) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(
+            "INSERT INTO digest_marks (recipient, rev, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(recipient) DO UPDATE SET rev = MAX(rev, excluded.rev), updated_at = excluded.updated_at",
+            [(recipient, rev, _format(now)) for recipient in recipients]
+        )
+        conn.execute("COMMIT")
+
+
+class EmailDispatcher:
+    """예약 전송 작업 큐를 주기적으로 처리하는 백그라운드 워커
+
+    일정·작업·결과는 모두 저장소에 있으므로 브라우저 세션과 무관하게 동작하고,
+    프로세스가 다시 시작되어도 남은 작업을 이어서 처리한다.
+    """
+
+    def __init__(self, build_report=email_report.build_store_report, build_digest=email_report.build_digest,
+                 db_path=SCHEDULE_DB_PATH, poll_seconds=POLL_SECONDS):
+        self.build_report = build_report
+        self.build_digest = build_digest
+        self.db_path = db_path
+        self.poll_seconds = poll_seconds
+        # 마지막으로 큐를 확인한 시각 (워커가 살아 있는지 확인용)
+        self.heartbeat = None
+        self.last_error = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        with self._lock:
+            if not self.running:
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="email-dispatcher", daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def run_once(self, now=None):
+        """밀린 일정 적재 후 보낼 차례인 작업을 모두 처리하고 처리 건수 반환"""
+        recover_stale(db_path=self.db_path, now=now)
+        enqueue_due(db_path=self.db_path, now=now)
+        processed = 0
+        while not self._stop.is_set():
+            delivery = claim_next(db_path=self.db_path, now=now)
+            if delivery is None:
+                break
+            self._deliver(delivery, now)
+            processed += 1
+        return processed
+
+    def _deliver(self, delivery, now=None):
+        try:
+            password = os.environ.get(PASSWORD_ENV)
+            if not password:
+                raise RuntimeError(f"환경 변수 {PASSWORD_ENV}에 발신 계정 앱 비밀번호가 없습니다")
+            # 이전 시도에서 이미 보냈거나 거부된 수신자는 빼고 보냄
+            finished = load_finished_recipients(delivery['id'], db_path=self.db_path)
+            recipients = [r for r in parse_recipients(delivery['recipients']) if r not in finished]
+            slot = datetime.strptime(delivery['slot'], TIME_FORMAT)
+            subject = f"{delivery['subject']} - {slot.strftime('%Y.%m.%d')}"
+            if delivery['report'] == 'digest':
+                job = self._send_digests(delivery, password, subject, recipients, now)
+            elif recipients:
+                payload = self.build_report(subject, delivery['sender'], recipients)
+                job = self._send(delivery, password, recipients, payload, now)
+            else:
+                job = {}
+        except Exception as e:
+            record_failure(delivery, e, db_path=self.db_path, now=now)
+        else:
+            record_result(delivery, job, db_path=self.db_path, now=now)
+
+    def _send(self, delivery, password, recipients, payload, now=None, on_delivered=None):
+        """전송 후 수신자별 결과를 기록하고, 중간에 실패했으면 (기록한 뒤) 오류를 다시 냄"""
+        job = get_mailer().send(delivery['sender'], password, recipients, payload, timeout=SEND_TIMEOUT)
+        if on_delivered is not None and job['delivered']:
+            on_delivered(job['delivered'])
+        record_recipients(delivery, job, db_path=self.db_path, now=now)
+        if job['error'] is not None:
+            raise job['error']
+        return job
+
+    def _send_digests(self, delivery, password, subject, recipients, now=None):
+        """기준점이 같은 수신자끼리 묶어 묶음마다 다이제스트를 한 번 만들어 전송
+
+        받은 수신자만 기준점을 올리므로, 재시도해도 이미 받은 수신자에게 같은 기사를 다시 보내지 않는다.
+        """
+        groups = {}
+        marks = load_marks(recipients, db_path=self.db_path)
+        for recipient in recipients:
+            groups.setdefault(marks.get(recipient), []).append(recipient)
+        result = {'skipped': 0}
+        for since_rev, group in groups.items():
+            digest = self.build_digest(subject, delivery['sender'], group, since_rev)
+            if digest is None:
+                result['skipped'] += len(group)
+                continue
+            payload, rev = digest
+            self._send(
+                delivery, password, group, payload, now,
+                on_delivered=lambda delivered, rev=rev: advance_marks(delivered, rev, db_path=self.db_path, now=now)
+            )
+        return result
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = e
+                print(f"예약 이메일 전송 오류: {e}")
+            self.heartbeat = datetime.now()
+            self._stop.wait(self.poll_seconds)
+
+
+if __name__ == "__main__":
+    # Streamlit 서버와 별도로 예약 전송 워커만 실행 (여러 워커가 떠 있어도 작업은 한 번만 처리됨)
+    dispatcher = EmailDispatcher()
+    dispatcher.start()
+    print(f"예약 이메일 전송 워커 시작 ({SCHEDULE_DB_PATH}, {POLL_SECONDS}초 간격)")
+    try:
+        while dispatcher.running:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        dispatcher.stop()
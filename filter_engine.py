@@ -0,0 +1,104 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+import news_store
+
+SEARCH_COLUMNS = ['title', 'summary', 'keywords']
+
+
+class ArticleFilter:
+    """데이터 버전마다 한 번 만드는 필터 색인 (술어는 불리언 마스크로 조합)
+
+    요약 길이와 파싱된 날짜는 NumPy 배열로, 날짜는 정렬 순서까지 미리 계산해
+    기간 조회를 searchsorted 두 번으로 처리한다.
+    """
+
+    def __init__(self, df, db_path=news_store.DB_PATH):
+        self.df = df
+        self.db_path = db_path
+        self.index = pd.Index(df.index)
+        self.summary_len = df['summary_len'].to_numpy()
+        dates = df['published'].to_numpy(dtype='datetime64[ns]')
+        valid = np.flatnonzero(~np.isnat(dates))
+        # 날짜가 있는 행만 날짜순으로 정렬한 위치 (NaT 행은 기간 조건에서 제외)
+        self.date_order = valid[np.argsort(dates[valid], kind='stable')]
+        self.sorted_dates = dates[self.date_order]
+        self._text_lower = None
+
+    def __len__(self):
+        return len(self.index)
+
+    @property
+    def text_lower(self):
+        """제목·요약·키워드를 합친 소문자 텍스트 (전문 검색을 못 쓸 때 처음 한 번만 계산)"""
+        if self._text_lower is None:
+            columns = [self.df[col].fillna('') for col in SEARCH_COLUMNS if col in self.df.columns]
+            combined = columns[0]
+            for column in columns[1:]:
+                combined = combined + '\n' + column
+            self._text_lower = combined.str.lower()
+        return self._text_lower
+
+    def date_bounds(self):
+        """가장 이른/늦은 기사 날짜 (날짜가 없으면 None)"""
+        if not len(self.sorted_dates):
+            return None
+        return pd.Timestamp(self.sorted_dates[0]).date(), pd.Timestamp(self.sorted_dates[-1]).date()
+
+    def all_rows(self):
+        return np.ones(len(self.index), dtype=bool)
+
+    def date_mask(self, start=None, end=None):
+        """[start, end] 기간(날짜 단위, 양 끝 포함)에 속하는 행 마스크"""
+        lo = 0 if start is None else np.searchsorted(
+            self.sorted_dates, np.datetime64(pd.Timestamp(start).normalize(), 'ns'), side='left')
+        hi = len(self.sorted_dates) if end is None else np.searchsorted(
+            self.sorted_dates, np.datetime64(pd.Timestamp(end).normalize() + pd.Timedelta(days=1), 'ns'), side='left')
+        mask = np.zeros(len(self.index), dtype=bool)
+        mask[self.date_order[lo:hi]] = True
+        return mask
+
+    def length_mask(self, min_length=None, max_length=None):
+        """요약 길이가 [min_length, max_length]인 행 마스크"""
+        mask = self.all_rows()
+        if min_length is not None:
+            mask &= self.summary_len >= min_length
+        if max_length is not None:
+            mask &= self.summary_len <= max_length
+        return mask
+
+    def search_ids(self, query):
+        """전문 검색 색인으로 찾은 기사 ID (관련도 순) - 색인을 못 쓰면 None"""
+        try:
+            return news_store.search_articles(query, db_path=self.db_path)
+        except sqlite3.Error:
+            return None
+
+    def keyword_mask(self, query):
+        """소문자 텍스트 부분 문자열 검색 마스크 (전문 검색 대체용)"""
+        return self.text_lower.str.contains(query.lower(), regex=False).to_numpy(dtype=bool, na_value=False)
+
+    def apply(self, keyword=None, date_range=None, summary_length=None):
+        """조건을 모두 만족하는 기사 DataFrame (키워드 검색이 있으면 관련도 순)"""
+        mask = self.all_rows()
+        if date_range is not None:
+            mask &= self.date_mask(*date_range)
+        if summary_length is not None:
+            mask &= self.length_mask(*summary_length)
+        positions = None
+        if keyword:
+            ids = self.search_ids(keyword)
+            if ids is None:
+                mask &= self.keyword_mask(keyword)
+            else:
+                # 검색 결과 ID와 교집합 (검색 순위 유지)
+                positions = self.index.get_indexer(pd.Index(ids))
+                positions = positions[positions >= 0]
+                positions = positions[mask[positions]]
+        if positions is None:
+            positions = np.flatnonzero(mask)
+        if len(positions) == len(self.index) and not keyword:
+            return self.df
+        return self.df.iloc[positions]
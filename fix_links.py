@@ -1,4 +1,6 @@
-import pandas as pd
+import news_store
+import dataset_writer
+from data_loader import publish_snapshot
 from datetime import datetime
 
 def create_real_news_data():
@@ -86,11 +88,10 @@ def update_csv_file():
         # 새로운 데이터 생성
         news_data = create_real_news_data()
         
-        # DataFrame 생성
-        df = pd.DataFrame(news_data)
-        
-        # CSV 파일로 저장
-        df.to_csv('digital_healthcare_news.csv', index=False, encoding='utf-8-sig')
+        # 저장소 교체 후 CSV 내보내기 및 스냅샷 발행
+        dataset_writer.replace_articles(news_data)
+        news_store.export_csv('digital_healthcare_news.csv')
+        publish_snapshot()
         
         print("✅ CSV 파일이 실제 연합뉴스 링크로 업데이트되었습니다!")
         
@@ -0,0 +1,213 @@
+import hashlib
+import threading
+
+import numpy as np
+import pandas as pd
+from array import array
+from scipy import sparse
+from scipy.sparse.linalg import eigsh
+
+from news_store import parse_keywords
+
+
+def _prefix_hash(row_hashes):
+    """행 해시 배열을 이어 붙인 바이트의 해시 (순서가 바뀌거나 중복 행이 생겨도 달라짐)"""
+    return hashlib.blake2b(np.ascontiguousarray(row_hashes).tobytes(), digest_size=16).digest()
+
+
+class KeywordCooccurrence:
+    """정수 코드화된 키워드의 희소 대칭 동시출현 행렬
+
+    st.cache_resource로 세션 간에 공유되므로 동기화·대기 쌍 병합·조회는 모두 한 잠금 안에서 한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self):
+        """잠금을 잡은 상태에서 호출 - 빈 행렬로 초기화"""
+        self.vocab = {}
+        self.terms = []
+        self.doc_freq = array('q')
+        self.n_docs = 0
+        self._matrix = sparse.csr_matrix((0, 0), dtype=np.int64)
+        # 아직 행렬에 반영되지 않은 (행, 열) 쌍 버퍼
+        self._pending_rows = array('i')
+        self._pending_cols = array('i')
+        # sync()가 마지막으로 반영한 행 수와 그 행들의 해시
+        self._synced_rows = 0
+        self._synced_hash = _prefix_hash(np.zeros(0, dtype=np.uint64))
+        # 기사가 반영될 때마다 올라가는 버전과 버전별 PMI 행렬 캐시
+        self.version = 0
+        self._pmi_cache = {}
+
+    def _term_id(self, term):
+        term_id = self.vocab.get(term)
+        if term_id is None:
+            term_id = len(self.terms)
+            self.vocab[term] = term_id
+            self.terms.append(term)
+            self.doc_freq.append(0)
+        return term_id
+
+    def add_article(self, keywords):
+        """기사 한 건의 키워드를 행렬에 증분 반영"""
+        if isinstance(keywords, str) or keywords is None:
+            keywords = parse_keywords(keywords)
+        with self._lock:
+            self._add_ids(keywords)
+
+    def _add_ids(self, keywords):
+        ids = sorted({self._term_id(k) for k in keywords})
+        for term_id in ids:
+            self.doc_freq[term_id] += 1
+        # 대칭 행렬이므로 양방향 쌍을 모두 기록
+        for i, a in enumerate(ids):
+            for b in ids[i + 1:]:
+                self._pending_rows.extend((a, b))
+                self._pending_cols.extend((b, a))
+        self.n_docs += 1
+        self.version += 1
+
+    def add_articles(self, keywords_iter):
+        """여러 기사의 키워드를 한 번에 반영"""
+        with self._lock:
+            for keywords in keywords_iter:
+                self.add_article(keywords)
+
+    def sync(self, keywords_series):
+        """키워드 컬럼과 동기화 (앞부분이 그대로면 새로 추가된 행만 반영)"""
+        row_hashes = pd.util.hash_pandas_object(keywords_series.fillna(''), index=False).to_numpy()
+        n = len(row_hashes)
+        with self._lock:
+            if n < self._synced_rows or _prefix_hash(row_hashes[:self._synced_rows]) != self._synced_hash:
+                # 기존 행이 바뀌었으면 처음부터 다시 구성 (버전은 이어서 올려 이전 캐시와 겹치지 않게)
+                version = self.version
+                self._reset()
+                self.version = version + 1
+            new_rows = keywords_series.iloc[self._synced_rows:]
+            self.add_articles(new_rows.tolist())
+            self._synced_rows = n
+            self._synced_hash = _prefix_hash(row_hashes)
+            return len(new_rows)
+
+    @property
+    def matrix(self):
+        """대기 중인 쌍을 합쳐 CSR 동시출현 행렬 반환"""
+        with self._lock:
+            size = len(self.terms)
+            if self._matrix.shape != (size, size):
+                # 반환한 행렬을 다른 스레드가 읽고 있을 수 있으므로 제자리 resize 대신 새 행렬
+                self._matrix = sparse.csr_matrix(
+                    (self._matrix.data, self._matrix.indices,
+                     np.pad(self._matrix.indptr, (0, size - self._matrix.shape[0]), mode='edge')),
+                    shape=(size, size)
+                )
+            if len(self._pending_rows):
+                rows = np.frombuffer(self._pending_rows, dtype=np.int32)
+                cols = np.frombuffer(self._pending_cols, dtype=np.int32)
+                delta = sparse.coo_matrix(
+                    (np.ones(len(rows), dtype=np.int64), (rows, cols)), shape=(size, size)
+                ).tocsr()
+                self._matrix = (self._matrix + delta).tocsr()
+                self._pending_rows = array('i')
+                self._pending_cols = array('i')
+            return self._matrix
+
+    def pmi_matrix(self, positive=True):
+        """동시출현 횟수를 PMI(점별 상호정보량)로 변환한 희소 행렬 (버전별로 한 번만 계산)"""
+        with self._lock:
+            cached = self._pmi_cache.get(positive)
+            if cached is not None and cached[0] == self.version:
+                return cached[1]
+            counts = self.matrix.tocoo()
+            if counts.nnz == 0 or self.n_docs == 0:
+                result = counts.tocsr().astype(np.float64)
+            else:
+                df = np.array(self.doc_freq, dtype=np.int64).astype(np.float64)
+                pmi = np.log(counts.data * self.n_docs / (df[counts.row] * df[counts.col]))
+                if positive:
+                    pmi = np.maximum(pmi, 0.0)
+                result = sparse.csr_matrix((pmi, (counts.row, counts.col)), shape=counts.shape)
+                result.eliminate_zeros()
+            self._pmi_cache[positive] = (self.version, result)
+            return result
+
+    def weighted_matrix(self, weight='count'):
+        """가중치 종류('count' 또는 'pmi')에 맞는 행렬 반환"""
+        with self._lock:
+            if weight == 'pmi':
+                return self.pmi_matrix()
+            return self.matrix.astype(np.float64)
+
+    def top_neighbors(self, term, n=10, weight='count'):
+        """키워드와 가장 강하게 연결된 상위 N개 이웃"""
+        with self._lock:
+            term_id = self.vocab.get(term)
+            if term_id is None:
+                return []
+            row = self.weighted_matrix(weight).getrow(term_id)
+            if row.nnz == 0:
+                return []
+            top = np.argsort(-row.data, kind='stable')[:n]
+            return [(self.terms[row.indices[i]], float(row.data[i])) for i in top]
+
+    def centrality(self, kind='eigenvector', weight='count', max_iter=100, tol=1e-6):
+        """희소 선형대수로 키워드 중심성 계산 ('degree', 'eigenvector', 'pagerank')"""
+        with self._lock:
+            size = len(self.terms)
+            if size == 0:
+                return np.zeros(0)
+            m = self.weighted_matrix(weight)
+            strength = np.asarray(m.sum(axis=1)).ravel()
+            if kind == 'degree':
+                return strength / strength.sum() if strength.sum() else strength
+            if kind == 'eigenvector':
+                try:
+                    if size > 2 and m.nnz:
+                        _, vec = eigsh(m, k=1, which='LA', maxiter=max_iter * size, tol=tol)
+                        vec = np.abs(vec[:, 0])
+                        return vec / vec.sum() if vec.sum() else vec
+                except Exception:
+                    pass
+                kind = 'pagerank'
+            # PageRank: 행 정규화 행렬에 대한 거듭제곱법
+            inv = np.divide(1.0, strength, out=np.zeros_like(strength), where=strength > 0)
+            transition = sparse.diags(inv) @ m
+            dangling = strength == 0
+            rank = np.full(size, 1.0 / size)
+            damping = 0.85
+            for _ in range(max_iter):
+                new_rank = damping * (transition.T @ rank) + damping * rank[dangling].sum() / size + (1 - damping) / size
+                if np.abs(new_rank - rank).sum() < tol:
+                    rank = new_rank
+                    break
+                rank = new_rank
+            return rank
+
+    def pruned_graph(self, top_k=50, min_count=2, weight='count', edges_per_node=5):
+        """상위 키워드만 남긴 가지치기 그래프 (노드 리스트, 간선 리스트)"""
+        with self._lock:
+            if not self.terms:
+                return [], []
+            df = np.array(self.doc_freq, dtype=np.int64)
+            nodes = np.argsort(-df, kind='stable')[:top_k]
+            counts = self.matrix[nodes][:, nodes].tocoo()
+            weights = self.weighted_matrix(weight)[nodes][:, nodes].tocsr()
+            keep = (counts.row < counts.col) & (counts.data >= min_count)
+            rows, cols = counts.row[keep], counts.col[keep]
+            # 남은 간선이 없으면 희소 행렬 인덱싱이 (1, 0) 행렬을 돌려주므로 빈 배열로 대체
+            values = np.asarray(weights[rows, cols]).ravel() if len(rows) else np.zeros(0)
+            edges = []
+            degree = np.zeros(len(nodes), dtype=np.int64)
+            # 가중치가 큰 간선부터 노드당 최대 edges_per_node개까지만 유지
+            for idx in np.argsort(-values, kind='stable'):
+                a, b = rows[idx], cols[idx]
+                if degree[a] >= edges_per_node or degree[b] >= edges_per_node:
+                    continue
+                degree[a] += 1
+                degree[b] += 1
+                edges.append((self.terms[nodes[a]], self.terms[nodes[b]], float(values[idx])))
+            node_list = [(self.terms[i], int(df[i])) for i in nodes]
+            return node_list, edges
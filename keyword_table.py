@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+
+import news_store
+
+
+class KeywordTable:
+    """정수 코드화된 키워드 사전과 기사→키워드 연결 배열 (NumPy 집계용)"""
+
+    def __init__(self, vocab, edges):
+        # 키워드 ID를 0..V-1 연속 코드로 변환
+        self.terms = vocab['term'].to_numpy(dtype=object)
+        self.is_hangul = vocab['is_hangul'].to_numpy(dtype=bool)
+        self.lengths = vocab['length'].to_numpy(dtype=np.int32)
+        codes = pd.Index(vocab['id'].to_numpy())
+        self.article_ids = edges['article_id'].to_numpy(dtype=np.int64)
+        self.keyword_codes = codes.get_indexer(edges['keyword_id'].to_numpy()).astype(np.int64)
+        # 세션 간에 공유되므로 읽기 전용 (제자리 수정 시 오류)
+        for array in (self.terms, self.is_hangul, self.lengths, self.article_ids, self.keyword_codes):
+            array.flags.writeable = False
+
+    @classmethod
+    def from_store(cls, db_path=news_store.DB_PATH):
+        """저장소의 키워드 테이블로 생성"""
+        vocab, edges = news_store.load_keyword_edges(db_path=db_path)
+        return cls(vocab, edges)
+
+    def _edge_mask(self, article_ids):
+        """기사 ID 부분집합에 속하는 연결만 고르는 마스크 (None이면 전체)"""
+        if article_ids is None:
+            return slice(None)
+        return np.isin(self.article_ids, np.asarray(article_ids, dtype=np.int64))
+
+    def frequencies(self, article_ids=None):
+        """키워드 코드별 등장 기사 수 (bincount)"""
+        return np.bincount(self.keyword_codes[self._edge_mask(article_ids)], minlength=len(self.terms))
+
+    def total_count(self, article_ids=None):
+        """전체 키워드 등장 횟수"""
+        return int(self.frequencies(article_ids).sum())
+
+    def unique_count(self, article_ids=None):
+        """고유 키워드 수"""
+        return int(np.count_nonzero(self.frequencies(article_ids)))
+
+    def top_n(self, n=None, article_ids=None, hangul_only=False, min_length=2, min_count=1):
+        """빈도 상위 키워드 (키워드, 빈도) 리스트"""
+        freq = self.frequencies(article_ids)
+        mask = (freq >= min_count) & (self.lengths >= min_length)
+        if hangul_only:
+            mask &= self.is_hangul
+        codes = np.flatnonzero(mask)
+        order = codes[np.argsort(-freq[codes], kind='stable')]
+        if n is not None:
+            order = order[:n]
+        return [(self.terms[c], int(freq[c])) for c in order]
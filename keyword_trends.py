@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+import news_store
+
+# 추세 계산 대상 키워드 수 (전체 빈도 상위 + 최근 빈도 상위) - 밀집 행렬 크기를 날짜 × 후보 수로 제한
+CANDIDATE_KEYWORDS = 500
+# 최근 빈도 상위 후보를 고르는 기간 (화면에서 고를 수 있는 가장 긴 이동 창)
+RECENT_CANDIDATE_DAYS = 30
+
+
+class KeywordTrends:
+    """날짜 × 키워드 일별 빈도 희소 행렬과 이동 창(rolling window) 추세 지표
+
+    빠진 날짜는 0으로 채운 연속 일별 축을 쓰고, 이동 합계는 누적합의 차로
+    모든 키워드에 대해 한 번에 계산한다.
+    """
+
+    def __init__(self, daily_counts):
+        """daily_counts: (date, keyword, count) 긴 형식 DataFrame"""
+        dates = pd.to_datetime(daily_counts['date'], errors='coerce')
+        valid = dates.notna().to_numpy()
+        dates = dates[valid]
+        if len(dates):
+            self.dates = pd.date_range(dates.min().normalize(), dates.max().normalize(), freq='D')
+            day_codes = (dates.dt.normalize() - self.dates[0]).dt.days.to_numpy()
+        else:
+            self.dates = pd.DatetimeIndex([])
+            day_codes = np.zeros(0, dtype=np.int64)
+        term_codes, terms = pd.factorize(daily_counts['keyword'].to_numpy()[valid])
+        self.terms = np.asarray(terms, dtype=object)
+        self.matrix = sparse.csr_matrix(
+            (daily_counts['count'].to_numpy(dtype=np.float32)[valid], (day_codes, term_codes)),
+            shape=(len(self.dates), len(self.terms))
+        )
+        self._dense = None
+        # 이동 창 크기별 이동 합계 (rising·series가 같은 창을 여러 번 쓰므로 한 번만 계산)
+        self._rolled = {}
+
+    @classmethod
+    def from_store(cls, top=CANDIDATE_KEYWORDS, recent_days=RECENT_CANDIDATE_DAYS, db_path=news_store.DB_PATH):
+        """저장소의 일별 키워드 롤업(보관된 기사 포함)으로 생성
+
+        후보는 전체 빈도 상위와 최근 recent_days일 빈도 상위를 합친 키워드라서,
+        새로 떠오른 키워드도 전체 빈도가 낮다는 이유로 빠지지 않는다.
+        """
+        return cls(news_store.load_daily_keyword_counts(top=top, recent_days=recent_days, db_path=db_path))
+
+    @property
+    def dense(self):
+        """날짜 × 키워드 밀집 배열 (후보 키워드로 제한되어 있으므로 작음)"""
+        if self._dense is None:
+            self._dense = self.matrix.toarray()
+        return self._dense
+
+    def totals(self):
+        """키워드별 전체 기간 빈도"""
+        return np.asarray(self.matrix.sum(axis=0)).ravel()
+
+    def rolling_sum(self, window):
+        """이동 창 합계 (날짜 × 키워드) - 누적합의 차로 계산, 창 크기별로 한 번만 계산"""
+        rolled = self._rolled.get(window)
+        if rolled is None:
+            cumulative = np.cumsum(self.dense, axis=0, dtype=np.float64)
+            rolled = cumulative.copy()
+            rolled[window:] -= cumulative[:-window]
+            self._rolled[window] = rolled
+        return rolled
+
+    def window_totals(self, window):
+        """최근 창과 직전 창의 키워드별 합계"""
+        rolled = self.rolling_sum(window)
+        recent = rolled[-1]
+        previous = rolled[-1 - window] if len(rolled) > window else np.zeros_like(recent)
+        return recent, previous
+
+    def growth(self, window):
+        """최근 창 합계 대비 직전 창 합계의 증가율 (직전 창이 비면 가산 평활)"""
+        recent, previous = self.window_totals(window)
+        return self._growth(recent, previous)
+
+    @staticmethod
+    def _growth(recent, previous):
+        return (recent - previous) / (previous + 1.0)
+
+    def burst(self, window):
+        """최근 창 일평균이 과거 일별 분포에서 얼마나 벗어났는지 (z 점수)"""
+        history = self.dense[:-window] if len(self.dense) > window else self.dense[:0]
+        recent_mean = self.dense[-window:].mean(axis=0)
+        if not len(history):
+            return np.zeros(len(self.terms))
+        mean = history.mean(axis=0)
+        std = history.std(axis=0)
+        return (recent_mean - mean) / (std + 1.0 / np.sqrt(len(history)))
+
+    def rising(self, n=10, window=7, by='growth', min_recent=2):
+        """최근 창 빈도가 min_recent 이상인 키워드 중 증가율/급등 점수 상위 n개"""
+        if not len(self.terms) or not len(self.dates):
+            return pd.DataFrame(columns=['keyword', 'recent', 'previous', 'growth', 'burst'])
+        recent, previous = self.window_totals(window)
+        table = pd.DataFrame({
+            'keyword': self.terms,
+            'recent': recent.astype(int),
+            'previous': previous.astype(int),
+            'growth': self._growth(recent, previous),
+            'burst': self.burst(window),
+        })
+        table = table[table['recent'] >= min_recent]
+        return table.sort_values([by, 'recent'], ascending=False).head(n).reset_index(drop=True)
+
+    def series(self, keywords, window=7, max_points=400):
+        """키워드별 이동 창 빈도 시계열 (점이 많으면 구간 평균으로 줄여 max_points 이하로)"""
+        positions = pd.Index(self.terms).get_indexer(keywords)
+        keep = positions >= 0
+        values = self.rolling_sum(window)[:, positions[keep]] / window
+        dates = self.dates
+        if len(dates) > max_points:
+            # 서버 쪽 다운샘플링: 연속 구간별 평균 (마지막 날짜는 각 구간의 끝)
+            edges = np.linspace(0, len(dates), max_points + 1).astype(int)[:-1]
+            sizes = np.diff(np.append(edges, len(dates)))
+            values = np.add.reduceat(values, edges, axis=0) / sizes[:, None]
+            dates = dates[edges + sizes - 1]
+        frame = pd.DataFrame(values, index=dates, columns=np.asarray(keywords, dtype=object)[keep])
+        frame.index.name = 'date'
+        return frame.reset_index().melt(id_vars='date', var_name='keyword', value_name='frequency')
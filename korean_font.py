@@ -0,0 +1,102 @@
+import glob
+import os
+import platform
+import shutil
+import subprocess
+import sys
+from functools import lru_cache
+
+# 배포본에 함께 넣는 폰트 위치 (download 명령으로 미리 받아 둠)
+FONT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts")
+# 경로를 직접 지정하고 싶을 때 사용하는 환경 변수
+FONT_ENV = "KOREAN_FONT_PATH"
+NANUM_FONT_URL = "https://github.com/naver/nanumfont/raw/master/fonts/NanumGothic.ttf"
+
+# 선호 순서대로 나열한 한글 폰트 파일 이름 (소문자, 확장자 제외)
+PREFERRED_FONTS = [
+    'nanumgothic', 'malgun', 'notosanscjkkr-regular', 'notosanskr-regular',
+    'notosanscjk-regular', 'applegothic', 'applesdgothicneo', 'undotum', 'gulim', 'dotum', 'batang',
+]
+FONT_EXTENSIONS = ('.ttf', '.ttc', '.otf')
+
+SYSTEM_FONT_DIRS = {
+    'Windows': [os.path.join(os.environ.get('WINDIR', r"C:\Windows"), "Fonts")],
+    'Darwin': ["/Library/Fonts", "/System/Library/Fonts", os.path.expanduser("~/Library/Fonts")],
+}
+LINUX_FONT_DIRS = [
+    "/usr/share/fonts", "/usr/local/share/fonts",
+    os.path.expanduser("~/.local/share/fonts"), os.path.expanduser("~/.fonts"),
+]
+
+def _rank(path):
+    """선호 목록 순위 (목록에 없으면 뒤로)"""
+    name = os.path.splitext(os.path.basename(path))[0].lower().replace(' ', '').replace('_', '')
+    for i, preferred in enumerate(PREFERRED_FONTS):
+        if name.startswith(preferred):
+            return i
+    return len(PREFERRED_FONTS)
+
+
+def _scan_dirs(directories):
+    """디렉터리에서 선호 목록에 있는 폰트 파일 찾기"""
+    found = []
+    for directory in directories:
+        if not os.path.isdir(directory):
+            continue
+        for path in glob.glob(os.path.join(directory, "**", "*"), recursive=True):
+            if path.lower().endswith(FONT_EXTENSIONS) and _rank(path) < len(PREFERRED_FONTS):
+                found.append(path)
+    return found
+
+
+def _fontconfig_fonts():
+    """fontconfig에 등록된 한글 지원 폰트 (fc-list가 없으면 빈 목록)"""
+    if shutil.which('fc-list') is None:
+        return []
+    try:
+        output = subprocess.run(
+            ['fc-list', ':lang=ko', 'file'], capture_output=True, text=True, timeout=5
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return []
+    return [line.strip().rstrip(':') for line in output.splitlines() if line.strip()]
+
+
+@lru_cache(maxsize=None)
+def resolve_font_path():
+    """한글 폰트 경로를 프로세스당 한 번만 찾아 반환 (없으면 None, 네트워크 사용 안 함)
+
+    순서: 환경 변수 → 함께 배포한 fonts/ → fontconfig → 시스템 폰트 디렉터리
+    """
+    override = os.environ.get(FONT_ENV)
+    if override and os.path.exists(override):
+        return override
+    candidates = _scan_dirs([FONT_DIR])
+    if not candidates:
+        candidates = [path for path in _fontconfig_fonts() if os.path.exists(path)]
+    if not candidates:
+        candidates = _scan_dirs(SYSTEM_FONT_DIRS.get(platform.system(), LINUX_FONT_DIRS))
+    if not candidates:
+        return None
+    return min(candidates, key=lambda path: (_rank(path), path))
+
+
+def download_font(url=NANUM_FONT_URL, font_dir=FONT_DIR):
+    """배포 준비 단계에서 나눔고딕을 fonts/에 받아 두기 (요청 처리 중에는 호출하지 않음)"""
+    import urllib.request
+
+    from dataset_writer import atomic_write_bytes
+
+    os.makedirs(font_dir, exist_ok=True)
+    font_path = os.path.join(font_dir, os.path.basename(url))
+    if not os.path.exists(font_path):
+        with urllib.request.urlopen(url, timeout=30) as response:
+            atomic_write_bytes(font_path, response.read())
+    return font_path
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == 'download':
+        print(f"✅ 폰트 저장: {download_font()}")
+    else:
+        print(f"한글 폰트: {resolve_font_path() or '없음'}")
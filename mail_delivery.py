@@ -0,0 +1,293 @@
+import io
+import queue
+import re
+import smtplib
+import threading
+import time
+import zipfile
+from email import encoders
+from email.mime.base import MIMEBase
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+SMTP_HOST = 'smtp.gmail.com'
+SMTP_PORT = 587
+# 한 봉투(RCPT TO)에 넣는 수신자 수 (Gmail은 메시지당 100명 제한)
+BATCH_SIZE = 50
+# 이 시간 넘게 쉬던 연결은 NOOP으로 살아 있는지 확인 후 재사용
+IDLE_CHECK_SECONDS = 60
+# 이 시간 넘게 쓰지 않은 연결은 닫음
+IDLE_CLOSE_SECONDS = 300
+# 인코딩 후 메시지 크기 상한 (Gmail 25MB 제한에 여유를 둠)
+MAX_MESSAGE_BYTES = 20 * 1024 * 1024
+# CSV 첨부를 만들 때 한 번에 직렬화하는 행 수
+CSV_CHUNK_ROWS = 5000
+# 상태 조회용으로 보관하는 끝난 전송 작업 수 (넘으면 오래 전에 끝난 것부터 버림)
+MAX_FINISHED_JOBS = 200
+
+_RECIPIENT_SPLIT_RE = re.compile(r'[,;\s]+')
+
+
+def parse_recipients(text):
+    """쉼표·세미콜론·공백·줄바꿈으로 구분된 수신자 목록 (중복 제거, 순서 유지)"""
+    return list(dict.fromkeys(r for r in _RECIPIENT_SPLIT_RE.split(text or '') if r))
+
+
+def zip_csv(df, csv_name, columns=None, chunk_rows=CSV_CHUNK_ROWS):
+    """DataFrame을 CSV로 나눠 직렬화하며 바로 zip에 압축 (메모리에는 압축본과 한 조각만 유지)"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        with archive.open(csv_name, 'w', force_zip64=True) as entry:
+            entry.write('\ufeff'.encode('utf-8'))  # 엑셀에서 한글이 깨지지 않도록 BOM
+            for start in range(0, max(len(df), 1), chunk_rows):
+                chunk = df.iloc[start:start + chunk_rows]
+                entry.write(chunk.to_csv(columns=columns, index=False, header=start == 0).encode('utf-8'))
+    return buffer.getvalue()
+
+
+def encoded_size(html_body, attachments=()):
+    """메시지 크기 추정 (본문 UTF-8 + 첨부 base64 76자 줄바꿈, 헤더 제외)"""
+    size = len(html_body.encode('utf-8'))
+    for _, data in attachments:
+        base64_len = (len(data) + 2) // 3 * 4
+        size += base64_len + base64_len // 76 + 1
+    return size
+
+
+def build_message(sender, subject, html_body, attachments=(), recipients=(), max_bytes=MAX_MESSAGE_BYTES):
+    """보고서 MIME 메시지를 한 번만 직렬화한 바이트
+
+    attachments: (파일 이름, 바이트) 목록. 수신자가 여럿이면 서로의 주소가 보이지 않도록
+    To 헤더는 비워 두고 봉투(RCPT TO)로만 전달한다. 추정 크기가 max_bytes를 넘으면
+    메시지를 만들기 전에 ValueError를 낸다.
+    """
+    size = encoded_size(html_body, attachments)
+    if max_bytes is not None and size > max_bytes:
+        raise ValueError(
+            f"메시지 크기 {size / 1024 / 1024:.1f}MB가 한도 {max_bytes / 1024 / 1024:.0f}MB를 넘습니다"
+        )
+    msg = MIMEMultipart()
+    msg['From'] = sender
+    msg['To'] = recipients[0] if len(recipients) == 1 else 'undisclosed-recipients:;'
+    msg['Subject'] = subject
+    msg.attach(MIMEText(html_body, 'html', 'utf-8'))
+    for filename, data in attachments:
+        attachment = MIMEBase('application', 'octet-stream')
+        attachment.set_payload(data)
+        encoders.encode_base64(attachment)
+        attachment.add_header('Content-Disposition', f'attachment; filename="{filename}"')
+        msg.attach(attachment)
+    return msg.as_bytes()
+
+
+class SMTPPool:
+    """계정별 인증된 SMTP 연결 하나를 유지하며 재사용 (전송 스레드에서만 사용)"""
+
+    def __init__(self, host=SMTP_HOST, port=SMTP_PORT, timeout=30):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._connections = {}
+
+    def _open(self, user, password):
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            server.ehlo()
+            if server.has_extn('starttls'):
+                server.starttls()
+                server.ehlo()
+            if user:
+                server.login(user, password)
+        except BaseException:
+            server.close()
+            raise
+        return server
+
+    def get(self, user, password):
+        """인증된 연결 반환 (비밀번호가 바뀌었거나 끊긴 연결은 새로 염)"""
+        entry = self._connections.get(user)
+        if entry is not None:
+            server, entry_password, last_used = entry
+            if entry_password != password:
+                self.discard(user)
+            elif time.monotonic() - last_used > IDLE_CHECK_SECONDS:
+                try:
+                    if server.noop()[0] != 250:
+                        raise smtplib.SMTPServerDisconnected("NOOP 실패")
+                except (smtplib.SMTPException, OSError):
+                    self.discard(user)
+        if user not in self._connections:
+            self._connections[user] = (self._open(user, password), password, time.monotonic())
+        return self._connections[user][0]
+
+    def touch(self, user):
+        entry = self._connections.get(user)
+        if entry is not None:
+            self._connections[user] = (entry[0], entry[1], time.monotonic())
+
+    def discard(self, user):
+        """연결을 닫고 풀에서 제거"""
+        entry = self._connections.pop(user, None)
+        if entry is not None:
+            try:
+                entry[0].quit()
+            except (smtplib.SMTPException, OSError):
+                entry[0].close()
+
+    def close_idle(self, max_idle=IDLE_CLOSE_SECONDS):
+        now = time.monotonic()
+        for user, (_, _, last_used) in list(self._connections.items()):
+            if now - last_used > max_idle:
+                self.discard(user)
+
+    def close(self):
+        for user in list(self._connections):
+            self.discard(user)
+
+
+class MailDelivery:
+    """보고서 전송 요청을 한 스레드에서 순서대로 처리하는 전송 큐
+
+    연결은 계정별로 풀에 유지하고, 각 보고서의 메시지 바이트는 한 번만 만들어
+    BATCH_SIZE명씩 봉투를 나눠 보낸다. 수신자별 거부 사유는 요청의 failed에, 서버가 받은
+    수신자는 delivered에 기록하므로 중간에 실패해도 어디까지 보냈는지 알 수 있다.
+    끝난 작업은 최근 MAX_FINISHED_JOBS개만 남긴다.
+    """
+
+    def __init__(self, host=SMTP_HOST, port=SMTP_PORT, batch_size=BATCH_SIZE):
+        self.pool = SMTPPool(host, port)
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._next_id = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="mail-delivery", daemon=True)
+        self._thread.start()
+
+    def submit(self, sender, password, recipients, payload):
+        """전송 요청을 큐에 넣고 상태 조회용 작업 ID 반환"""
+        recipients = list(recipients)
+        with self._lock:
+            self._next_id += 1
+            job_id = self._next_id
+            self._jobs[job_id] = {
+                'sender': sender, 'total': len(recipients), 'sent': 0, 'delivered': [], 'failed': {},
+                'error': None, 'done': threading.Event(), 'cancelled': False,
+                'started_at': None, 'finished_at': None,
+            }
+            self._evict()
+        self._queue.put((job_id, password, recipients, payload))
+        return job_id
+
+    def send(self, sender, password, recipients, payload, timeout=None):
+        """전송하고 끝날 때까지 대기 (스케줄러 스레드 등 UI 밖에서 사용)
+
+        timeout이 지나면 남은 봉투를 취소하고 보내던 봉투가 끝나기를 기다린 뒤
+        error에 TimeoutError를 담아 반환한다 (delivered는 실제로 보낸 수신자 그대로).
+        """
+        job_id = self.submit(sender, password, recipients, payload)
+        job = self.status(job_id)
+        if not job['done'].wait(timeout):
+            self.cancel(job_id)
+            job['done'].wait()
+        return job
+
+    def cancel(self, job_id):
+        """아직 보내지 않은 봉투를 보내지 않도록 취소 (시작 전이면 바로 끝남)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job['done'].is_set():
+                return
+            job['cancelled'] = True
+            if job['started_at'] is None:
+                self._finish(job, TimeoutError("이메일 전송 대기 시간 초과"))
+
+    def _evict(self):
+        """잠금을 잡은 상태에서 호출 - 오래 전에 끝난 작업부터 버려 MAX_FINISHED_JOBS개만 유지"""
+        finished = sorted(
+            (job['finished_at'], job_id) for job_id, job in self._jobs.items() if job['done'].is_set()
+        )
+        for _, job_id in finished[:max(len(finished) - MAX_FINISHED_JOBS, 0)]:
+            del self._jobs[job_id]
+
+    def _finish(self, job, error=None):
+        if error is not None and job['error'] is None:
+            job['error'] = error
+        job['finished_at'] = time.time()
+        job['done'].set()
+
+    def status(self, job_id):
+        """작업 상태 dict (없으면 None)"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _send_batch(self, job, password, batch, payload):
+        """한 봉투 전송 - 끊긴 연결이면 한 번 다시 연결해 재시도, 거부된 수신자는 failed에 기록"""
+        sender = job['sender']
+        for attempt in range(2):
+            server = self.pool.get(sender, password)
+            try:
+                refused = server.sendmail(sender, batch, payload)
+            except smtplib.SMTPServerDisconnected:
+                self.pool.discard(sender)
+                if attempt:
+                    raise
+                continue
+            except smtplib.SMTPRecipientsRefused as e:
+                refused = e.recipients
+            except smtplib.SMTPResponseException as e:
+                # 메시지 자체가 거부됨: 연결은 RSET으로 정리하고 이 봉투의 수신자 모두 실패 처리
+                try:
+                    server.rset()
+                except (smtplib.SMTPException, OSError):
+                    self.pool.discard(sender)
+                refused = {recipient: (e.smtp_code, e.smtp_error) for recipient in batch}
+            self.pool.touch(sender)
+            for recipient, (code, message) in refused.items():
+                if isinstance(message, bytes):
+                    message = message.decode('utf-8', 'replace')
+                job['failed'][recipient] = f"{code} {message}"
+            job['sent'] += len(batch) - len(refused)
+            job['delivered'].extend(recipient for recipient in batch if recipient not in refused)
+            return
+
+    def _run(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=IDLE_CLOSE_SECONDS)
+            except queue.Empty:
+                self.pool.close_idle()
+                continue
+            job_id, password, recipients, payload = item
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is None or job['done'].is_set():
+                    # 시작 전에 취소됨
+                    continue
+                job['started_at'] = time.time()
+            error = None
+            try:
+                for start in range(0, len(recipients), self.batch_size):
+                    if job['cancelled']:
+                        error = TimeoutError("이메일 전송 대기 시간 초과")
+                        break
+                    self._send_batch(job, password, recipients[start:start + self.batch_size], payload)
+            except Exception as e:
+                # 인증 실패·연결 불가 등: 남은 수신자는 보내지 않고 작업 오류로 기록
+                self.pool.discard(job['sender'])
+                error = e
+            with self._lock:
+                self._finish(job, error)
+
+
+_mailers = {}
+_mailers_lock = threading.Lock()
+
+
+def get_mailer(host=SMTP_HOST, port=SMTP_PORT):
+    """프로세스당 SMTP 서버별 전송 큐 반환"""
+    with _mailers_lock:
+        mailer = _mailers.get((host, port))
+        if mailer is None:
+            mailer = _mailers[(host, port)] = MailDelivery(host, port)
+        return mailer
@@ -0,0 +1,793 @@
+import sqlite3
+import hashlib
+import re
+import os
+import sys
+import threading
+from contextlib import closing
+from datetime import datetime
+from urllib.parse import urlparse
+
+import pandas as pd
+
+# 기사 저장소 (SQLite, WAL 모드)
+DB_PATH = "news_articles.db"
+# 저장소가 비어 있을 때 가져올 기존 CSV 파일
+SEED_CSV_PATH = "digital_healthcare_news.csv"
+
+ARTICLE_COLUMNS = ['title', 'link', 'summary', 'keywords', 'date', 'source', 'text_length', 'collected_date']
+DISPLAY_COLUMNS = ['title', 'link', 'summary', 'keywords', 'date']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url_hash TEXT NOT NULL,
+    title TEXT,
+    link TEXT,
+    summary TEXT,
+    keywords TEXT,
+    date TEXT,
+    source TEXT,
+    text_length INTEGER,
+    collected_date TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_articles_url_hash ON articles(url_hash);
+CREATE INDEX IF NOT EXISTS idx_articles_date ON articles(date);
+CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source);
+
+-- 한글 부분 문자열 검색용 전문 검색 색인 (문자 bigram 토큰을 저장)
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, summary, keywords, tokenize = 'unicode61 remove_diacritics 0'
+);
+CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts(rowid, title, summary, keywords)
+    VALUES (new.id, bigrams(new.title), bigrams(new.summary), bigrams(new.keywords));
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE OF title, summary, keywords ON articles BEGIN
+    UPDATE articles_fts SET title = bigrams(new.title), summary = bigrams(new.summary),
+        keywords = bigrams(new.keywords)
+    WHERE rowid = new.id;
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+    DELETE FROM articles_fts WHERE rowid = old.id;
+END;
+
+-- 정수 코드화된 키워드 사전과 기사→키워드 연결 테이블
+CREATE TABLE IF NOT EXISTS keyword_vocab (
+    id INTEGER PRIMARY KEY,
+    term TEXT NOT NULL UNIQUE,
+    is_hangul INTEGER NOT NULL,
+    length INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS article_keywords (
+    article_id INTEGER NOT NULL,
+    keyword_id INTEGER NOT NULL,
+    PRIMARY KEY (article_id, keyword_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_article_keywords_keyword ON article_keywords(keyword_id);
+CREATE TRIGGER IF NOT EXISTS article_keywords_delete AFTER DELETE ON articles BEGIN
+    DELETE FROM article_keywords WHERE article_id = old.id;
+END;
+
+-- 전체 기간 일별 롤업 (보관소로 옮겨진 기사도 계속 반영됨)
+CREATE TABLE IF NOT EXISTS daily_rollups (
+    date TEXT PRIMARY KEY,
+    article_count INTEGER NOT NULL,
+    summary_length_sum INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS daily_keyword_counts (
+    date TEXT NOT NULL,
+    keyword_id INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (date, keyword_id)
+) WITHOUT ROWID;
+-- 보관소로 옮겨진 기사 색인 (롤업에 남아 있는 기여분, 다시 수집되면 빼고 새로 더함)
+CREATE TABLE IF NOT EXISTS archived_articles (
+    url_hash TEXT PRIMARY KEY,
+    date TEXT,
+    summary_length INTEGER NOT NULL,
+    keyword_ids TEXT NOT NULL
+) WITHOUT ROWID;
+
+-- 현재 저장소 기준 집계 (저장·삭제 때마다 증감, 대시보드는 이 값만 읽음)
+CREATE TABLE IF NOT EXISTS store_aggregates (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    total INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (kind, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS keyword_totals (
+    keyword_id INTEGER PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+"""
+
+# 스키마 버전별 마이그레이션 (PRAGMA user_version)
+SCHEMA_VERSION = 7
+
+# 요약 길이 히스토그램 구간 크기 (문자 수)
+SUMMARY_LENGTH_BIN = 50
+
+# 키워드로 취급하지 않는 자리표시 값들
+PLACEHOLDER_KEYWORDS = {'키워드 없음', '키워드 추출 실패', '오류'}
+
+# 검색 필드 이름 (한글 별칭 포함)
+SEARCH_FIELDS = {
+    'title': 'title', '제목': 'title',
+    'summary': 'summary', '요약': 'summary',
+    'keywords': 'keywords', 'keyword': 'keywords', '키워드': 'keywords',
+}
+# bm25 필드 가중치 (title, summary, keywords 순)
+SEARCH_WEIGHTS = (3.0, 1.0, 2.0)
+
+_TOKEN_RE = re.compile(r'\w+')
+_QUERY_RE = re.compile(r'(?:(\w+):)?(?:"([^"]*)"|(\S+))')
+
+UPSERT_SQL = f"""
+INSERT INTO articles (url_hash, {', '.join(ARTICLE_COLUMNS)})
+VALUES (?, {', '.join('?' for _ in ARTICLE_COLUMNS)})
+ON CONFLICT(url_hash) DO UPDATE SET
+    title = excluded.title,
+    link = excluded.link,
+    summary = excluded.summary,
+    keywords = excluded.keywords,
+    date = COALESCE(excluded.date, articles.date),
+    source = excluded.source,
+    text_length = COALESCE(excluded.text_length, articles.text_length),
+    collected_date = excluded.collected_date
+"""
+
+# 추가·갱신된 행에 변경 번호(rev) 부여 (store_meta의 카운터는 삭제 후에도 줄지 않음)
+STAMP_REV_SQL = "UPDATE articles SET rev = ? WHERE url_hash = ?"
+
+
+def url_hash(url):
+    """기사 URL의 고유 해시 (중복 판별 키)"""
+    return hashlib.sha1(str(url).strip().encode('utf-8')).hexdigest()
+
+
+def get_source(url):
+    """URL에서 언론사 도메인 추출"""
+    netloc = urlparse(str(url)).netloc.lower()
+    return netloc[4:] if netloc.startswith('www.') else netloc
+
+
+def parse_keywords(keywords_str):
+    """쉼표로 구분된 키워드 문자열을 중복 없는 키워드 리스트로 변환"""
+    if _clean(keywords_str) is None:
+        return []
+    seen = []
+    for k in str(keywords_str).split(','):
+        k = k.strip()
+        if len(k) > 1 and k not in PLACEHOLDER_KEYWORDS and k not in seen:
+            seen.append(k)
+    return seen
+
+
+def is_hangul(term):
+    """한글 음절이 하나라도 포함되어 있는지 여부"""
+    return any('\uac00' <= char <= '\ud7a3' for char in term)
+
+
+def _index_keywords(conn, article_keywords):
+    """(기사 ID, 키워드 문자열) 목록으로 키워드 사전과 연결 테이블 갱신"""
+    parsed = [(article_id, parse_keywords(keywords)) for article_id, keywords in article_keywords]
+    terms = {term for _, keywords in parsed for term in keywords}
+    conn.executemany(
+        "INSERT OR IGNORE INTO keyword_vocab (term, is_hangul, length) VALUES (?, ?, ?)",
+        [(term, int(is_hangul(term)), len(term)) for term in terms]
+    )
+    term_ids = {}
+    term_list = list(terms)
+    for start in range(0, len(term_list), 500):
+        chunk = term_list[start:start + 500]
+        term_ids.update(conn.execute(
+            f"SELECT term, id FROM keyword_vocab WHERE term IN ({', '.join('?' for _ in chunk)})", chunk
+        ).fetchall())
+    conn.executemany(
+        "DELETE FROM article_keywords WHERE article_id = ?", [(article_id,) for article_id, _ in parsed]
+    )
+    conn.executemany(
+        "INSERT OR IGNORE INTO article_keywords (article_id, keyword_id) VALUES (?, ?)",
+        [(article_id, term_ids[term]) for article_id, keywords in parsed for term in keywords]
+    )
+
+
+def bigrams(text):
+    """문자 bigram 토큰 문자열로 변환 (한글 부분 문자열 검색용)"""
+    if text is None:
+        return ''
+    tokens = []
+    for word in _TOKEN_RE.findall(str(text).lower()):
+        if len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return ' '.join(tokens)
+
+
+def _schema_statements():
+    """SCHEMA를 문장 단위로 나눔 (executescript는 진행 중인 트랜잭션을 커밋하므로 마이그레이션 안에서 못 씀)"""
+    statements, current = [], ''
+    for line in SCHEMA.splitlines(keepends=True):
+        current += line
+        if sqlite3.complete_statement(current):
+            statements.append(current.strip())
+            current = ''
+    return statements
+
+
+def _migrate(conn):
+    """이전 버전 저장소를 현재 스키마로 갱신 (스키마 생성부터 버전 기록까지 한 트랜잭션)
+
+    BEGIN IMMEDIATE로 쓰기 잠금을 잡은 뒤 버전을 다시 읽으므로, 여러 프로세스가 동시에
+    열어도 마이그레이션은 한 번만 실행된다.
+    """
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            conn.execute("COMMIT")
+            return
+        for statement in _schema_statements():
+            conn.execute(statement)
+        if version < 1:
+            # 검색 색인 도입 이전에 저장된 기사 색인
+            conn.execute("DELETE FROM articles_fts")
+            conn.execute(
+                "INSERT INTO articles_fts(rowid, title, summary, keywords) "
+                "SELECT id, bigrams(title), bigrams(summary), bigrams(keywords) FROM articles"
+            )
+        if version < 2:
+            # 키워드 테이블 도입 이전에 저장된 기사의 키워드 정규화
+            _index_keywords(conn, conn.execute("SELECT id, keywords FROM articles").fetchall())
+        if version < 3:
+            # 변경 감지용 rev 컬럼 (증분 로딩에서 rev > 마지막 rev인 행만 읽음)
+            conn.execute("ALTER TABLE articles ADD COLUMN rev INTEGER")
+            conn.execute("UPDATE articles SET rev = id")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_rev ON articles(rev)")
+        if version < 4:
+            # 전체 교체·삭제 뒤에도 rev가 되돌아가지 않도록 카운터를 따로 보관
+            conn.execute("CREATE TABLE IF NOT EXISTS store_meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            conn.execute(
+                "INSERT OR IGNORE INTO store_meta (key, value) "
+                "SELECT 'rev', COALESCE(MAX(rev), 0) FROM articles"
+            )
+        if version < 5:
+            # 롤업 도입 이전에 저장된 기사 반영
+            ids = [row[0] for row in conn.execute("SELECT id FROM articles")]
+            _apply_rollups(conn, ids, +1)
+        if version < 6:
+            # 집계 테이블 도입 이전에 저장된 기사 반영
+            ids = [row[0] for row in conn.execute("SELECT id FROM articles")]
+            _apply_aggregates(conn, ids, +1)
+        # 7: 보관 기사 색인 (스키마에서 빈 테이블로 생성, 이전에 보관된 기사는 색인되지 않음)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+
+# 이 프로세스에서 이미 현재 스키마임을 확인한 저장소 (연결마다 스키마·버전을 다시 확인하지 않음)
+_migrated = set()
+_migrate_lock = threading.Lock()
+
+
+def connect(db_path=DB_PATH):
+    """WAL 모드로 저장소에 연결 (프로세스에서 처음 열 때만 스키마 생성·마이그레이션)"""
+    conn = sqlite3.connect(db_path, timeout=30)
+    conn.create_function('bigrams', 1, bigrams, deterministic=True)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    # 같은 경로에 새로 만든 파일은 다시 확인하도록 inode도 함께 키로 씀
+    key = (os.path.abspath(db_path), os.stat(db_path).st_ino)
+    if key not in _migrated:
+        with _migrate_lock:
+            if key not in _migrated:
+                try:
+                    _migrate(conn)
+                except BaseException:
+                    conn.close()
+                    raise
+                _migrated.add(key)
+    return conn
+
+
+def _clean(value):
+    """pandas 결측값을 None으로 변환"""
+    if value is None:
+        return None
+    try:
+        if pd.isna(value):
+            return None
+    except (TypeError, ValueError):
+        pass
+    return value
+
+
+def _article_row(article, now):
+    """기사 dict를 INSERT 파라미터 튜플로 변환 (링크도 제목도 없으면 None)
+
+    링크가 없는 기사는 제목으로 중복 판별 키를 만든다 (빈 링크끼리 한 행으로 합쳐지지 않도록).
+    """
+    link = _clean(article.get('link')) or ''
+    title = _clean(article.get('title'))
+    if not link and not title:
+        return None
+    collected = _clean(article.get('collected_date')) or now.strftime('%Y-%m-%d %H:%M:%S')
+    date = _clean(article.get('date')) or str(collected)[:10]
+    text_length = _clean(article.get('text_length'))
+    return (
+        url_hash(link) if link else url_hash(f"title:{title}"),
+        title,
+        link,
+        _clean(article.get('summary')),
+        _clean(article.get('keywords')),
+        date,
+        _clean(article.get('source')) or get_source(link),
+        int(text_length) if text_length is not None else None,
+        collected,
+    )
+
+
+def upsert_articles(articles, db_path=DB_PATH):
+    """기사 목록을 한 트랜잭션으로 UPSERT (같은 URL은 갱신)"""
+    if isinstance(articles, pd.DataFrame):
+        articles = articles.to_dict('records')
+    now = datetime.now()
+    rows = [row for row in (_article_row(article, now) for article in articles) if row is not None]
+    if not rows:
+        return 0
+    with closing(connect(db_path)) as conn, conn:
+        # 갱신되는 기존 행의 롤업 기여분을 먼저 빼고 저장 후 다시 더함
+        hashes = list({row[0] for row in rows})
+        existing_ids = list(_ids_by_hash(conn, hashes).values())
+        _apply_rollups(conn, existing_ids, -1)
+        _apply_aggregates(conn, existing_ids, -1)
+        conn.executemany(UPSERT_SQL, rows)
+        _stamp_revs(conn, rows)
+        _index_keywords(conn, _ingested_keywords(conn, rows))
+        ids = list(_ids_by_hash(conn, hashes).values())
+        _unarchive(conn, hashes)
+        _apply_rollups(conn, ids, +1)
+        _apply_aggregates(conn, ids, +1)
+    return len(rows)
+
+
+def _chunks(values, size=500):
+    """SQLite 변수 개수 제한을 넘지 않도록 나누기"""
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _ids_by_hash(conn, hashes):
+    """URL 해시 → 기사 ID (저장소에 있는 것만)"""
+    ids = {}
+    for chunk in _chunks(hashes):
+        ids.update(conn.execute(
+            f"SELECT url_hash, id FROM articles WHERE url_hash IN ({', '.join('?' for _ in chunk)})", chunk
+        ).fetchall())
+    return ids
+
+
+def _apply_rollups(conn, article_ids, sign):
+    """기사들의 일별 기사 수·요약 길이·키워드 수를 롤업에 더하거나(+1) 빼기(-1)"""
+    daily = {}
+    keyword_counts = {}
+    for chunk in _chunks(article_ids):
+        placeholders = ', '.join('?' for _ in chunk)
+        for date, count, length_sum in conn.execute(
+            f"SELECT date, COUNT(*), COALESCE(SUM(LENGTH(summary)), 0) FROM articles "
+            f"WHERE id IN ({placeholders}) GROUP BY date", chunk
+        ):
+            total = daily.setdefault(date, [0, 0])
+            total[0] += count
+            total[1] += length_sum
+        for date, keyword_id, count in conn.execute(
+            f"SELECT a.date, k.keyword_id, COUNT(*) FROM article_keywords k "
+            f"JOIN articles a ON a.id = k.article_id WHERE k.article_id IN ({placeholders}) "
+            f"GROUP BY a.date, k.keyword_id", chunk
+        ):
+            keyword_counts[(date, keyword_id)] = keyword_counts.get((date, keyword_id), 0) + count
+    conn.executemany(
+        "INSERT INTO daily_rollups (date, article_count, summary_length_sum) VALUES (?, ?, ?) "
+        "ON CONFLICT(date) DO UPDATE SET article_count = article_count + excluded.article_count, "
+        "summary_length_sum = summary_length_sum + excluded.summary_length_sum",
+        [(date, sign * count, sign * length_sum) for date, (count, length_sum) in daily.items()]
+    )
+    conn.executemany(
+        "INSERT INTO daily_keyword_counts (date, keyword_id, count) VALUES (?, ?, ?) "
+        "ON CONFLICT(date, keyword_id) DO UPDATE SET count = count + excluded.count",
+        [(date, keyword_id, sign * count) for (date, keyword_id), count in keyword_counts.items()]
+    )
+    if sign < 0:
+        conn.execute("DELETE FROM daily_rollups WHERE article_count <= 0")
+        conn.execute("DELETE FROM daily_keyword_counts WHERE count <= 0")
+
+
+def _unarchive(conn, hashes):
+    """보관소에 있던 기사가 다시 저장되면 롤업에 남아 있던 보관 당시 기여분을 빼고 색인에서 제거
+
+    저장 후 새 행의 기여분을 더하므로 같은 기사가 롤업에 두 번 들어가지 않는다.
+    """
+    archived = []
+    for chunk in _chunks(hashes):
+        archived.extend(conn.execute(
+            f"SELECT url_hash, date, summary_length, keyword_ids FROM archived_articles "
+            f"WHERE url_hash IN ({', '.join('?' for _ in chunk)})", chunk
+        ).fetchall())
+    if not archived:
+        return
+    conn.executemany(
+        "UPDATE daily_rollups SET article_count = article_count - 1, "
+        "summary_length_sum = summary_length_sum - ? WHERE date = ?",
+        [(summary_length, date) for _, date, summary_length, _ in archived]
+    )
+    conn.executemany(
+        "UPDATE daily_keyword_counts SET count = count - 1 WHERE date = ? AND keyword_id = ?",
+        [(date, int(keyword_id)) for _, date, _, keyword_ids in archived
+         for keyword_id in keyword_ids.split(',') if keyword_id]
+    )
+    conn.execute("DELETE FROM daily_rollups WHERE article_count <= 0")
+    conn.execute("DELETE FROM daily_keyword_counts WHERE count <= 0")
+    conn.executemany("DELETE FROM archived_articles WHERE url_hash = ?", [(row[0],) for row in archived])
+
+
+def _apply_aggregates(conn, article_ids, sign):
+    """기사들의 날짜·출처·요약 길이 구간별 수와 키워드 빈도를 현재 저장소 집계에 더하거나(+1) 빼기(-1)"""
+    counts = {}
+    keyword_counts = {}
+    # 한 쿼리에 ID 목록이 네 번 들어가므로 작은 묶음으로 나눔
+    for chunk in _chunks(article_ids, 200):
+        placeholders = ', '.join('?' for _ in chunk)
+        for kind, key, count, total in conn.execute(
+            f"SELECT 'all', '', COUNT(*), COALESCE(SUM(LENGTH(summary)), 0) FROM articles WHERE id IN ({placeholders}) "
+            f"UNION ALL SELECT 'date', date, COUNT(*), 0 FROM articles WHERE id IN ({placeholders}) GROUP BY date "
+            f"UNION ALL SELECT 'source', COALESCE(source, ''), COUNT(*), 0 FROM articles "
+            f"WHERE id IN ({placeholders}) GROUP BY COALESCE(source, '') "
+            f"UNION ALL SELECT 'summary_length', COALESCE(LENGTH(summary), 0) / {SUMMARY_LENGTH_BIN} * {SUMMARY_LENGTH_BIN}, "
+            f"COUNT(*), 0 FROM articles WHERE id IN ({placeholders}) GROUP BY 2",
+            chunk * 4
+        ):
+            if kind == 'all' and not count:
+                continue
+            total_count = counts.setdefault((kind, str(key)), [0, 0])
+            total_count[0] += count
+            total_count[1] += total
+        for keyword_id, count in conn.execute(
+            f"SELECT keyword_id, COUNT(*) FROM article_keywords WHERE article_id IN ({placeholders}) "
+            f"GROUP BY keyword_id", chunk
+        ):
+            keyword_counts[keyword_id] = keyword_counts.get(keyword_id, 0) + count
+    conn.executemany(
+        "INSERT INTO store_aggregates (kind, key, count, total) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT(kind, key) DO UPDATE SET count = count + excluded.count, total = total + excluded.total",
+        [(kind, key, sign * count, sign * total) for (kind, key), (count, total) in counts.items()]
+    )
+    conn.executemany(
+        "INSERT INTO keyword_totals (keyword_id, count) VALUES (?, ?) "
+        "ON CONFLICT(keyword_id) DO UPDATE SET count = count + excluded.count",
+        [(keyword_id, sign * count) for keyword_id, count in keyword_counts.items()]
+    )
+    if sign < 0:
+        conn.execute("DELETE FROM store_aggregates WHERE count <= 0")
+        conn.execute("DELETE FROM keyword_totals WHERE count <= 0")
+
+
+def _stamp_revs(conn, rows):
+    """저장한 행 수만큼 rev 번호를 예약해 순서대로 부여"""
+    conn.execute("UPDATE store_meta SET value = value + ? WHERE key = 'rev'", (len(rows),))
+    last_rev = conn.execute("SELECT value FROM store_meta WHERE key = 'rev'").fetchone()[0]
+    first_rev = last_rev - len(rows) + 1
+    conn.executemany(STAMP_REV_SQL, [(first_rev + i, row[0]) for i, row in enumerate(rows)])
+
+
+def _ingested_keywords(conn, rows):
+    """방금 저장한 행들의 (기사 ID, 키워드 문자열) 목록"""
+    keywords_by_hash = {row[0]: row[4] for row in rows}
+    ids = _ids_by_hash(conn, list(keywords_by_hash))
+    return [(article_id, keywords_by_hash[hash_value]) for hash_value, article_id in ids.items()]
+
+
+def replace_articles(articles, db_path=DB_PATH):
+    """저장소 전체를 주어진 기사 목록으로 교체"""
+    if isinstance(articles, pd.DataFrame):
+        articles = articles.to_dict('records')
+    now = datetime.now()
+    rows = [row for row in (_article_row(article, now) for article in articles) if row is not None]
+    with closing(connect(db_path)) as conn, conn:
+        # 롤업에서는 지금 저장소에 있는 기사의 기여분만 빼고 보관소로 옮겨진 기사의 기록은 유지
+        _apply_rollups(conn, [row[0] for row in conn.execute("SELECT id FROM articles")], -1)
+        conn.execute("DELETE FROM articles")
+        conn.execute("DELETE FROM store_aggregates")
+        conn.execute("DELETE FROM keyword_totals")
+        conn.executemany(UPSERT_SQL, rows)
+        _stamp_revs(conn, rows)
+        _index_keywords(conn, _ingested_keywords(conn, rows))
+        hashes = [row[0] for row in rows]
+        ids = list(_ids_by_hash(conn, hashes).values())
+        _unarchive(conn, hashes)
+        _apply_rollups(conn, ids, +1)
+        _apply_aggregates(conn, ids, +1)
+    return len(rows)
+
+
+def load_articles_before(cutoff_date, columns=None, db_path=DB_PATH):
+    """date가 cutoff_date보다 이른 기사 (보관 대상)"""
+    columns = columns or ARTICLE_COLUMNS
+    with closing(connect(db_path)) as conn:
+        return pd.read_sql_query(
+            f"SELECT id, {', '.join(columns)} FROM articles WHERE date < ? ORDER BY id",
+            conn, params=(cutoff_date,), index_col='id'
+        )
+
+
+def delete_articles(article_ids, db_path=DB_PATH):
+    """기사를 저장소에서 삭제 (일별 롤업은 유지, 현재 저장소 집계에서는 뺌)"""
+    with closing(connect(db_path)) as conn, conn:
+        _apply_aggregates(conn, article_ids, -1)
+        for chunk in _chunks(article_ids):
+            conn.execute(f"DELETE FROM articles WHERE id IN ({', '.join('?' for _ in chunk)})", chunk)
+    return len(article_ids)
+
+
+def archive_articles(article_ids, db_path=DB_PATH):
+    """보관소로 옮긴 기사를 보관 색인에 기록하고 저장소에서 삭제 (일별 롤업 기여분은 유지)"""
+    with closing(connect(db_path)) as conn, conn:
+        for chunk in _chunks(article_ids):
+            conn.execute(
+                "INSERT OR REPLACE INTO archived_articles (url_hash, date, summary_length, keyword_ids) "
+                "SELECT a.url_hash, a.date, COALESCE(LENGTH(a.summary), 0), "
+                "COALESCE((SELECT GROUP_CONCAT(k.keyword_id) FROM article_keywords k WHERE k.article_id = a.id), '') "
+                f"FROM articles a WHERE a.id IN ({', '.join('?' for _ in chunk)})", chunk
+            )
+    return delete_articles(article_ids, db_path=db_path)
+
+
+def latest_date(db_path=DB_PATH):
+    """저장소에서 가장 최근 기사 날짜"""
+    with closing(connect(db_path)) as conn:
+        return conn.execute("SELECT MAX(date) FROM articles").fetchone()[0]
+
+
+def load_daily_rollups(db_path=DB_PATH):
+    """전체 기간 일별 기사 수와 평균 요약 길이"""
+    with closing(connect(db_path)) as conn:
+        return pd.read_sql_query(
+            "SELECT date, article_count, CAST(summary_length_sum AS REAL) / article_count "
+            "AS avg_summary_length FROM daily_rollups ORDER BY date", conn
+        )
+
+
+def load_aggregates(db_path=DB_PATH):
+    """현재 저장소 집계 (기사 수, 요약 길이 합, 키워드 빈도, 날짜·출처·요약 길이 구간별 기사 수)
+
+    저장할 때 유지되는 집계 테이블만 읽으므로 기사 수와 무관하게 가볍다.
+    """
+    with closing(connect(db_path)) as conn:
+        rows = conn.execute("SELECT kind, key, count, total FROM store_aggregates").fetchall()
+        keyword_total, keyword_unique = conn.execute(
+            "SELECT COALESCE(SUM(count), 0), COUNT(*) FROM keyword_totals"
+        ).fetchone()
+        keyword_counts = pd.read_sql_query(
+            "SELECT v.term, v.is_hangul, v.length, t.count FROM keyword_totals t "
+            "JOIN keyword_vocab v ON v.id = t.keyword_id ORDER BY t.count DESC, v.id", conn
+        )
+    grouped = {}
+    articles = summary_length_sum = 0
+    for kind, key, count, total in rows:
+        if kind == 'all':
+            articles, summary_length_sum = count, total
+        else:
+            grouped.setdefault(kind, {})[key] = count
+    length_bins = {int(key): count for key, count in grouped.get('summary_length', {}).items()}
+    return {
+        'articles': articles,
+        'summary_length_sum': summary_length_sum,
+        'avg_summary_length': summary_length_sum / articles if articles else 0.0,
+        'keyword_total': keyword_total,
+        'keyword_unique': keyword_unique,
+        'keyword_counts': keyword_counts,
+        'by_date': pd.Series(grouped.get('date', {}), dtype='int64').sort_index(),
+        'by_source': pd.Series(grouped.get('source', {}), dtype='int64').sort_values(ascending=False),
+        'summary_length_histogram': pd.Series(length_bins, dtype='int64').sort_index(),
+    }
+
+
+def load_daily_keyword_counts(top=None, recent_days=None, db_path=DB_PATH):
+    """전체 기간 날짜·키워드별 빈도
+
+    top이 있으면 전체 빈도 상위 top개 키워드만, recent_days도 있으면 가장 최근 날짜부터
+    recent_days일 동안의 빈도 상위 top개 키워드를 합쳐 가져온다.
+    """
+    sql = (
+        "SELECT d.date, v.term AS keyword, d.count FROM daily_keyword_counts d "
+        "JOIN keyword_vocab v ON v.id = d.keyword_id"
+    )
+    params = ()
+    if top:
+        sql += (
+            " WHERE d.keyword_id IN (SELECT keyword_id FROM daily_keyword_counts "
+            "GROUP BY keyword_id ORDER BY SUM(count) DESC LIMIT ?)"
+        )
+        params = (top,)
+        if recent_days:
+            sql += (
+                " OR d.keyword_id IN (SELECT keyword_id FROM daily_keyword_counts "
+                "WHERE date > date((SELECT MAX(date) FROM daily_keyword_counts), ?) "
+                "GROUP BY keyword_id ORDER BY SUM(count) DESC LIMIT ?)"
+            )
+            params += (f"-{int(recent_days)} days", top)
+    with closing(connect(db_path)) as conn:
+        return pd.read_sql_query(sql + " ORDER BY d.date", conn, params=params)
+
+
+def count_articles(db_path=DB_PATH):
+    """저장된 기사 수"""
+    with closing(connect(db_path)) as conn:
+        return conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+
+def load_articles(columns=None, db_path=DB_PATH):
+    """저장된 기사를 저장 순서대로 DataFrame으로 로드 (인덱스는 기사 ID)"""
+    columns = columns or DISPLAY_COLUMNS
+    with closing(connect(db_path)) as conn:
+        return pd.read_sql_query(
+            f"SELECT id, {', '.join(columns)} FROM articles ORDER BY id", conn, index_col='id'
+        )
+
+
+def load_changes(since_rev=0, columns=None, db_path=DB_PATH):
+    """rev가 since_rev보다 큰 (새로 추가되거나 갱신된) 기사를 로드
+
+    (변경 기사 DataFrame, 전체 기사 수, 최대 rev)를 같은 읽기 스냅샷에서 반환
+    """
+    columns = columns or DISPLAY_COLUMNS
+    with closing(connect(db_path)) as conn:
+        conn.execute("BEGIN")
+        count = conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+        max_rev = conn.execute("SELECT value FROM store_meta WHERE key = 'rev'").fetchone()[0]
+        frame = pd.read_sql_query(
+            f"SELECT id, {', '.join(columns)} FROM articles WHERE rev > ? AND rev <= ? ORDER BY id",
+            conn, params=(since_rev, max_rev), index_col='id'
+        )
+        conn.rollback()
+    return frame, count, max_rev
+
+
+def load_articles_since(since_rev=None, columns=None, limit=None, db_path=DB_PATH):
+    """rev 색인으로 since_rev 이후 추가·갱신된 기사만 최신순으로 로드 (rev 컬럼 포함)
+
+    since_rev가 None이면 가장 최근 limit개를 읽는다.
+    """
+    columns = columns or DISPLAY_COLUMNS
+    sql = f"SELECT id, rev, {', '.join(columns)} FROM articles"
+    params = []
+    if since_rev is not None:
+        sql += " WHERE rev > ?"
+        params.append(since_rev)
+    sql += " ORDER BY rev DESC"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    with closing(connect(db_path)) as conn:
+        return pd.read_sql_query(sql, conn, params=params, index_col='id')
+
+
+def count_keywords_in_revs(first_rev, last_rev, db_path=DB_PATH):
+    """rev가 first_rev~last_rev인 기사들의 키워드 연결 수 (rev 색인과 기사→키워드 테이블로 계산)"""
+    with closing(connect(db_path)) as conn:
+        return conn.execute(
+            "SELECT COUNT(*) FROM article_keywords k JOIN articles a ON a.id = k.article_id "
+            "WHERE a.rev BETWEEN ? AND ?", (first_rev, last_rev)
+        ).fetchone()[0]
+
+
+def load_keyword_edges(db_path=DB_PATH):
+    """키워드 사전과 기사→키워드 연결을 DataFrame 두 개로 로드"""
+    with closing(connect(db_path)) as conn:
+        vocab = pd.read_sql_query(
+            "SELECT id, term, is_hangul, length FROM keyword_vocab ORDER BY id", conn
+        )
+        edges = pd.read_sql_query(
+            "SELECT article_id, keyword_id FROM article_keywords ORDER BY article_id", conn
+        )
+    return vocab, edges
+
+
+def _term_expression(term, prefix_ok=True):
+    """검색어 하나를 bigram 구문 검색식으로 변환"""
+    tokens = bigrams(term).split()
+    if not tokens:
+        return None
+    if len(tokens) == 1 and len(tokens[0]) == 1 and prefix_ok:
+        # 한 글자 검색어는 해당 글자로 시작하는 bigram 접두 검색
+        return f'"{tokens[0]}"*'
+    return '"' + ' '.join(tokens) + '"'
+
+
+def parse_search_query(query):
+    """검색어를 FTS5 MATCH 식으로 변환
+
+    공백은 AND, OR는 합집합, "..."는 구문 검색, 필드:검색어는 해당 필드만 검색
+    (필드: title/제목, summary/요약, keywords/키워드)
+    """
+    clauses = []
+    pending_or = False
+    for field, phrase, word in _QUERY_RE.findall(query or ''):
+        if phrase == '' and word in ('AND', '&&'):
+            continue
+        if phrase == '' and word in ('OR', '||'):
+            pending_or = bool(clauses)
+            continue
+        expr = _term_expression(phrase if phrase else word, prefix_ok=not phrase)
+        if expr is None:
+            continue
+        column = SEARCH_FIELDS.get(field.lower()) if field else None
+        if field and column is None:
+            # 알 수 없는 필드는 일반 검색어로 취급
+            expr = _term_expression(f"{field}:{phrase or word}")
+        elif column:
+            expr = f"{column} : {expr}"
+        if pending_or:
+            clauses[-1] = f"{clauses[-1]} OR {expr}"
+            pending_or = False
+        else:
+            clauses.append(expr)
+    return ' AND '.join(f"({c})" for c in clauses)
+
+
+def search_articles(query, limit=None, db_path=DB_PATH):
+    """검색어와 일치하는 기사 ID를 관련도 순으로 반환"""
+    expression = parse_search_query(query)
+    if not expression:
+        return []
+    sql = (
+        "SELECT rowid FROM articles_fts WHERE articles_fts MATCH ? "
+        f"ORDER BY bm25(articles_fts, {', '.join(str(w) for w in SEARCH_WEIGHTS)})"
+    )
+    params = [expression]
+    if limit:
+        sql += " LIMIT ?"
+        params.append(limit)
+    with closing(connect(db_path)) as conn:
+        return [row[0] for row in conn.execute(sql, params)]
+
+
+def import_csv(csv_path, db_path=DB_PATH):
+    """CSV 파일의 기사를 저장소로 가져오기"""
+    df = pd.read_csv(csv_path)
+    df = df[df['link'].notna()] if 'link' in df.columns else df.iloc[0:0]
+    return upsert_articles(df, db_path=db_path)
+
+
+def export_csv(csv_path, columns=None, db_path=DB_PATH):
+    """저장소의 기사를 CSV 파일로 내보내기"""
+    from dataset_writer import atomic_write_csv
+    df = load_articles(columns=columns, db_path=db_path)
+    atomic_write_csv(df, csv_path)
+    return len(df)
+
+
+def ensure_seeded(db_path=DB_PATH, seed_csv=SEED_CSV_PATH):
+    """저장소가 비어 있으면 기존 CSV를 한 번 가져오기"""
+    if count_articles(db_path) == 0 and os.path.exists(seed_csv):
+        return import_csv(seed_csv, db_path=db_path)
+    return 0
+
+
+if __name__ == "__main__":
+    # 사용법: python news_store.py import|export <csv 파일>
+    if len(sys.argv) != 3 or sys.argv[1] not in ('import', 'export'):
+        print("사용법: python news_store.py import|export <csv 파일>")
+        sys.exit(1)
+    command, path = sys.argv[1], sys.argv[2]
+    if command == 'import':
+        print(f"✅ {import_csv(path)}개 기사를 {DB_PATH}로 가져왔습니다.")
+    else:
+        print(f"✅ {export_csv(path)}개 기사를 {path}로 내보냈습니다.")
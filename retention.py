@@ -0,0 +1,60 @@
+import gzip
+import os
+from datetime import datetime, timedelta
+
+import news_store
+from dataset_writer import file_lock
+
+# 주 저장소에 남길 최근 기간 (가장 최근 기사 날짜 기준)
+HOT_DAYS = 180
+# 월 단위로 나눈 압축 보관 파일 위치
+ARCHIVE_DIR = "archive"
+
+
+def partition_path(month, archive_dir=ARCHIVE_DIR):
+    """월(YYYY-MM)별 보관 파일 경로"""
+    return os.path.join(archive_dir, f"articles-{month}.csv.gz")
+
+
+def _append_partition(df, path):
+    """보관 파일 끝에 gzip 멤버를 덧붙여 기록 (기존 내용은 다시 쓰지 않음)"""
+    with file_lock(path):
+        write_header = not os.path.exists(path)
+        with gzip.open(path, 'at', encoding='utf-8', newline='') as f:
+            df.to_csv(f, header=write_header, index=False)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def archive_old_articles(hot_days=HOT_DAYS, db_path=news_store.DB_PATH, archive_dir=ARCHIVE_DIR):
+    """보관 기간이 지난 기사를 월별 압축 파일로 옮기고 주 저장소에서 삭제
+
+    선택부터 삭제까지 writer 잠금을 잡고 진행하므로, 그 사이에 갱신된 기사를
+    갱신 전 내용으로 보관하거나 보관 후 지우는 일이 없다.
+    """
+    with file_lock(db_path):
+        newest = news_store.latest_date(db_path=db_path)
+        if not newest:
+            return 0
+        try:
+            cutoff = (datetime.strptime(str(newest)[:10], '%Y-%m-%d') - timedelta(days=hot_days)).strftime('%Y-%m-%d')
+        except ValueError:
+            return 0
+        old = news_store.load_articles_before(cutoff, db_path=db_path)
+        if old.empty:
+            return 0
+        os.makedirs(archive_dir, exist_ok=True)
+        months = old['date'].astype(str).str[:7]
+        for month, part in old.groupby(months):
+            _append_partition(part[news_store.ARTICLE_COLUMNS], partition_path(month, archive_dir))
+        # 보관 파일 기록이 끝난 뒤에 삭제 (일별 롤업은 그대로 두고 보관 색인에 기록)
+        news_store.archive_articles(old.index.tolist(), db_path=db_path)
+    return len(old)
+
+
+def apply_retention(hot_days=HOT_DAYS, db_path=news_store.DB_PATH):
+    """수집 후 호출: 오래된 기사를 보관소로 이동"""
+    moved = archive_old_articles(hot_days=hot_days, db_path=db_path)
+    if moved:
+        print(f"📦 {moved}개 기사를 보관소({ARCHIVE_DIR})로 이동했습니다.")
+    return moved
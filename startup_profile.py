@@ -0,0 +1,76 @@
+import ast
+import os
+import subprocess
+import sys
+
+import pandas as pd
+
+# app01.py 시작 시 모듈 import에 허용하는 시간 (이 값을 넘으면 회귀로 판단)
+# scipy·pyarrow를 쓰는 모듈을 지연 import로 옮기면서 약 150ms 줄인 만큼 낮춤
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app01.py")
+STARTUP_BUDGET_MS = float(os.environ.get("STARTUP_BUDGET_MS", 1350))
+
+
+def startup_modules(app_path=APP_PATH):
+    """앱 스크립트의 최상위 import 모듈 목록 (함수·탭 안의 지연 import는 제외)"""
+    with open(app_path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=app_path)
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules.append(node.module)
+    return list(dict.fromkeys(modules))
+
+
+def parse_importtime(output):
+    """-X importtime 출력을 (module, self_ms, cumulative_ms, depth) DataFrame으로 변환"""
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        rows.append((name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000, depth))
+    return pd.DataFrame(rows, columns=['module', 'self_ms', 'cumulative_ms', 'depth'])
+
+
+def profile_startup(app_path=APP_PATH, python=sys.executable):
+    """새 인터프리터에서 앱의 최상위 import만 실행해 import 시간 측정"""
+    modules = startup_modules(app_path)
+    code = '\n'.join(f"import {module}" for module in modules)
+    result = subprocess.run(
+        [python, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True, timeout=300, cwd=os.path.dirname(app_path)
+    )
+    timings = parse_importtime(result.stderr)
+    # 인터프리터 기동 시 import(site, encodings 등)는 제외하고 앱이 요청한 모듈만 합산
+    roots = {module.split('.')[0] for module in modules}
+    top_level = timings[(timings['depth'] == 0) & timings['module'].str.split('.').str[0].isin(roots)]
+    return {
+        'modules': modules,
+        'timings': timings,
+        'top_level': top_level.sort_values('cumulative_ms', ascending=False),
+        'total_ms': float(top_level['cumulative_ms'].sum()),
+        'budget_ms': STARTUP_BUDGET_MS,
+        # stderr가 비어 있으면 종료 코드로 대신 표시
+        'error': (result.stderr.strip().splitlines() or [f"exit {result.returncode}"])[-1] if result.returncode else None,
+    }
+
+
+def over_budget(report):
+    """측정값이 예산을 넘었는지 여부"""
+    return report['error'] is not None or report['total_ms'] > report['budget_ms']
+
+
+if __name__ == "__main__":
+    report = profile_startup()
+    print(report['top_level'].head(15).to_string(index=False))
+    print(f"\n총 import 시간: {report['total_ms']:.0f}ms (예산 {report['budget_ms']:.0f}ms)")
+    if report['error']:
+        print(f"❌ import 실패: {report['error']}")
+    if over_budget(report):
+        print("❌ 시작 시간 예산 초과")
+        sys.exit(1)
+    print("✅ 예산 이내")
@@ -0,0 +1,144 @@
+import hashlib
+import re
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+import body_store
+
+_SENTENCE_RE = re.compile(r'[.!?]\s+')
+
+# 끝난 벤치마크 결과를 보관하는 최대 개수 (넘으면 오래 전에 끝난 것부터 버림)
+MAX_FINISHED_JOBS = 8
+
+RESULT_COLUMNS = [
+    'summarizer', 'link', 'latency_ms', 'input_chars', 'output_chars',
+    'compression', 'input_sentences', 'output_sentences', 'error',
+]
+
+
+def count_sentences(text):
+    """요약 비교 탭과 같은 기준의 문장 수"""
+    return len([s for s in _SENTENCE_RE.split(text or '') if s.strip()])
+
+
+def load_documents(links, limit=None):
+    """본문 저장소에 저장된 실제 기사 본문 (link, text) 목록 - 세그먼트 순서로 읽음"""
+    documents = []
+    for link, text in body_store.iter_texts(links):
+        documents.append((link, text))
+        if limit is not None and len(documents) >= limit:
+            break
+    return documents
+
+
+def benchmark_key(summarizers, documents):
+    """요약기 이름과 문서 내용으로 만든 결과 캐시 키"""
+    digest = hashlib.sha256()
+    for name in sorted(summarizers):
+        digest.update(name.encode('utf-8') + b'\0')
+    for link, text in documents:
+        digest.update(link.encode('utf-8') + b'\0' + hashlib.sha256(text.encode('utf-8')).digest())
+    return digest.hexdigest()
+
+
+def run_benchmark(summarizers, documents, progress=None):
+    """모든 요약기를 모든 문서에 실행해 문서별 지연 시간·압축률·문장 수 기록"""
+    rows = []
+    total = len(summarizers) * len(documents)
+    for name, summarize in summarizers.items():
+        for link, text in documents:
+            error = None
+            start = time.perf_counter()
+            try:
+                summary = summarize(text) or ''
+            except Exception as e:
+                summary, error = '', str(e)
+            latency_ms = (time.perf_counter() - start) * 1000
+            rows.append((
+                name, link, latency_ms, len(text), len(summary),
+                len(summary) / len(text) * 100 if text else 0.0,
+                count_sentences(text), count_sentences(summary), error,
+            ))
+            if progress is not None:
+                progress(len(rows), total)
+    return pd.DataFrame(rows, columns=RESULT_COLUMNS)
+
+
+def summarize_results(results):
+    """요약기별 분포 요약 (p50/p95 지연 시간, 처리량, 평균 압축률·문장 수)"""
+    stats = []
+    for name, group in results.groupby('summarizer', sort=False):
+        latency = group['latency_ms'].to_numpy()
+        total_seconds = latency.sum() / 1000
+        stats.append({
+            'summarizer': name,
+            'docs': len(group),
+            'p50_ms': float(np.percentile(latency, 50)),
+            'p95_ms': float(np.percentile(latency, 95)),
+            'docs_per_sec': len(group) / total_seconds if total_seconds else float('inf'),
+            'compression_pct': float(group['compression'].mean()),
+            'output_sentences': float(group['output_sentences'].mean()),
+            'errors': int(group['error'].notna().sum()),
+        })
+    return pd.DataFrame(stats)
+
+
+class BenchmarkRunner:
+    """요약 벤치마크를 백그라운드 스레드에서 실행하고 결과를 키별로 보관
+
+    작업 dict의 finished 이벤트가 설정된 뒤에만 results·summary·finished_at을 읽는다.
+    끝난 작업은 최근 MAX_FINISHED_JOBS개만 남긴다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._jobs = {}
+
+    def start(self, summarizers, documents):
+        """같은 요약기·문서 조합이면 기존 작업(또는 캐시된 결과)을 그대로 반환"""
+        key = benchmark_key(summarizers, documents)
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and job['error'] is None:
+                return key
+            job = self._jobs[key] = {
+                'done': 0, 'total': len(summarizers) * len(documents),
+                'results': None, 'summary': None, 'error': None, 'started_at': time.time(), 'finished_at': None,
+                'finished': threading.Event(),
+            }
+            self._evict()
+        thread = threading.Thread(
+            target=self._run, args=(job, summarizers, documents), name="summarizer-bench", daemon=True
+        )
+        thread.start()
+        return key
+
+    def _run(self, job, summarizers, documents):
+        def progress(done, total):
+            job['done'] = done
+        try:
+            results = run_benchmark(summarizers, documents, progress=progress)
+            summary = summarize_results(results)
+            job['results'] = results
+            job['summary'] = summary
+        except Exception as e:
+            job['error'] = e
+        job['finished_at'] = time.time()
+        # 모든 필드를 채운 뒤 마지막에 완료 표시
+        job['finished'].set()
+
+    def _evict(self):
+        """잠금을 잡은 상태에서 호출 - 오래 전에 끝난 작업부터 버려 MAX_FINISHED_JOBS개만 유지"""
+        finished = sorted(
+            (job['finished_at'], key) for key, job in self._jobs.items() if job['finished'].is_set()
+        )
+        for _, key in finished[:max(len(finished) - MAX_FINISHED_JOBS, 0)]:
+            del self._jobs[key]
+
+    def status(self, key):
+        """작업 상태 dict (없으면 None)"""
+        with self._lock:
+            return self._jobs.get(key)
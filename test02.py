@@ -5,6 +5,11 @@ import time
 import urllib.parse
 import re
 from collections import Counter
+import news_store
+import dataset_writer
+import body_store
+from data_loader import publish_snapshot
+from retention import apply_retention
 
 # ✅ 키워드: 디지털 헬스케어
 SEARCH_KEYWORD = "디지털 헬스케어"
@@ -204,8 +209,8 @@ def get_yna_article_links(keyword, pages=1):
         return []
 
 # 2. 기사 본문 추출 (개선된 버전)
-def extract_article_text(url):
-    """다양한 뉴스 사이트의 기사 본문 추출"""
+def extract_article_text(url, bodies=None):
+    """다양한 뉴스 사이트의 기사 본문 추출 (bodies가 있으면 원문 HTML과 본문을 담아 둠)"""
     try:
         print(f"📄 본문 추출 중: {url[:50]}...")
         
@@ -257,6 +262,8 @@ def extract_article_text(url):
                 if valid_paragraphs:
                     text = ' '.join([p.get_text(strip=True) for p in valid_paragraphs])
                     print(f"✅ p 태그로 본문 추출 ({len(text)} 문자)")
+                    if bodies is not None:
+                        bodies.append((url, res.text, text))
                     return text[:1500]  # 최대 1500자
             
             print("⚠️ 본문을 찾을 수 없습니다.")
@@ -278,6 +285,8 @@ def extract_article_text(url):
             return ''
         
         print(f"✅ 본문 추출 완료 ({len(text)} 문자)")
+        if bodies is not None:
+            bodies.append((url, res.text, text))
         return text[:1500]  # 최대 1500자로 제한
         
     except requests.exceptions.RequestException as e:
@@ -481,33 +490,21 @@ def run_pipeline():
                 }
             ]
             
-            sample_df = pd.DataFrame(sample_data)
+            # 저장소에 추가 (같은 URL은 갱신)
+            news_store.ensure_seeded()
+            dataset_writer.append_articles(sample_data)
             
-            # 기존 데이터와 합치기
-            try:
-                existing_df = pd.read_csv("digital_healthcare_news.csv")
-                print(f"📂 기존 데이터 {len(existing_df)}개 발견")
-                
-                combined_df = pd.concat([existing_df, sample_df], ignore_index=True)
-                combined_df = combined_df.drop_duplicates(subset=['title'], keep='last')
-                
-                # 최대 10개로 제한
-                if len(combined_df) > 10:
-                    combined_df = combined_df.tail(10)
-                    
-            except FileNotFoundError:
-                print("📂 기존 데이터 파일이 없어 새로 생성합니다.")
-                combined_df = sample_df
+            # 오래된 기사는 보관소로 이동 (일별 롤업은 유지)
+            apply_retention()
+            publish_snapshot()
+            total_count = news_store.count_articles()
             
-            # 두 파일에 모두 저장
-            combined_df.to_csv("yna_digital_healthcare_news.csv", index=False, encoding="utf-8-sig")
-            combined_df.to_csv("digital_healthcare_news.csv", index=False, encoding="utf-8-sig")
-            
-            print(f"✅ 샘플 데이터 저장 완료: 총 {len(combined_df)}개 기사")
-            print("📁 파일: yna_digital_healthcare_news.csv, digital_healthcare_news.csv")
+            print(f"✅ 샘플 데이터 저장 완료: 총 {total_count}개 기사")
+            print(f"📁 저장소: {news_store.DB_PATH}")
             return
         
         results = []
+        bodies = []
         total_articles = min(len(articles), 7)  # 최대 7개 기사 처리
         
         print(f"📊 총 {total_articles}개 기사를 처리합니다...\n")
@@ -518,7 +515,7 @@ def run_pipeline():
             
             try:
                 # 본문 추출
-                full_text = extract_yna_article_text(article['link'])
+                full_text = extract_article_text(article['link'], bodies)
                 
                 if not full_text:
                     print("⚠️ 본문을 추출할 수 없어 건너뜁니다.")
@@ -557,40 +554,20 @@ def run_pipeline():
         # 결과 저장 및 기존 데이터와 합치기
         if results:
             try:
-                new_df = pd.DataFrame(results)
-                
-                # 기존 데이터 로드 시도
-                try:
-                    existing_df = pd.read_csv("digital_healthcare_news.csv")
-                    print(f"📂 기존 데이터 {len(existing_df)}개 발견")
-                    
-                    # 기존 데이터와 새 데이터 합치기
-                    combined_df = pd.concat([existing_df, new_df], ignore_index=True)
-                    
-                    # 중복 제거 (제목 기준)
-                    combined_df = combined_df.drop_duplicates(subset=['title'], keep='last')
-                    
-                    # 최대 10개로 제한
-                    if len(combined_df) > 10:
-                        combined_df = combined_df.tail(10)  # 최신 10개 유지
-                    
-                    print(f"📊 합쳐진 데이터: {len(combined_df)}개")
-                    
-                except FileNotFoundError:
-                    print("📂 기존 데이터 파일이 없어 새로 생성합니다.")
-                    combined_df = new_df
+                # 저장소에 새 기사만 추가 (같은 URL은 갱신)
+                news_store.ensure_seeded()
+                dataset_writer.append_articles(results)
                 
-                # 두 파일에 모두 저장
-                csv_filename = "yna_digital_healthcare_news.csv"
-                combined_df.to_csv(csv_filename, index=False, encoding="utf-8-sig")
-                
-                # app01.py에서 사용하는 파일에도 저장
-                combined_df.to_csv("digital_healthcare_news.csv", index=False, encoding="utf-8-sig")
+                # 오래된 기사는 보관소로 이동 (일별 롤업은 유지)
+                apply_retention()
+                publish_snapshot()
+                combined_df = news_store.load_articles(
+                    columns=['title', 'link', 'summary', 'keywords', 'text_length', 'date']
+                )
                 
                 print(f"\n" + "="*60)
                 print("✅ 분석 완료!")
-                print(f"📁 결과 파일: {csv_filename}")
-                print(f"�  app01.py용 파일: digital_healthcare_news.csv")
+                print(f"📁 저장소: {news_store.DB_PATH}")
                 print(f"📊 새로 처리된 기사 수: {len(results)}개")
                 print(f"📊 총 기사 수: {len(combined_df)}개")
                 print("="*60)
@@ -601,11 +578,11 @@ def run_pipeline():
                     print(f"\n[{i}] {row['title'][:50]}...")
                     print(f"    📝 요약: {str(row['summary'])[:100]}...")
                     print(f"    🏷️ 키워드: {row['keywords']}")
-                    if 'text_length' in row:
+                    if pd.notna(row['text_length']):
                         print(f"    📏 본문 길이: {row['text_length']}자")
                 
             except Exception as e:
-                print(f"❌ CSV 파일 저장 오류: {e}")
+                print(f"❌ 저장소 저장 오류: {e}")
                 
                 # 백업: 텍스트 파일로 저장
                 try:
@@ -626,6 +603,14 @@ def run_pipeline():
                     print(f"❌ 백업 파일 저장도 실패: {backup_error}")
         else:
             print("\n❌ 처리된 기사가 없습니다.")
+        
+        # 원문은 기사 저장 뒤에 본문 저장소에 한 번에 저장 (실패해도 기사 저장에는 영향 없음)
+        if bodies:
+            try:
+                saved = body_store.save_bodies(bodies)
+                print(f"🗄️ 본문 {len(bodies)}개 저장 (새 내용 {saved}개)")
+            except Exception as e:
+                print(f"⚠️ 본문 저장 실패: {e}")
             
     except Exception as e:
         print(f"❌ 파이프라인 실행 오류: {e}")
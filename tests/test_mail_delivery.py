@@ -0,0 +1,164 @@
+import os
+import socketserver
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mail_delivery  # noqa: E402
+from mail_delivery import MailDelivery, build_message  # noqa: E402
+
+
+class FakeSMTPHandler(socketserver.StreamRequestHandler):
+    """AUTH를 받아 주고 주소에 'bad'가 들어간 수신자는 거부하는 최소 SMTP 서버"""
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        delivered = 0
+        envelope = []
+
+        def reply(line):
+            self.wfile.write(f"{line}\r\n".encode())
+
+        reply("220 fake")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode().strip()
+            verb = command.upper()
+            if verb.startswith('EHLO'):
+                reply("250-fake")
+                reply("250 AUTH PLAIN LOGIN")
+            elif verb.startswith('AUTH'):
+                reply("235 ok")
+            elif verb.startswith('MAIL'):
+                if server.drop_after is not None and delivered >= server.drop_after:
+                    # 응답 없이 연결을 끊어 클라이언트가 SMTPServerDisconnected를 받게 함
+                    return
+                envelope = []
+                reply("250 ok")
+            elif verb.startswith('RCPT'):
+                if 'bad' in command:
+                    reply("550 no such user")
+                else:
+                    envelope.append(command.split(':', 1)[1].strip(' <>'))
+                    reply("250 ok")
+            elif verb == 'DATA':
+                reply("354 go")
+                while self.rfile.readline().rstrip(b'\r\n') != b'.':
+                    pass
+                delivered += 1
+                with server.lock:
+                    server.envelopes.append(envelope)
+                reply("250 queued")
+            elif verb in ('NOOP', 'RSET'):
+                reply("250 ok")
+            elif verb == 'QUIT':
+                reply("221 bye")
+                return
+            else:
+                reply("500 unknown command")
+
+
+class FakeSMTPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, drop_after=None):
+        super().__init__(('127.0.0.1', 0), FakeSMTPHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.envelopes = []
+        # 연결마다 이 수만큼 메시지를 받은 뒤 다음 MAIL에서 연결을 끊음
+        self.drop_after = drop_after
+
+
+@pytest.fixture
+def smtp_server():
+    servers = []
+
+    def start(drop_after=None):
+        server = FakeSMTPServer(drop_after)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+PAYLOAD = build_message('sender@example.com', '테스트 보고서', '<p>본문</p>', recipients=['a@example.com'])
+
+
+def send(server, recipients, batch_size):
+    mailer = MailDelivery('127.0.0.1', server.server_address[1], batch_size=batch_size)
+    try:
+        return mailer.send('sender@example.com', 'password', recipients, PAYLOAD, timeout=10)
+    finally:
+        mailer.pool.close()
+
+
+def test_recipients_are_sent_in_batches_over_one_connection(smtp_server):
+    server = smtp_server()
+    recipients = [f"user{i}@example.com" for i in range(7)]
+
+    job = send(server, recipients, batch_size=3)
+
+    assert job['error'] is None
+    assert [len(envelope) for envelope in server.envelopes] == [3, 3, 1]
+    assert [r for envelope in server.envelopes for r in envelope] == recipients
+    assert server.connections == 1
+    assert job['sent'] == 7
+    assert job['delivered'] == recipients
+    assert job['failed'] == {}
+
+
+def test_refused_recipients_are_recorded_per_recipient(smtp_server):
+    server = smtp_server()
+    recipients = ['ok1@example.com', 'bad1@example.com', 'ok2@example.com', 'bad2@example.com', 'bad3@example.com']
+
+    # 마지막 봉투는 모든 수신자가 거부됨 (SMTPRecipientsRefused)
+    job = send(server, recipients, batch_size=2)
+
+    assert job['error'] is None
+    assert set(job['failed']) == {'bad1@example.com', 'bad2@example.com', 'bad3@example.com'}
+    assert all(reason.startswith('550') for reason in job['failed'].values())
+    assert job['sent'] == 2
+    assert job['delivered'] == ['ok1@example.com', 'ok2@example.com']
+
+
+def test_reconnects_after_server_disconnect(smtp_server):
+    server = smtp_server(drop_after=1)
+    recipients = [f"user{i}@example.com" for i in range(5)]
+
+    job = send(server, recipients, batch_size=2)
+
+    assert job['error'] is None
+    assert job['sent'] == 5
+    assert job['delivered'] == recipients
+    # 봉투마다 이전 연결이 끊겨 새로 연결
+    assert len(server.envelopes) == 3
+    assert server.connections == 3
+
+
+def test_finished_jobs_are_evicted(smtp_server, monkeypatch):
+    monkeypatch.setattr(mail_delivery, 'MAX_FINISHED_JOBS', 2)
+    server = smtp_server()
+    mailer = MailDelivery('127.0.0.1', server.server_address[1])
+    try:
+        job_ids = []
+        for i in range(4):
+            job_ids.append(mailer.submit('sender@example.com', 'password', [f"user{i}@example.com"], PAYLOAD))
+            assert mailer.status(job_ids[-1])['done'].wait(10)
+    finally:
+        mailer.pool.close()
+
+    # 새 작업을 넣을 때 오래된 작업부터 버림 (방금 넣은 작업 + 끝난 작업 2개)
+    assert [job_id for job_id in job_ids if mailer.status(job_id) is not None] == job_ids[1:]
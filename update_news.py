@@ -1,6 +1,8 @@
 import requests
 from bs4 import BeautifulSoup
-import pandas as pd
+import news_store
+import dataset_writer
+from data_loader import publish_snapshot
 import time
 import urllib.parse
 from datetime import datetime
@@ -94,11 +96,10 @@ def update_csv_with_real_news():
         # 10개 중에서 랜덤하게 선택하거나 모두 사용
         selected_news = real_news[:10]  # 처음 10개 사용
         
-        # DataFrame 생성
-        df = pd.DataFrame(selected_news)
-        
-        # CSV 파일로 저장
-        df.to_csv('digital_healthcare_news.csv', index=False, encoding='utf-8-sig')
+        # 저장소 교체 후 CSV 내보내기 및 스냅샷 발행
+        dataset_writer.replace_articles(selected_news)
+        news_store.export_csv('digital_healthcare_news.csv')
+        publish_snapshot()
         
         print(f"✅ {len(selected_news)}개의 실제 뉴스 기사로 CSV 파일을 업데이트했습니다!")
         
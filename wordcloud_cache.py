@@ -0,0 +1,125 @@
+import hashlib
+import heapq
+import io
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from dataset_writer import atomic_write_bytes
+
+# 완성된 워드클라우드 PNG를 빈도표 지문(fingerprint)으로 저장하는 위치
+CACHE_DIR = "wordcloud_cache"
+MEMORY_ENTRIES = 16
+DISK_ENTRIES = 64
+
+# 한글 최적화 기본 파라미터
+WORDCLOUD_PARAMS = {
+    'width': 1200,
+    'height': 600,
+    'background_color': 'white',
+    'max_words': 50,  # 키워드 수 줄여서 가독성 향상
+    'colormap': 'tab10',
+    'relative_scaling': 0.5,
+    'min_font_size': 15,  # 최소 폰트 크기 증가
+    'max_font_size': 100,
+    'prefer_horizontal': 0.8,  # 가로 텍스트 더 선호
+    'collocations': False,
+    'random_state': 42,  # 일관된 결과
+}
+
+
+def _font_identity(font_path):
+    """폰트 파일 경로·크기·수정 시각 (폰트가 바뀌면 다른 이미지)"""
+    if not font_path or not os.path.exists(font_path):
+        return None
+    st = os.stat(font_path)
+    return [os.path.abspath(font_path), st.st_size, st.st_mtime_ns]
+
+
+def fingerprint(frequencies, font_path=None, scale=1, params=None):
+    """빈도표·폰트·렌더링 파라미터로 만든 캐시 키"""
+    payload = {
+        'freq': sorted((str(k), int(v)) for k, v in frequencies.items()),
+        'font': _font_identity(font_path),
+        'scale': scale,
+        'params': params or WORDCLOUD_PARAMS,
+    }
+    data = json.dumps(payload, ensure_ascii=False, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+class WordCloudCache:
+    """메모리(LRU) + 디스크 2단 캐시로 워드클라우드 PNG 바이트를 재사용"""
+
+    def __init__(self, cache_dir=CACHE_DIR, memory_entries=MEMORY_ENTRIES, disk_entries=DISK_ENTRIES):
+        self.cache_dir = cache_dir
+        self.memory_entries = memory_entries
+        self.disk_entries = disk_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.png")
+
+    def get_png(self, frequencies, font_path=None, scale=1, params=None):
+        """PNG 바이트 반환 - 같은 빈도표면 레이아웃을 다시 계산하지 않음"""
+        # WordCloud는 상위 max_words개만 그리므로 지문도 그만큼만 계산
+        max_words = (params or WORDCLOUD_PARAMS)['max_words']
+        if len(frequencies) > max_words:
+            frequencies = dict(heapq.nlargest(max_words, frequencies.items(), key=lambda item: item[1]))
+        key = fingerprint(frequencies, font_path, scale, params)
+        with self._lock:
+            png = self._memory.get(key)
+            if png is not None:
+                self._memory.move_to_end(key)
+                return png
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                png = f.read()
+        except FileNotFoundError:
+            png = render_png(frequencies, font_path, scale, params)
+            os.makedirs(self.cache_dir, exist_ok=True)
+            atomic_write_bytes(path, png)
+            self._prune_disk()
+        with self._lock:
+            self._memory[key] = png
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+        return png
+
+    def _prune_disk(self):
+        """오래된 디스크 캐시 파일 정리"""
+        paths = [os.path.join(self.cache_dir, name)
+                 for name in os.listdir(self.cache_dir) if name.endswith('.png')]
+        if len(paths) <= self.disk_entries:
+            return
+        paths.sort(key=lambda p: os.path.getmtime(p), reverse=True)
+        for path in paths[self.disk_entries:]:
+            for stale in (path, f"{path}.lock"):
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+
+
+def render_png(frequencies, font_path=None, scale=1, params=None):
+    """matplotlib을 거치지 않고 WordCloud.to_image()로 PNG 렌더링"""
+    from wordcloud import WordCloud
+
+    wordcloud_params = dict(params or WORDCLOUD_PARAMS, scale=scale)
+    if font_path and os.path.exists(font_path):
+        wordcloud_params['font_path'] = font_path
+    wordcloud = WordCloud(**wordcloud_params).generate_from_frequencies(frequencies)
+    buffer = io.BytesIO()
+    wordcloud.to_image().save(buffer, format='PNG', optimize=True)
+    return buffer.getvalue()
+
+
+_default_cache = WordCloudCache()
+
+
+def get_wordcloud_png(frequencies, font_path=None, scale=1):
+    """기본 캐시에서 워드클라우드 PNG 읽기 (없으면 렌더링 후 저장)"""
+    return _default_cache.get_png(frequencies, font_path, scale)